@@ -1,5 +1,15 @@
 var _completions = {};
 
+// syntaxes resolved for scope names. Content-dependent syntaxes
+// (like CSS inside HTML) are not stored here
+var _syntaxes = {};
+
+pyOnUserDataChange(function() {
+	_completions = {};
+	_syntaxes = {};
+	sublimeUserDataChanged();
+});
+
 // some caching data used during action sessions
 // make sure to call pyResetCache() before each new function call
 var __cache = {};
@@ -15,11 +25,24 @@ var cssResolver = emmet.require('resolver/css.js');
 var abbreviationParser = emmet.require('parser/abbreviation.js');
 var expandAbbreviationAction = emmet.require('action/expandAbbreviation.js');
 var updateTagAction = emmet.require('action/updateTag.js');
+var xmlEditTree = emmet.require('editTree/xml.js');
+var cssEditTree = emmet.require('editTree/css.js');
+
+var file = emmet.require('plugin/file.js');
+var actions = emmet.require('action/main.js');
+
+// snapshot of active view content: buffer is copied from editor
+// only once while it's not modified
+var _contentSnapshot = null;
 
 function activeView() {
 	return sublime.active_window().active_view();
 }
 
+function resetContentSnapshot() {
+	_contentSnapshot = null;
+}
+
 var editorProxy = {
 	getSelectionRange: function() {
 		var view = activeView();
@@ -79,7 +102,22 @@ var editorProxy = {
 
 	getContent: function() {
 		var view = activeView();
-		return view.substr(new sublime.Region(0, view.size()));
+		if (!('change_count' in view)) {
+			return view.substr(new sublime.Region(0, view.size()));
+		}
+
+		var id = view.id();
+		var changeCount = view.change_count();
+		var s = _contentSnapshot;
+		if (!s || s.id !== id || s.changeCount !== changeCount) {
+			s = _contentSnapshot = {
+				id: id,
+				changeCount: changeCount,
+				content: view.substr(new sublime.Region(0, view.size()))
+			};
+		}
+
+		return s.content;
 	},
 
 	getSyntax: function() {
@@ -130,6 +168,36 @@ var editorProxy = {
 	}
 };
 
+/**
+ * Runs given action for each range in `ranges` list, from the
+ * last one to the first one. Resulting selections are saved
+ * with `sublimeSaveSelection()`
+ * @param  {String} name   Action name
+ * @param  {Array} ranges List of `[start, end]` ranges
+ * @return {Boolean}
+ */
+function pyRunActionBatch(name, ranges) {
+	var view = activeView();
+	var result = false;
+	ranges = _toArray(ranges);
+
+	if (name == 'update_image_size' && ranges.length > 1) {
+		prefetchImageSizes(ranges);
+	}
+
+	for (var i = ranges.length - 1, r; i >= 0; i--) {
+		r = _toArray(ranges[i]);
+		view.sel().clear();
+		view.sel().add(new sublime.Region(r[0], r[1]));
+		result = pyRunAction(name) || result;
+		sublimeSaveSelection(i);
+	}
+
+	// do not hold buffer copy after action
+	resetContentSnapshot();
+	return result;
+}
+
 function pyPreprocessText(value) {
 	var base = 1000;
 	var zeroBase = 0;
@@ -262,6 +330,305 @@ function pyUpdateAsYouType(abbr, options) {
 	// }
 }
 
+// initial size of content window for HTML matcher
+var HTML_MATCHER_WINDOW = 4096;
+
+/**
+ * Shifts all ranges of HTML matcher result by given delta and
+ * binds result to given content
+ */
+function shiftMatch(match, delta, content) {
+	var ranges = [match.open.range, match.innerRange, match.outerRange];
+	if (match.close) {
+		ranges.push(match.close.range);
+	}
+
+	ranges.forEach(function(r, i) {
+		// inner and outer ranges may refer to the same object
+		if (ranges.indexOf(r) === i) {
+			r.shift(delta);
+		}
+	});
+
+	match.source = content;
+	match.innerContent = function() {
+		return this.innerRange.substring(content);
+	};
+	match.outerContent = function() {
+		return this.outerRange.substring(content);
+	};
+	match.content = function() {
+		return this.range.substring(content);
+	};
+	return match;
+}
+
+/**
+ * Check if given text is a content of active view
+ */
+function isActiveContent(text) {
+	var s = _contentSnapshot;
+	if (!s || s.content !== text) {
+		return false;
+	}
+
+	var view = activeView();
+	return s.id === view.id() && s.changeCount === view.change_count();
+}
+
+/**
+ * Finds tag pair in tag index of active view and returns it in the
+ * same format as `htmlMatcher.find()` does. Returns `null` if there's
+ * no tag pair or `undefined` if index can't be used
+ * @param {String} text
+ * @param {Number} pos
+ */
+function indexedFind(text, pos) {
+	if (!isActiveContent(text)) {
+		return;
+	}
+
+	var t = sublimeFindTag(pos);
+	if (!t) {
+		return;
+	}
+
+	if (!t.length) {
+		return null;
+	}
+
+	var open = {
+		name: t[0],
+		selfClose: text.charAt(t[2] - 2) == '/',
+		range: range.create2(t[1], t[2]),
+		type: 'open'
+	};
+	var close = null;
+	var outerRange, innerRange;
+
+	if (t[3] != -1) {
+		close = {
+			name: t[0],
+			range: range.create2(t[3], t[4]),
+			type: 'close'
+		};
+		outerRange = range.create2(t[1], t[4]);
+		innerRange = range.create2(t[2], t[3]);
+	} else {
+		outerRange = innerRange = range.create2(t[1], t[2]);
+	}
+
+	return {
+		open: open,
+		close: close,
+		type: 'tag',
+		innerRange: innerRange,
+		innerContent: function() {
+			return this.innerRange.substring(text);
+		},
+		outerRange: outerRange,
+		outerContent: function() {
+			return this.outerRange.substring(text);
+		},
+		range: !innerRange.length() || !innerRange.cmp(pos, 'lte', 'gte') ? outerRange : innerRange,
+		content: function() {
+			return this.range.substring(text);
+		},
+		source: text
+	};
+}
+
+// Update Image Size action requires image size only:
+// it's detected by Python probe, which reads image header only.
+// If probe fails, read just first bytes of image and read the whole
+// file only if there's no image size in them
+var IMAGE_HEADER_SIZE = 64 * 1024;
+
+function readImageHeader(read) {
+	return function(path) {
+		var callback = arguments[arguments.length - 1];
+		read.call(file, path, IMAGE_HEADER_SIZE, function(err, content) {
+			if (err || content.length < IMAGE_HEADER_SIZE || actionUtils.getImageSize(content)) {
+				return callback(err, content);
+			}
+
+			read.call(file, path, callback);
+		});
+	};
+}
+
+/**
+ * Returns minimal PNG header with given image size, 
+ * which can be parsed by `actionUtils.getImageSize()`
+ */
+function imageSizeHeader(width, height) {
+	var int32 = function(n) {
+		return String.fromCharCode((n >>> 24) & 0xff, (n >>> 16) & 0xff, (n >>> 8) & 0xff, n & 0xff);
+	};
+	return '\x89PNG\r\n\x1a\n' + int32(13) + 'IHDR' + int32(width) + int32(height);
+}
+
+/**
+ * Returns image source used by Update Image Size action
+ * for given caret position
+ */
+function imageSourceAt(info, pos) {
+	if (actionUtils.isSupportedCSS(info.syntax)) {
+		var rule = cssEditTree.parseFromPosition(info.content, pos, true);
+		var prop = rule && rule.itemFromPosition(pos, true);
+		var m = prop && /url\((["']?)(.+?)\1\)/i.exec(prop.value() || '');
+		return m ? m[2] : null;
+	}
+
+	var elem = xmlEditTree.parseFromPosition(info.content, pos, true);
+	if (elem && (elem.name() || '').toLowerCase() == 'img') {
+		return elem.value('src');
+	}
+
+	return null;
+}
+
+/**
+ * Detects sizes of images for all given ranges at once:
+ * remote images are fetched concurrently
+ */
+function prefetchImageSizes(ranges) {
+	try {
+		var info = editorUtils.outputInfo(editorProxy);
+		var filePath = editorProxy.getFilePath();
+		var paths = [];
+		for (var i = 0; i < ranges.length; i++) {
+			var src = imageSourceAt(info, _toArray(ranges[i])[0]);
+			var path = src && !/^data:/.test(src) ? file.locateFile(filePath, src) : null;
+			if (path) {
+				paths.push(path);
+			}
+		}
+
+		pyFile.prefetch_image_sizes(JSON.stringify(paths));
+	} catch (e) {}
+}
+
+function readImageSize(read) {
+	var readHeader = readImageHeader(read);
+	return function(path) {
+		var callback = arguments[arguments.length - 1];
+		var size = null;
+		try {
+			size = pyFile.image_size(path);
+		} catch (e) {}
+
+		if (size) {
+			return callback(null, imageSizeHeader(size[0], size[1]));
+		}
+
+		readHeader.apply(this, arguments);
+	};
+}
+
+(function() {
+	var action = actions.get('update_image_size');
+	actions.add('update_image_size', function() {
+		var read = file.read;
+		file.read = readImageSize(read);
+		try {
+			return action.fn.apply(this, arguments);
+		} finally {
+			file.read = read;
+		}
+	}, action.options);
+})();
+
+// Emmet actions like Balance, Go To Matching Pair and Remove Tag
+// use HTML matcher directly: make them use tag index as well
+var _htmlMatcherFind = htmlMatcher.find;
+htmlMatcher.find = function(text, pos) {
+	var match = indexedFind(text, pos);
+	return match !== undefined ? match : _htmlMatcherFind.call(this, text, pos);
+};
+
+/**
+ * Check if given matcher result doesn't depend on content after
+ * window end: unclosed tag or comment may be closed outside of window
+ */
+function isCompleteMatch(match) {
+	if (match.type == 'comment') {
+		return /-->$/.test(match.outerContent());
+	}
+
+	return !!match.close || match.open.selfClose;
+}
+
+/**
+ * Returns offset in given window of content where comment, opened
+ * before window start, ends (or 0 if window doesn't start inside
+ * comment). Matcher fed with window content from the middle of comment
+ * will treat commented out tags as real ones
+ * @param {String} text
+ * @returns {Number}
+ */
+function commentSafeStart(text) {
+	var close = text.indexOf('-->');
+	if (close == -1) {
+		return 0;
+	}
+
+	var open = text.indexOf('<!--');
+	return open != -1 && open < close ? 0 : close + 3;
+}
+
+/**
+ * Windowed version of `htmlMatcher.find()`: feeds matcher with 
+ * bounded region of content around given position first and expands
+ * it geometrically only if no pair was found. Maximum window size
+ * is limited by `html_matcher_max_window` option (0 means the whole
+ * document)
+ * @param {String} content
+ * @param {Number} pos
+ * @param {Boolean} tagOnly Match tags only (like `htmlMatcher.tag()`)
+ */
+function findPair(content, pos, tagOnly) {
+	var match = indexedFind(content, pos);
+	if (match !== undefined) {
+		return match;
+	}
+
+	var method = tagOnly ? 'tag' : 'find';
+	var maxWindow = sublimeGetOption('html_matcher_max_window', 0) || content.length;
+	var size = Math.min(HTML_MATCHER_WINDOW, maxWindow);
+	var lastMatch = null;
+
+	while (true) {
+		var start = Math.max(0, Math.min(pos - Math.floor(size / 2), content.length - size));
+		var end = Math.min(content.length, start + size);
+		if (!start && end == content.length) {
+			return htmlMatcher[method](content, pos);
+		}
+
+		var text = content.substring(start, end);
+		var safeStart = commentSafeStart(text);
+		if (safeStart <= pos - start) {
+			// window may start inside comment: feed matcher with
+			// content after comment end only
+			match = htmlMatcher[method](text.substring(safeStart), pos - start - safeStart);
+			if (match) {
+				lastMatch = shiftMatch(match, start + safeStart, content);
+				if (isCompleteMatch(match)) {
+					return lastMatch;
+				}
+			}
+		}
+
+		if (size >= maxWindow) {
+			// window limit is reached: unclosed or void tag
+			// (like `<br>`) is the best match we can get
+			return lastMatch;
+		}
+
+		size = Math.min(size * 2, maxWindow);
+	}
+}
+
 function pyCaptureWrappingRange() {
 	var info = editorUtils.outputInfo(editorProxy);
 	var range = editorProxy.getSelectionRange();
@@ -270,7 +637,7 @@ function pyCaptureWrappingRange() {
 	
 	if (startOffset == endOffset) {
 		// no selection, find tag pair
-		var match = htmlMatcher.find(info.content, startOffset);
+		var match = findPair(info.content, startOffset);
 		if (!match) {
 			// nothing to wrap
 			return null;
@@ -290,7 +657,7 @@ function pyGetTagNameRanges(pos) {
 		
 	// search for tag
 	try {
-		var tag = htmlMatcher.tag(info.content, pos);
+		var tag = findPair(info.content, pos, true);
 		if (tag) {
 			var open = tag.open.range;
 			var tagName = /^<([\w\-\:]+)/i.exec(open.substring(info.content))[1];
@@ -311,7 +678,7 @@ function pyGetTagRanges() {
 		
 	// search for tag
 	try {
-		var tag = htmlMatcher.tag(info.content, editorProxy.getCaretPos());
+		var tag = findPair(info.content, editorProxy.getCaretPos(), true);
 		if (tag) {
 			ranges.push(tag.open.range.toArray());
 			if (tag.close) {
@@ -331,6 +698,23 @@ function pyHasSnippet(name) {
 	return !!resources.findSnippet(editorProxy.getSyntax(), name);
 }
 
+/**
+ * Returns data required to decide if abbreviation should be expanded 
+ * by Tab key: current syntax, abbreviation and whether it's a known snippet.
+ * Collected with a single call to save Python/JS roundtrips
+ * @param {String} syntax Current syntax, if already known
+ * @return {Object}
+ */
+function pyTabDecision(syntax) {
+	syntax = syntax || pyGetSyntax();
+	var abbr = pyExtractAbbreviation();
+	return {
+		syntax: syntax,
+		abbreviation: abbr,
+		hasSnippet: !!abbr && !!resources.findSnippet(syntax, abbr)
+	};
+}
+
 /**
  * Get all available CSS completions. This method is optimized for CSS
  * only since it should contain snippets only so it's not required
@@ -359,14 +743,25 @@ function pyGetCSSCompletions(dialect) {
 }
 
 /**
- * Returns current syntax name
+ * Returns CSS completions for given dialect as JSON string of 
+ * `[trigger, contents]` pairs, ready to be used by Sublime Text.
+ * A string is returned to avoid slow conversion of JS objects 
+ * on Python side
+ * @param {String} dialect
  * @return {String}
  */
-function pyGetSyntax() {
-	var view = activeView();
-	var pt = view.sel()[0].begin();
-	var scope = 'scope_name' in view ? view.scope_name(pt) : view.syntax_name(pt);
+function pyExportCSSCompletions(dialect) {
+	return JSON.stringify(pyGetCSSCompletions(dialect).map(function(p) {
+		return [p.k + '\t' + p.label, p.v];
+	}));
+}
 
+/**
+ * Returns syntax hint for given scope name
+ * @param {String} scope
+ * @return {String}
+ */
+function syntaxForScope(scope) {
 	if (~scope.indexOf('xsl')) {
 		return 'xsl';
 	}
@@ -391,7 +786,40 @@ function pyGetSyntax() {
 		syntax = RegExp.$1;
 	}
 
-	return actionUtils.detectSyntax(editorProxy, syntax);
+	return syntax;
+}
+
+/**
+ * Returns current syntax name
+ * @return {String}
+ */
+function pyGetSyntax() {
+	var view = activeView();
+	var pt = view.sel()[0].begin();
+	var scope = 'scope_name' in view ? view.scope_name(pt) : view.syntax_name(pt);
+
+	if (scope in _syntaxes) {
+		return _syntaxes[scope];
+	}
+
+	var syntax = syntaxForScope(scope);
+	if (syntax == 'xsl' || syntax == 'jsx') {
+		return cacheSyntax(scope, syntax);
+	}
+
+	if (syntax == 'html' || !resources.hasSyntax(syntax)) {
+		// HTML syntax may contain inline CSS, 
+		// final syntax depends on content
+		return actionUtils.detectSyntax(editorProxy, syntax);
+	}
+
+	return cacheSyntax(scope, actionUtils.detectSyntax(editorProxy, syntax));
+}
+
+function cacheSyntax(scope, syntax) {
+	_syntaxes[scope] = syntax;
+	sublimeCacheSyntax(scope, syntax);
+	return syntax;
 }
 
 function pyDetectProfile(syntax) {
@@ -400,4 +828,5 @@ function pyDetectProfile(syntax) {
 
 function pyResetCache() {
 	__cache = {};
+	resetContentSnapshot();
 }
\ No newline at end of file
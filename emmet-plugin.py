@@ -26,6 +26,7 @@ import emmet_completions as cmpl
 from emmet_completions.meta import HTML_ELEMENTS_ATTRIBUTES, HTML_ATTRIBUTES_VALUES
 from emmet.context import Context
 from emmet.context import js_file_reader as _js_file_reader
+from emmet.tagindex import TagIndex, TagIndexCache
 from emmet.pyv8loader import LoaderDelegate
 
 __version__      = '1.2'
@@ -43,6 +44,9 @@ settings = None
 # Default ST settings
 user_settings = None
 
+# Structures derived from Emmet settings
+compiled_settings = None
+
 def is_st3():
 	return sublime.version()[0] == '3'
 
@@ -61,12 +65,21 @@ def js_file_reader(file_path, use_unicode=True):
 
 	return _js_file_reader(file_path, use_unicode)
 
+def get_cache_path():
+	"Returns path where Emmet can store its cache files"
+	if hasattr(sublime, 'cache_path'):
+		return os.path.join(sublime.cache_path(), 'Emmet')
+
+	return None
+
 def init():
 	"Init Emmet plugin"
 	# load settings
 	globals()['user_settings'] = sublime.load_settings('Preferences.sublime-settings')
 	globals()['settings'] = sublime.load_settings('Emmet.sublime-settings')
 	settings.add_on_change('extensions_path', update_settings)
+	globals()['compiled_settings'] = CompiledSettings(settings)
+	settings.add_on_change('compiled_settings', compiled_settings.refresh)
 
 	# setup environment for PyV8 loading
 	pyv8_paths = [
@@ -85,7 +98,11 @@ def init():
 	contrib = {
 		'sublime': sublime, 
 		'sublimeReplaceSubstring': replace_substring,
-		'sublimeGetOption': settings.get
+		'sublimeGetOption': settings.get,
+		'sublimeSaveSelection': save_active_selection,
+		'sublimeFindTag': find_tag,
+		'sublimeCacheSyntax': cache_syntax,
+		'sublimeUserDataChanged': reset_user_data_caches
 	}
 
 	# create JS environment
@@ -95,7 +112,8 @@ def init():
 		ext_path=get_extensions_path(), 
 		contrib=contrib, 
 		logger=delegate.log,
-		reader=js_file_reader
+		reader=js_file_reader,
+		cache_path=get_cache_path()
 	)
 
 	update_settings()
@@ -145,6 +163,19 @@ class SublimeLoaderDelegate(LoaderDelegate):
 		if kwargs['progress'].is_background:
 			return
 
+		phase = kwargs.get('phase')
+		if phase in ('binary', 'unpack'):
+			message = phase == 'unpack' and 'Unpacking PyV8 binary' or self.message
+			received = kwargs.get('received', 0)
+			total = kwargs.get('total')
+			if total:
+				msg = '%s: %s of %s (%d%%)' % (message, format_size(received), format_size(total), received * 100 // total)
+			else:
+				msg = '%s: %s' % (message, format_size(received))
+
+			sublime.set_timeout(lambda: sublime.status_message(msg), 0)
+			return
+
 		before = self.i % self.size
 		after = (self.size - 1) - before
 		msg = '%s [%s=%s]' % (self.message, ' ' * before, ' ' * after)
@@ -175,6 +206,13 @@ class SublimeLoaderDelegate(LoaderDelegate):
 	def log(self, message):
 		print('Emmet: %s' % message)
 
+def format_size(size):
+	"Returns human-readable size in bytes"
+	if size < 1024 * 1024:
+		return '%d KB' % (size // 1024)
+
+	return '%.1f MB' % (size / (1024.0 * 1024))
+
 def show_pyv8_error(exit_code):
 	if 'PyV8' not in sys.modules:
 		sublime.error_message('Error while loading PyV8 binary: exit code %s \nTry to manually install PyV8 from\nhttps://github.com/emmetio/pyv8-binaries' % exit_code)
@@ -184,6 +222,12 @@ def active_view():
 
 def check_context(verbose=False):
 	"Checks if JS context is completely available"
+	if ctx.is_warming():
+		# do not block UI thread while context is being created
+		if verbose:
+			sublime.status_message('Emmet is initializing, please wait')
+		return False
+
 	if not ctx.js():
 		if verbose:
 			sublime.message_dialog('Please wait a bit while PyV8 binary is being downloaded')
@@ -233,8 +277,108 @@ def get_line_padding(line):
 	m = re.match(r'^(\s+)', line)
 	return m and m.group(0) or ''
 
-def update_settings():
-	ctx.set_ext_path(get_extensions_path())
+# tag pair indexes of buffers
+tag_indexes = TagIndexCache()
+# text change listeners which keep tag indexes up-to-date
+tag_index_listeners = {}
+# buffers which tag indexes are being built in background
+tag_index_builds = set()
+
+if hasattr(sublime_plugin, 'TextChangeListener'):
+	class TagIndexListener(sublime_plugin.TextChangeListener):
+		"Updates tag index of buffer with text changes"
+		def on_text_changed(self, changes):
+			view = self.buffer.primary_view()
+			tag_indexes.edit(self.buffer.id(), view.change_count(), view.size(),
+				[(c.a.pt, c.b.pt, c.str) for c in changes])
+else:
+	# incremental updates are not available, index is rebuilt
+	# when buffer is modified
+	TagIndexListener = None
+
+def view_tag_index(view):
+	"""
+	Returns up-to-date tag pair index of given view or `None` if
+	index can't be used: ST2 doesn't provide buffer change count.
+	Outdated index is rebuilt in background, so large buffers
+	aren't copied and parsed right in action call
+	"""
+	if not hasattr(view, 'change_count'):
+		return None
+
+	key = view.buffer_id()
+	if TagIndexListener and key not in tag_index_listeners:
+		listener = tag_index_listeners[key] = TagIndexListener()
+		listener.attach(view.buffer())
+
+	index = tag_indexes.get(key, view.change_count())
+	if index is None and key not in tag_index_builds:
+		tag_index_builds.add(key)
+		sublime.set_timeout_async(lambda: build_tag_index(view, key), 0)
+
+	return index
+
+def build_tag_index(view, key):
+	"""
+	Builds tag index of given view. Index is parsed in async thread
+	and stored in main thread, where text change listener updates it,
+	only if buffer wasn't modified meanwhile
+	"""
+	if not view.is_valid():
+		tag_index_builds.discard(key)
+		return
+
+	stamp = view.change_count()
+	index = TagIndex(view.substr(sublime.Region(0, view.size())))
+
+	def store():
+		tag_index_builds.discard(key)
+		if view.is_valid() and view.change_count() == stamp:
+			tag_indexes.put(key, stamp, index)
+
+	sublime.set_timeout(store, 0)
+
+def drop_tag_index(view):
+	key = view.buffer_id()
+	tag_indexes.drop(key)
+	listener = tag_index_listeners.pop(key, None)
+	if listener and listener.is_attached():
+		listener.detach()
+
+def view_tag(view, pos):
+	"""
+	Returns tag pair for given position of view as `(name, open, close)`
+	tuple or `False` if there's no tag. Returns `None` if tag index can't
+	be used for given position: HTML matcher should be used instead
+	"""
+	index = view_tag_index(view)
+	if index is None or index.in_comment(pos):
+		return None
+
+	return index.tag(pos) or False
+
+def find_tag(pos):
+	"""
+	JS version of `view_tag()` for active view: tag is returned as
+	`[name, open_start, open_end, close_start, close_end]` list
+	(close offsets are -1 for unclosed tags) or empty list if
+	there's no tag
+	"""
+	tag = view_tag(active_view(), pos)
+	if not tag:
+		return [] if tag is False else None
+
+	name, open_tag, close_tag = tag
+	close_tag = close_tag or (-1, -1)
+	return [name, open_tag[0], open_tag[1], close_tag[0], close_tag[1]]
+
+def update_settings(full_reset=False):
+	"""
+	Pushes Emmet settings into JS context. Unless `full_reset`
+	is requested or extensions path was changed, only changed
+	user data sections are reloaded in existing context
+	"""
+	ext_changed = ctx.set_ext_path(get_extensions_path())
 
 	keys = ['snippets', 'preferences', 'syntaxProfiles', 'profiles']
 	payload = {}
@@ -243,9 +387,15 @@ def update_settings():
 		if data:
 			payload[k] = data
 
-	ctx.reset()
-	ctx.load_user_data(json.dumps(payload))
-	ctx.js()
+	if full_reset and not ext_changed:
+		ctx.reset()
+
+	ctx.update_user_data(payload)
+
+	if settings.get('eager_context_warmup', False):
+		ctx.warm_up()
+	elif not ctx.is_warming():
+		ctx.js()
 
 def get_scope(view, pt=-1):
 	if pt == -1:
@@ -257,6 +407,61 @@ def get_scope(view, pt=-1):
 
 	return view.syntax_name(pt)
 
+# mirror of JS syntax cache: syntaxes resolved for scope names
+syntax_cache = {}
+
+def cache_syntax(scope, syntax):
+	"Stores syntax, resolved by JS context for given scope"
+	syntax_cache[scope] = str(syntax)
+
+# CSS completions for each dialect as `(trigger, contents)` tuples
+css_completions = {}
+
+def reset_user_data_caches():
+	"Drops data derived from Emmet user data, like snippets"
+	syntax_cache.clear()
+	css_completions.clear()
+
+def cached_syntax(view):
+	"""
+	Returns syntax for current scope of given view, if it was already
+	resolved by JS context, or `None` otherwise
+	"""
+	return syntax_cache.get(get_scope(view))
+
+# abbreviations that may be a snippet or tag name
+re_simple_abbr = re.compile(r'^[\w\-\:%]+$')
+re_lorem = re.compile(r'^(lorem|lipsum)([a-z]{2})?\d*$', re.I)
+
+class CompiledSettings():
+	"""
+	Structures derived from Emmet settings, used by Tab key handler
+	and key context queries. They are built once and refreshed
+	when settings are changed
+	"""
+	def __init__(self, settings):
+		self.settings = settings
+		self.refresh()
+
+	def refresh(self):
+		s = self.settings
+		self.disabled_single_snippets = frozenset(s.get('disabled_single_snippets', '').split())
+		self.disabled_single_snippet_for_scopes = s.get('disabled_single_snippet_for_scopes', None)
+		self.known_html_tags = frozenset(s.get('known_html_tags', '').split())
+		self.disable_tab_abbreviations_for_scopes = s.get('disable_tab_abbreviations_for_scopes', '')
+
+		disabled_actions = s.get('disabled_keymap_actions', '') or ''
+		self.all_actions_disabled = disabled_actions == 'all'
+		self.disabled_actions = frozenset(re.split(r'\s*,\s*', disabled_actions.strip())) if disabled_actions else frozenset()
+
+		self.disable_tab_abbreviations_for_regexp = None
+		banned_regexp = s.get('disable_tab_abbreviations_for_regexp', None)
+		if banned_regexp:
+			try:
+				self.disable_tab_abbreviations_for_regexp = re.compile(banned_regexp)
+			except re.error as e:
+				print('Emmet: invalid "disable_tab_abbreviations_for_regexp" setting: %s' % e)
+
 def should_perform_action(name, view=None):
 	if not view:
 		view = active_view()
@@ -265,53 +470,46 @@ def should_perform_action(name, view=None):
 	if not view.settings().get('enable_emmet_keymap', True):
 		return False
 
-	disabled_actions = settings.get('disabled_keymap_actions', '')
-
-	if not disabled_actions: # no disabled actions
-		return True
-
-	if disabled_actions == 'all': # disable all actions
+	if compiled_settings.all_actions_disabled: # disable all actions
 		return False
 
-	return name not in re.split(r'\s*,\s*', disabled_actions.strip())
+	return name not in compiled_settings.disabled_actions
 
-def should_handle_tab_key(syntax=None):
+def should_handle_tab_key(decision):
+	"""
+	Check if abbreviation should be expanded by Tab key.
+	`decision` is a result of `pyTabDecision()` JS call
+	"""
 	view = active_view()
-	scopes = settings.get('disabled_single_snippet_for_scopes', None)
+	scopes = compiled_settings.disabled_single_snippet_for_scopes
 	cur_scope = get_scope(view)
 
 
 	if sublime.score_selector(cur_scope, 'source.css'):
 		return True
 
-	with ctx.js() as c:
-		abbr = c.locals.pyExtractAbbreviation()
+	abbr = decision['abbreviation']
 
-		disabled_snippets = settings.get('disabled_single_snippets', '').split()
-		if disabled_snippets and abbr in disabled_snippets:
-			return False
-
-		if not re.match(r'^[\w\-\:%]+$', abbr):
-			# it's a complex expression
-			return True
+	if abbr in compiled_settings.disabled_single_snippets:
+		return False
 
-		if re.match(r'^(lorem|lipsum)([a-z]{2})?\d*$', abbr, re.I):
-			# hardcoded Lorem Ipsum generator
-			return True
+	if not re_simple_abbr.match(abbr):
+		# it's a complex expression
+		return True
 
-		# detect inline CSS
-		if syntax is None:
-			syntax = c.locals.pyGetSyntax();
+	if re_lorem.match(abbr):
+		# hardcoded Lorem Ipsum generator
+		return True
 
-		if syntax == 'css':
-			return True
+	# detect inline CSS
+	if decision['syntax'] == 'css':
+		return True
 
-		known_tags = settings.get('known_html_tags', '').split()
-		if abbr in known_tags or c.locals.pyHasSnippet(abbr):
-			return True
+	if abbr in compiled_settings.known_html_tags or decision['hasSnippet']:
+		return True
 
-		if not scopes or not sublime.score_selector(cur_scope, scopes):
-			return True
+	if not scopes or not sublime.score_selector(cur_scope, scopes):
+		return True
 
 	return False
 
@@ -319,15 +517,9 @@ def log(message):
 	if settings.get('debug', False):
 		print('Emmet: %s' % message)
 
-def action_factory(name):
-	def _action(i, sel):
-			with ctx.js() as c:
-				return c.locals.pyRunAction(name)
-	return _action
-
 class RunEmmetAction(sublime_plugin.TextCommand):
 	def run(self, edit, action=None, **kw):
-		run_action(action_factory(action))
+		run_batch_action(action)
 
 class ActionContextHandler(sublime_plugin.EventListener):
 	def on_query_context(self, view, key, op, operand, match_all):
@@ -352,6 +544,28 @@ def get_edit(view, edit_token=None):
 
 	return edit
 
+SELECTION_KEY = '__emmet_sel_%d'
+
+def save_selection(view, ix):
+	"Saves current selection of view as regions, tracked by editor"
+	view.add_regions(SELECTION_KEY % ix, list(view.sel()), '')
+
+def save_active_selection(ix):
+	save_selection(active_view(), int(ix))
+
+def restore_selections(view, count):
+	"Outputs selections, saved with `save_selection()`, as view selection"
+	view.sel().clear()
+	for ix in range(count):
+		key = SELECTION_KEY % ix
+		for sel in view.get_regions(key):
+			view.sel().add(sel)
+		view.erase_regions(key)
+
+def clear_selections(view, count):
+	for ix in range(count):
+		view.erase_regions(SELECTION_KEY % ix)
+
 def run_action(action, view=None):
 	if not check_context(True):
 		return
@@ -360,7 +574,6 @@ def run_action(action, view=None):
 	if not view:
 		view = active_view()
 
-	region_key = '__emmet__'
 	sels = list(view.sel())
 	result = False
 
@@ -376,25 +589,53 @@ def run_action(action, view=None):
 			result = action(max_sel_ix - i, sel) or result
 
 			# remember resulting selections
-			view.add_regions(region_key,
-					(view.get_regions(region_key) + list(view.sel())) , '')
+			save_selection(view, i)
 	except Exception as e:
-		view.erase_regions(region_key)
+		clear_selections(view, len(sels))
 		print(traceback.format_exc())
 		return
-	
 
 	# output all saved regions as selection
-	view.sel().clear()
-	for sel in view.get_regions(region_key):
-		view.sel().add(sel)
-
-	view.erase_regions(region_key)
+	restore_selections(view, len(sels))
 
 	# if edit:
 		# view.end_edit(edit)
 	return result
 
+def run_batch_action(name, view=None):
+	"""
+	Runs Emmet action with given name for all selections
+	with a single JS call
+	"""
+	if not check_context(True):
+		return
+
+	if not view:
+		view = active_view()
+
+	sels = [[s.a, s.b] for s in view.sel()]
+
+	try:
+		with ctx.js() as c:
+			result = c.locals.pyRunActionBatch(name, sels)
+	except Exception as e:
+		clear_selections(view, len(sels))
+		print(traceback.format_exc())
+		return
+
+	restore_selections(view, len(sels))
+	return result
+
+# prefix indexes of pre-formatted attribute and attribute value completions
+attributes_index = cmpl.CompletionIndex(HTML_ELEMENTS_ATTRIBUTES,
+	lambda v: (v, '%s\t@%s' % (v,v), '%s="$1"' % v))
+attribute_values_index = cmpl.CompletionIndex(HTML_ATTRIBUTES_VALUES,
+	lambda v: (v, '%s\t@=%s' % (v,v), v))
+
+# completions are requested on nearly every keystroke; they depend
+# on tag or attribute name and typed prefix only, so cache survives edits
+completions_cache = cmpl.LRUCache(64)
+
 class TabAndCompletionsHandler():
 	def correct_syntax(self, view, syntax='html'):
 		return syntax == 'html' and view.match_selector( view.sel()[0].b, cmpl.EMMET_SCOPE )
@@ -424,22 +665,72 @@ class TabAndCompletionsHandler():
 
 	def html_elements_attributes(self, view, prefix, pos):
 		tag         = cmpl.find_tag_name(view, pos)
-		values      = HTML_ELEMENTS_ATTRIBUTES.get(tag, [])
-		return [(v,   '%s\t@%s' % (v,v), '%s="$1"' % v) for v in values]
+		return self.cached_completions(attributes_index, tag,
+			self.lookup_prefix(view, prefix, pos))
 
 	def html_attributes_values(self, view, prefix, pos):
 		attr        = cmpl.find_attribute_name(view, pos)
-		values      = HTML_ATTRIBUTES_VALUES.get(attr, [])
-		return [(v, '%s\t@=%s' % (v,v), v) for v in values]
+		return self.cached_completions(attribute_values_index, attr,
+			self.lookup_prefix(view, prefix, pos, r'[\s"\'=<>]'))
+
+	def lookup_prefix(self, view, prefix, pos, *stop):
+		"""
+		Returns prefix for completions lookup. Sublime's prefix is cut at
+		word separators, so values like `http-equiv` or `text/javascript`
+		are looked up by the whole typed text. If prefix doesn't match
+		typed text, all completions are returned
+		"""
+		typed = cmpl.find_typed_prefix(view, pos, *stop)
+		return typed if typed.endswith(prefix) else ''
+
+	def cached_completions(self, index, name, prefix):
+		"Returns completions of `name` from given index, filtered by prefix"
+		key = (id(index), name, prefix)
+
+		completions = completions_cache.get(key)
+		if completions is None:
+			completions = index.complete(name, prefix)
+			completions_cache.set(key, completions)
+
+		return completions
+
+	def css_completions(self, view):
+		"""
+		Returns CSS completions for syntax of given view. Completions
+		are exported from JS context once per dialect
+		"""
+		dialect = cached_syntax(view)
+		if dialect in css_completions:
+			return css_completions[dialect]
 
-	def expand_by_tab(self, view):
 		if not check_context():
-			return False;
-			
+			return None
+
 		with ctx.js() as c:
-			syntax = str(c.locals.pyGetSyntax());
-		
-		if not should_handle_tab_key(syntax):
+			dialect = dialect or str(c.locals.pyGetSyntax())
+			if dialect not in css_completions:
+				data = json.loads(c.locals.pyExportCSSCompletions(dialect))
+				css_completions[dialect] = [tuple(item) for item in data]
+
+		return css_completions[dialect]
+
+	def expand_by_tab(self, view):
+		# context is already checked by `is_abbreviation` key context
+		# query, don't check it again: get it right away unless
+		# it's being created in background
+		js = not ctx.is_warming() and ctx.js()
+		if not js:
+			return False
+
+		# make decision and expand abbreviation within
+		# a single context session
+		with js as c:
+			decision = c.locals.pyTabDecision(cached_syntax(view))
+			return self._expand_by_tab(view, decision)
+
+	def _expand_by_tab(self, view, decision):
+		syntax = str(decision['syntax'])
+		if not should_handle_tab_key(decision):
 			return False
 
 		# we need to filter out attribute completions if 
@@ -453,17 +744,17 @@ class TabAndCompletionsHandler():
 		cur_scope = get_scope(view)
 
 		# let's see if Tab key expander should be disabled for current scope
-		banned_scopes = settings.get('disable_tab_abbreviations_for_scopes', '')
+		banned_scopes = compiled_settings.disable_tab_abbreviations_for_scopes
 		if banned_scopes and view.score_selector(caret_pos, banned_scopes):
 			return None
 
 		# Sometimes ST2 matcher may incorrectly filter scope context,
 		# check it against special regexp
-		banned_regexp = settings.get('disable_tab_abbreviations_for_regexp', None)
-		if banned_regexp and re.search(banned_regexp, cur_scope):
+		banned_regexp = compiled_settings.disable_tab_abbreviations_for_regexp
+		if banned_regexp and banned_regexp.search(cur_scope):
 			return None
 		
-		return run_action(action_factory('expand_abbreviation'))
+		return run_batch_action('expand_abbreviation')
 		# view.run_command('run_emmet_action',
 		# 						{'action':'expand_abbreviation'})
 
@@ -496,13 +787,9 @@ class TabExpandHandler(sublime_plugin.EventListener):
 	def on_query_completions(self, view, prefix, locations):
 		h = TabAndCompletionsHandler()
 		if view.match_selector(locations[0], settings.get('css_completions_scope', '')) and check_context():
-			l = []
+			l = None
 			if settings.get('show_css_completions', False):
-				with ctx.js() as c:
-					completions = c.locals.pyGetCSSCompletions()
-					if completions:
-						for p in completions:
-							l.append(('%s\t%s' % (p['k'], p['label']), p['v']))
+				l = h.css_completions(view)
 
 			if not l:
 				return []
@@ -515,11 +802,9 @@ class TabExpandHandler(sublime_plugin.EventListener):
 		handler = h.completion_handler(view)
 		if handler:
 			pos = view.sel()[0].b
-			completions = handler(view, prefix, pos)
-			return completions
+			return handler(view, prefix, pos)
 
 		return []
-		
 
 class CommandsAsYouTypeBase(sublime_plugin.TextCommand):
 	input_message         = "Enter Input"
@@ -576,6 +861,8 @@ class CommandsAsYouTypeBase(sublime_plugin.TextCommand):
 			self.default_input = abbr
 
 	def run(self, edit, panel_input=None, **kwargs):
+		if not check_context(panel_input is None):
+			return
 
 		if panel_input is None:
 			self.setup(edit, self.view, **kwargs)
@@ -761,17 +1048,36 @@ class RenameTag(sublime_plugin.TextCommand):
 		view = active_view()
 		sels = list(view.sel())
 		sel_cleared = False
-		with ctx.js() as c:
-			for s in sels:
-				ranges = c.locals.pyGetTagNameRanges(s.begin())
-				if ranges:
-					if not sel_cleared:
-						view.sel().clear()
-						sel_cleared = True
-						
-					for r in ranges:
-						view.sel().add(sublime.Region(r[0], r[1]))
-					view.show(view.sel())
+		for s in sels:
+			ranges = self.tag_name_ranges(view, s.begin())
+			if ranges:
+				if not sel_cleared:
+					view.sel().clear()
+					sel_cleared = True
+					
+				for r in ranges:
+					view.sel().add(sublime.Region(r[0], r[1]))
+				view.show(view.sel())
+
+	def tag_name_ranges(self, view, pos):
+		tag = view_tag(view, pos)
+		if tag is None:
+			# tag index can't be used here, use HTML matcher
+			with ctx.js() as c:
+				return c.locals.pyGetTagNameRanges(pos)
+
+		ranges = []
+		if tag:
+			name, open_tag, close_tag = tag
+			ranges.append((open_tag[0] + 1, open_tag[0] + 1 + len(name)))
+			if close_tag:
+				ranges.append((close_tag[0] + 2, close_tag[0] + 2 + len(name)))
+
+		return ranges
+
+class TagIndexHandler(sublime_plugin.EventListener):
+	def on_close(self, view):
+		drop_tag_index(view)
 
 class EmmetInsertAttribute(sublime_plugin.TextCommand):
 	def run(self, edit, attribute=None, **kw):
@@ -789,7 +1095,7 @@ class EmmetInsertAttribute(sublime_plugin.TextCommand):
 
 class EmmetResetContext(sublime_plugin.TextCommand):
 	def run(self, edit, **kw):
-		update_settings()
+		update_settings(True)
 
 def plugin_loaded():
 	sublime.set_timeout(init, 200)
@@ -0,0 +1,85 @@
+# coding=utf-8
+"""
+Lazy provider of Can I Use database.
+
+Optimized database is split into a small index (list of vendors,
+eras and a map of CSS properties to sections) and a blob file with
+stats of each CSS section. JS context loads index only and requests
+section stats on demand, when CSS resolver actually needs vendor
+prefixes for a property.
+"""
+import os.path
+import json
+
+from snapshot import Snapshot, SNAPSHOT_VERSION, atomic_write
+
+class CIUProvider():
+	"""
+	@param path: Directory where database files should be stored
+	"""
+	def __init__(self, path):
+		self._index = Snapshot(path, 'caniuse-index.json')
+		self._blob_path = os.path.join(path, 'caniuse-stats.dat')
+		self._offsets = None
+		self._data_start = 0
+
+	def load(self, key):
+		"""
+		Returns JSON-encoded index of database, stored for given key,
+		or `None` if there's no valid database
+		"""
+		index = self._index.load(key)
+		if not index or not os.path.exists(self._blob_path):
+			return None
+
+		try:
+			with open(self._blob_path, 'rb') as fd:
+				header = fd.readline()
+
+			if json.loads(header.decode('utf-8')).get('key') != key:
+				return None
+
+			self._offsets = json.loads(index)['stats']
+			self._data_start = len(header)
+		except Exception as e:
+			return None
+
+		return index
+
+	def save(self, key, data):
+		"""
+		Splits optimized database (as returned by `pyOptimizeCIU()`)
+		into index and stats blob and stores them for given key
+		"""
+		data = json.loads(data)
+		header = ('%s\n' % json.dumps({
+			'version': SNAPSHOT_VERSION,
+			'key': key
+		})).encode('utf-8')
+
+		chunks = []
+		offsets = []
+		pos = 0
+		for stats in data['stats']:
+			chunk = json.dumps(stats, separators=(',', ':')).encode('utf-8')
+			offsets.append([pos, len(chunk)])
+			chunks.append(chunk)
+			pos += len(chunk)
+
+		atomic_write(self._blob_path, header + b''.join(chunks))
+		self._index.save(key, json.dumps({
+			'vendors': data['vendors'],
+			'era': data['era'],
+			'css': data['css'],
+			'stats': offsets
+		}, separators=(',', ':')))
+
+		self._offsets = offsets
+		self._data_start = len(header)
+
+	def read(self, ix):
+		"Returns JSON-encoded stats of CSS section with given index"
+		offset, length = self._offsets[int(ix)]
+		with open(self._blob_path, 'rb') as fd:
+			fd.seek(self._data_start + offset)
+			return fd.read(length).decode('utf-8')
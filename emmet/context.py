@@ -7,7 +7,10 @@ import json
 import gc
 import imp
 import re
+import threading
 from file import File
+from snapshot import resource_key, file_stamp
+from ciu import CIUProvider
 
 BASE_PATH = os.path.abspath(os.path.dirname(__file__))
 is_python3 = sys.version_info[0] > 2
@@ -54,6 +57,8 @@ def should_use_unicode():
 	WinXP unable to eval JS in unicode object (while other OSes requires it)
 	This function checks if we have to use unicode when reading files
 	"""
+	locker = PyV8.JSLocker()
+	locker.enter()
 	ctx = PyV8.JSContext()
 	ctx.enter()
 	use_unicode = True
@@ -63,6 +68,7 @@ def should_use_unicode():
 		use_unicode = False
 
 	ctx.leave()
+	locker.leave()
 
 	return use_unicode
 
@@ -127,10 +133,15 @@ class Context():
 	@param path: Path to Emmet extensions
 	@param contrib: Python objects to contribute to JS execution context
 	@param pyv8_path: Location of PyV8 binaries
+	@param cache_path: Location of warm start snapshot, lazy
+	Can I Use database and cache of remote files. Pass `None`
+	to disable snapshots
 	"""
-	def __init__(self, files=[], ext_path=None, contrib=None, logger=None, reader=js_file_reader):
+	def __init__(self, files=[], ext_path=None, contrib=None, logger=None, reader=js_file_reader, cache_path=None):
 		self.logger = logger
 		self.reader = reader
+		self._ciu = CIUProvider(cache_path) if cache_path else None
+		self._file = File(os.path.join(cache_path, 'http') if cache_path else None)
 
 		try:
 			import_pyv8()
@@ -138,7 +149,6 @@ class Context():
 			pass
 
 		self._ctx = None
-		self._ctx_inited = False
 		self._contrib = contrib
 		self._should_load_extension = True
 
@@ -146,9 +156,19 @@ class Context():
 		self._use_unicode = None
 		self._core_files = [] + core_files + files
 
+		# guards context creation, which may happen in background thread
+		self._lock = threading.RLock()
+		# guards context reference and pending data: they're updated
+		# from main thread while context may be used in background
+		self._state_lock = threading.RLock()
+		self._warming = False
+		self._warming_lock = threading.Lock()
+
 		self._ext_path = None
 		self.set_ext_path(ext_path)
 		self._user_data = None
+		self._user_data_patch = None
+		self._user_payload = None
 
 		set_global_context(self)
 
@@ -164,13 +184,15 @@ class Context():
 			val = os.path.expanduser(val)
 			val = os.path.abspath(val)
 
-		if val == self._ext_path:
-			return
+		with self._state_lock:
+			if val == self._ext_path:
+				return False
 
-		self._ext_path = val
-		self.reset()
+			self._ext_path = val
+			self.reset()
+			return True
 
-	def load_extensions(self, path=None):
+	def load_extensions(self, path=None, ctx=None):
 		if path is None:
 			path = self.get_ext_path();
 
@@ -182,11 +204,19 @@ class Context():
 					if filename[0] != '.':
 						ext_files.append(os.path.join(dirname, filename))
 
-			self.js().locals.pyLoadExtensions(ext_files)
+			(ctx or self.js()).locals.pyLoadExtensions(ext_files)
 
 	def js(self):
-		"Returns JS context"
-		if not self._ctx:
+		"""
+		Returns JS context. If context is being created in background
+		thread, waits until it is ready
+		"""
+		with self._lock:
+			return self._js()
+
+	def _js(self):
+		ctx = self._ctx
+		if not ctx:
 			try:
 				import_pyv8()
 			except ImportError as e:
@@ -199,88 +229,200 @@ class Context():
 			if self._use_unicode is None:
 				self._use_unicode = should_use_unicode()
 
-			self._ctx_inited = False
-
-			class JSContext(PyV8.JSContext):
-				def __enter__(self):
-					if not hasattr(self, '_counter'):
-						self._counter = 0
-					if not self._counter:
-						self.lock = PyV8.JSLocker()
-						self.lock.enter()
-						self.enter()
-						# print('Enter JS context')
-
-					self._counter += 1
-					return self
-
-				def __exit__(self, exc_type, exc_value, traceback):
-					self._counter -= 1
-					if self._counter < 1 or exc_type is not None:
-						# print('Exit JS context')
-						self._counter = 0
-						if self:
-							self.leave()
-						if self.lock:
-							self.lock.leave()
-							self.lock = None
-
-			self._ctx = JSContext()
-
-			with self._ctx as ctx:
-				# expose some methods
-				ctx.locals.log = js_log
-				ctx.locals.pyFile = File()
-		
-			for f in self._core_files:
-				self.eval_js_file(f)
-
-			with self._ctx as ctx:
-				# load default snippets
-				ctx.locals.pyLoadSystemSnippets(self.read_js_file(make_path('snippets.json')))
-				ctx.locals.pyLoadCIU(self.read_js_file(make_path('caniuse.json')))
-
-				if self._contrib:
-					for k in self._contrib:
-						ctx.locals[k] = self._contrib[k]
+			# context is created and bootstrapped with local reference:
+			# it's published only when ready, so it's safe to reset
+			# context from another thread meanwhile
+			ctx = self._create_context()
+			with self._state_lock:
+				self._ctx = ctx
+
+		with self._state_lock:
+			if self._ctx is not ctx:
+				# context was reset: pending data belongs to the next one
+				return ctx
+
+			should_load_extension = self._should_load_extension
+			user_data = self._user_data
+			user_data_patch = self._user_data_patch
+			self._should_load_extension = False
+			self._user_data = None
+			self._user_data_patch = None
+
+		if not (should_load_extension or user_data or user_data_patch):
+			# nothing to load: don't take V8 lock
+			return ctx
+
+		with ctx:
+			if should_load_extension:
+				ctx.locals.pyResetUserData()
+				self.load_extensions(ctx=ctx)
+
+			if user_data:
+				ctx.locals.pyLoadUserData(user_data)
+
+			if user_data_patch:
+				ctx.locals.pyPatchUserData(*user_data_patch)
+
+		return ctx
+
+	def _create_context(self):
+		"Creates JS context and loads Emmet core into it"
+		class JSContext(PyV8.JSContext):
+			def __enter__(self):
+				if not hasattr(self, '_counter'):
+					self._counter = 0
+				if not self._counter:
+					self.lock = PyV8.JSLocker()
+					self.lock.enter()
+					self.enter()
+					# print('Enter JS context')
+
+				self._counter += 1
+				return self
+
+			def __exit__(self, exc_type, exc_value, traceback):
+				self._counter -= 1
+				if self._counter < 1 or exc_type is not None:
+					# print('Exit JS context')
+					self._counter = 0
+					if self:
+						self.leave()
+					if self.lock:
+						self.lock.leave()
+						self.lock = None
+
+		# context must be created by thread that owns V8 lock
+		locker = PyV8.JSLocker()
+		locker.enter()
+		try:
+			ctx = JSContext()
+		finally:
+			locker.leave()
 
-				self._ctx_inited = True
-		
-		# if not hasattr(PyV8.JSContext.current.locals, 'isEmmet'):
-		# 	print('Enter Emmet context')
-		# 	self._ctx.enter()
+		with ctx:
+			# expose some methods
+			ctx.locals.log = js_log
+			ctx.locals.pyFile = self._file
 
-		if self._ctx_inited:
-			with self._ctx as ctx:
-				if self._should_load_extension:
-					ctx.locals.pyResetUserData()
-					self._should_load_extension = False
-					self.load_extensions()
+			for f in self._core_files:
+				ctx.eval(self.read_js_file(make_path(f)), name=f, line=0, col=0)
+
+			# load default snippets
+			ctx.locals.pyLoadSystemSnippets(self.read_js_file(make_path('snippets.json')))
+			self.load_ciu(ctx)
+
+			if self._contrib:
+				for k in self._contrib:
+					ctx.locals[k] = self._contrib[k]
+
+		return ctx
+
+	def warm_up(self):
+		"""
+		Creates JS context and loads all pending data in background
+		thread so the first action invocation won't pay for
+		context bootstrap
+		"""
+		with self._warming_lock:
+			if self._warming:
+				return
+			self._warming = True
+
+		def run():
+			try:
+				self.js()
+			except Exception as e:
+				self.log('Unable to warm up JS context: %s' % e)
+			finally:
+				with self._warming_lock:
+					self._warming = False
+
+		t = threading.Thread(target=run)
+		t.daemon = True
+		t.start()
+
+	def is_warming(self):
+		"Check if JS context is being created in background thread"
+		return self._warming
+
+	def load_ciu(self, ctx):
+		"""
+		Loads Can I Use database into given JS context. If snapshot
+		is available, only database index is loaded and section
+		stats are read on demand from pre-optimized snapshot
+		"""
+		file_path = make_path('caniuse.json')
+		if not self._ciu:
+			return ctx.locals.pyLoadCIU(self.read_js_file(file_path))
+
+		data = None
+		stamp = file_stamp(file_path)
+		if stamp is None:
+			data = self.read_js_file(file_path)
+		key = resource_key(stamp or data)
+
+		ctx.locals.pyCIU = self._ciu
+		index = self._ciu.load(key)
+		if index:
+			try:
+				return ctx.locals.pyLoadLazyCIU(index)
+			except Exception as e:
+				self.log('Unable to restore Can I Use snapshot: %s' % e)
 
-				if self._user_data:
-					ctx.locals.pyLoadUserData(self._user_data)
-					self._user_data = None
+		if data is None:
+			data = self.read_js_file(file_path)
 
-		return self._ctx
+		optimized = ctx.locals.pyOptimizeCIU(data)
+		try:
+			self._ciu.save(key, optimized)
+		except Exception as e:
+			self.log('Unable to save Can I Use snapshot: %s' % e)
 
 	def load_user_data(self, data):
 		"Loads user data payload from JSON"
-		self._user_data = data
+		with self._state_lock:
+			self._user_data = data
+			self._user_data_patch = None
 		# self.js().locals.pyLoadUserData(data)
 
+	def update_user_data(self, payload):
+		"""
+		Updates user data with given payload dict. If JS context
+		is already initialized, only changed payload sections
+		are pushed into it, otherwise the whole payload will be
+		loaded on context initialization
+		"""
+		with self._state_lock:
+			prev = self._user_payload
+			self._user_payload = payload
+
+			if prev is None or not self._ctx or self._should_load_extension or self._user_data:
+				return self.load_user_data(json.dumps(payload))
+
+			changed = [k for k in set(prev) | set(payload) if prev.get(k) != payload.get(k)]
+			if self._user_data_patch:
+				# merge with pending patch
+				changed = list(set(changed) | set(self._user_data_patch[1]))
+
+			if changed:
+				self._user_data_patch = (json.dumps(payload), changed)
+
 	def reset(self):
 		"Resets JS execution context"
-		if self._ctx:
-			# self._ctx.leave()
+		with self._state_lock:
+			ctx = self._ctx
 			self._ctx = None
+			self._should_load_extension = True
+
+		if ctx:
+			# self._ctx.leave()
+			ctx = None
 			try:
 				PyV8.JSEngine.collect()
 				gc.collect()
 			except:
 				pass
 
-		self._should_load_extension = True
-
 	def read_js_file(self, file_path, resolve_path=False):
 		full_path = make_path(file_path) if resolve_path else file_path
 		return self.reader(full_path, self._use_unicode)
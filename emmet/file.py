@@ -5,24 +5,17 @@
 import sys
 import os.path
 import re
+import json
+import base64
 
-is_python3 = sys.version_info[0] > 2
+from httpcache import HTTPClient
+from imagesize import probe_file, probe_url, probe_all
 
-try:
-	if is_python3:
-		import urllib.request as urllib2
-	else:
-		import urllib2
-except Exception as e:
-	pass
+is_python3 = sys.version_info[0] > 2
 
 def is_url(path):
 	return re.match(r'^https?://', path, re.IGNORECASE)
 
-def read_http(url, size=-1, mode=None):
-	response = urllib2.urlopen(url, timeout=5)
-	return response.read(size)
-
 def read_file(path, size=-1, mode='rb'):
 	kwargs = {}
 	if is_python3 and 'b' not in mode:
@@ -32,12 +25,23 @@ def read_file(path, size=-1, mode='rb'):
 		return fp.read(size)
 
 class File():
-	def __init__(self):
-		pass
+	"""
+	@param http_cache_path: Directory for on-disk cache of remote files.
+	Pass `None` to keep cache in memory only
+	"""
+	def __init__(self, http_cache_path=None):
+		self.http = HTTPClient(http_cache_path)
+		# image sizes detected in advance by `prefetch_image_sizes()`
+		self._image_sizes = {}
 
 	def _read(self, path, size, mode='rb'):
-		reader = is_url(path) and read_http or read_file
-		return reader(path, size, mode) 
+		if is_url(path):
+			return self.http.read(path, 0, size)
+
+		return read_file(path, size, mode)
+
+	def _probe(self, path):
+		return is_url(path) and probe_url(path, self.http) or probe_file(path)
 
 	def read(self, path, size, callback=None):
 		"""
@@ -50,18 +54,49 @@ class File():
 		try:
 			content = self._read(path, size)
 
-			# return as array of character codes since PyV8 may corrupt
+			# return as base64 string since PyV8 may corrupt
 			# binary data when python string is translated into JS string
+			content = base64.b64encode(content)
 			if is_python3:
-				content = [ch for ch in content]
-			else:
-				content = [ord(ch) for ch in content]
+				content = content.decode('ascii')
 
 		except Exception as e:
 			return callback(str(e), None)
 
 		callback(None, content)
 
+	def image_size(self, path):
+		"""
+		Returns size of given image as [width, height] list. Only image
+		header is read, not the whole file
+		@param path: Image's absolute path or URL
+		@type path: str
+		@return: list or None if size can't be detected
+		"""
+		if path in self._image_sizes:
+			return self._image_sizes.pop(path)
+
+		try:
+			size = self._probe(path)
+		except Exception as e:
+			return None
+
+		return size and list(size)
+
+	def prefetch_image_sizes(self, paths):
+		"""
+		Detects sizes of given remote images concurrently, so subsequent
+		`image_size()` calls for them don't wait for network
+		@param paths: JSON-encoded list of image paths or URLs
+		@type paths: str
+		"""
+		urls = [p for p in set(json.loads(paths)) if is_url(p)]
+		if len(urls) < 2:
+			return
+
+		for url, size in probe_all(self._probe, urls).items():
+			self._image_sizes[url] = size and list(size)
+
 	def read_text(self, path, size, callback=None):
 		"""
 		Read file content and return it
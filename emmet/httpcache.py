@@ -0,0 +1,456 @@
+# coding=utf-8
+"""
+HTTP client for remote assets, like images in Update Image Size action.
+
+Connections are kept alive and reused for requests to the same host.
+Fetched data is stored in cache (on disk, if cache directory is given)
+and revalidated with `ETag` and `Last-Modified` validators, so repeated
+reads of the same resource cost a single conditional request with
+empty response. Resources are fetched partially, with `Range` requests,
+so only the requested part of resource is transferred.
+"""
+import sys
+import os.path
+import re
+import json
+import time
+import socket
+import hashlib
+import threading
+
+from snapshot import atomic_write
+
+is_python3 = sys.version_info[0] > 2
+
+if is_python3:
+	import http.client as httplib
+	from urllib.parse import urlsplit, urljoin
+else:
+	import httplib
+	from urlparse import urlsplit, urljoin
+
+MAX_REDIRECTS = 5
+
+# Maximum size of resource data stored in on-disk cache
+MAX_CACHED_SIZE = 4 * 1024 * 1024
+
+# Maximum total size of on-disk cache: least recently used
+# entries are removed when it's exceeded
+MAX_CACHE_DIR_SIZE = 32 * 1024 * 1024
+
+# Maximum amount of entries kept in memory
+MAX_MEMORY_ENTRIES = 256
+
+# If requested data starts farther than this from the end of
+# cached data, it's fetched directly and not cached
+MAX_GAP = 64 * 1024
+
+re_content_range = re.compile(r'bytes\s+(\d+)-(\d+)/(\d+|\*)', re.I)
+
+class HTTPError(IOError):
+	pass
+
+class Response(object):
+	def __init__(self, status, headers, body, complete):
+		self.status = status
+		# header names are in lower case
+		self.headers = headers
+		self.body = body
+		# body wasn't truncated by read limit
+		self.complete = complete
+
+class ConnectionPool(object):
+	"""
+	Keep-alive connections, grouped by scheme, host and port.
+	Connection is used by a single request at a time, so pool can be
+	used from multiple threads
+	"""
+	max_idle = 4
+
+	def __init__(self, timeout=5):
+		self.timeout = timeout
+		self._idle = {}
+		self._lock = threading.Lock()
+
+	def _connect(self, key):
+		scheme, host, port = key
+		factory = scheme == 'https' and httplib.HTTPSConnection or httplib.HTTPConnection
+		return factory(host, port, timeout=self.timeout)
+
+	def _acquire(self, key):
+		"Returns `(connection, reused)` tuple"
+		with self._lock:
+			conns = self._idle.get(key)
+			if conns:
+				return conns.pop(), True
+
+		return self._connect(key), False
+
+	def _release(self, key, conn):
+		with self._lock:
+			conns = self._idle.setdefault(key, [])
+			if len(conns) < self.max_idle:
+				conns.append(conn)
+				return
+
+		conn.close()
+
+	def close(self):
+		with self._lock:
+			idle = self._idle
+			self._idle = {}
+
+		for conns in idle.values():
+			for conn in conns:
+				conn.close()
+
+	def get(self, url, headers=None, limit=None):
+		"""
+		Sends GET request to given URL, follows redirects.
+		@param limit: Maximum amount of body bytes to read. If body
+		is larger, connection is closed instead of reading the rest
+		@return: Response
+		"""
+		for i in range(MAX_REDIRECTS + 1):
+			response = self._get(url, headers or {}, limit)
+			location = response.headers.get('location')
+			if response.status in (301, 302, 303, 307, 308) and location:
+				url = urljoin(url, location)
+				continue
+
+			return response
+
+		raise HTTPError('Too many redirects: %s' % url)
+
+	def _get(self, url, headers, limit):
+		parts = urlsplit(url)
+		scheme = parts.scheme.lower()
+		key = (scheme, parts.hostname, parts.port or (scheme == 'https' and 443 or 80))
+		path = parts.path or '/'
+		if parts.query:
+			path += '?' + parts.query
+
+		while True:
+			conn, reused = self._acquire(key)
+			try:
+				conn.request('GET', path, headers=headers)
+				resp = conn.getresponse()
+				break
+			except (httplib.HTTPException, socket.error) as e:
+				conn.close()
+				# idle connection may be closed by server:
+				# retry with another one
+				if not reused:
+					raise
+
+		try:
+			if limit is None:
+				body = resp.read()
+				complete = True
+			else:
+				body = resp.read(limit)
+				complete = resp.isclosed() or not resp.read(1)
+		except:
+			conn.close()
+			raise
+
+		if complete and not resp.will_close:
+			self._release(key, conn)
+		else:
+			conn.close()
+
+		headers = dict((k.lower(), v) for k, v in resp.getheaders())
+		return Response(resp.status, headers, body, complete)
+
+class CacheEntry(object):
+	"Cached first `len(data)` bytes of resource"
+	def __init__(self, url, data=b'', etag=None, last_modified=None, size=None):
+		self.url = url
+		self.data = data
+		self.etag = etag
+		self.last_modified = last_modified
+		# full size of resource, if known
+		self.size = size
+		# time of last validation
+		self.checked = 0
+		# server doesn't support Range requests
+		self.no_ranges = False
+
+	def complete(self):
+		return self.size is not None and len(self.data) >= self.size
+
+	def covers(self, end):
+		return self.complete() or (end is not None and len(self.data) >= end)
+
+	def range_validator(self):
+		"""
+		Returns validator for `If-Range` header, so range of changed
+		resource isn't appended to cached data. Weak ETags can't be used
+		in `If-Range`
+		"""
+		if self.etag and not self.etag.startswith('W/'):
+			return self.etag
+		return self.last_modified
+
+class ResponseCache(object):
+	"""
+	Storage of cache entries, keyed by URL. Entries are kept in memory
+	and, if `path` is given, in that directory
+	"""
+	def __init__(self, path=None):
+		self.path = path
+		self._entries = {}
+		self._lock = threading.Lock()
+
+	def _file_path(self, url, ext):
+		key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+		return os.path.join(self.path, key + ext)
+
+	def get(self, url):
+		with self._lock:
+			entry = self._entries.get(url)
+
+		if entry is None and self.path:
+			entry = self._load(url)
+			if entry is not None:
+				self._remember(entry)
+
+		return entry
+
+	def put(self, entry):
+		self._remember(entry)
+		if not self.path or len(entry.data) > MAX_CACHED_SIZE:
+			return
+
+		if not entry.etag and not entry.last_modified:
+			# can't be revalidated
+			return
+
+		meta = json.dumps({
+			'url': entry.url,
+			'etag': entry.etag,
+			'last_modified': entry.last_modified,
+			'size': entry.size,
+			'length': len(entry.data)
+		})
+
+		try:
+			atomic_write(self._file_path(entry.url, '.data'), entry.data)
+			atomic_write(self._file_path(entry.url, '.json'), meta.encode('utf-8'))
+		except (IOError, OSError) as e:
+			pass
+
+		self._prune()
+
+	def _prune(self):
+		"""
+		Removes least recently used entries from cache directory
+		until its size fits `MAX_CACHE_DIR_SIZE`. Entry access time
+		is the modification time of its meta file
+		"""
+		entries = {}
+		total = 0
+		try:
+			for name in os.listdir(self.path):
+				key, ext = os.path.splitext(name)
+				if ext not in ('.data', '.json'):
+					continue
+
+				stat = os.stat(os.path.join(self.path, name))
+				size, used = entries.get(key, (0, 0))
+				if ext == '.json':
+					used = stat.st_mtime
+				entries[key] = (size + stat.st_size, used)
+				total += stat.st_size
+		except OSError as e:
+			return
+
+		for key in sorted(entries, key=lambda k: entries[k][1]):
+			if total <= MAX_CACHE_DIR_SIZE:
+				break
+
+			for ext in ('.json', '.data'):
+				try:
+					os.remove(os.path.join(self.path, key + ext))
+				except OSError as e:
+					pass
+			total -= entries[key][0]
+
+	def _remember(self, entry):
+		with self._lock:
+			if len(self._entries) >= MAX_MEMORY_ENTRIES:
+				self._entries.clear()
+			self._entries[entry.url] = entry
+
+	def _load(self, url):
+		try:
+			with open(self._file_path(url, '.json'), 'rb') as fd:
+				meta = json.loads(fd.read().decode('utf-8'))
+
+			if meta.get('url') != url:
+				return None
+
+			with open(self._file_path(url, '.data'), 'rb') as fd:
+				data = fd.read()
+		except (IOError, OSError, ValueError) as e:
+			return None
+
+		if len(data) != meta.get('length'):
+			return None
+
+		try:
+			# mark entry as recently used
+			os.utime(self._file_path(url, '.json'), None)
+		except OSError as e:
+			pass
+
+		return CacheEntry(url, data, meta.get('etag'), meta.get('last_modified'), meta.get('size'))
+
+class HTTPClient(object):
+	"""
+	Reads remote resources with pooled connections and response cache
+	@param cache_dir: Directory for on-disk cache. Pass `None` to keep
+	cache in memory only
+	@param timeout: Connection timeout, in seconds
+	@param max_age: Time (in seconds) during which cached data is used
+	without revalidation
+	"""
+	def __init__(self, cache_dir=None, timeout=5, max_age=60):
+		self.pool = ConnectionPool(timeout)
+		self.cache = ResponseCache(cache_dir)
+		self.max_age = max_age
+
+	def read(self, url, start=0, size=-1):
+		"""
+		Returns `size` bytes of resource data from `start` offset.
+		Negative `size` means all data till the end of resource
+		"""
+		end = start + size if size >= 0 else None
+		entry = self._validate(url, end)
+
+		while not entry.covers(end):
+			have = len(entry.data)
+			if end is not None and start > have + MAX_GAP and not entry.no_ranges:
+				data = self._read_range(entry, start, end)
+				if data is not None:
+					return data
+
+			self._fetch(entry, end)
+			if len(entry.data) == have and not entry.complete():
+				# no progress: server returned less than expected
+				break
+
+		return entry.data[start:end]
+
+	def _validate(self, url, end):
+		"""
+		Returns cache entry for given URL. Entry is revalidated if
+		it's too old, new entry is created with the first `end` bytes
+		of resource if there's no valid cache
+		"""
+		entry = self.cache.get(url)
+		now = time.time()
+		if entry is not None and now - entry.checked < self.max_age:
+			return entry
+
+		headers = {}
+		if entry is not None:
+			if entry.etag:
+				headers['If-None-Match'] = entry.etag
+			if entry.last_modified:
+				headers['If-Modified-Since'] = entry.last_modified
+
+		if end is not None:
+			headers['Range'] = 'bytes=0-%d' % max(end - 1, 0)
+
+		response = self.pool.get(url, headers, end)
+		if response.status == 304 and entry is not None:
+			entry.checked = now
+			return entry
+
+		entry = CacheEntry(url, etag=response.headers.get('etag'),
+			last_modified=response.headers.get('last-modified'))
+		entry.checked = now
+		self._store(entry, response, 0)
+		return entry
+
+	def _fetch(self, entry, end):
+		"Fetches data from the end of cached data up to `end` offset"
+		headers = {}
+		validator = entry.range_validator()
+		if entry.data and not validator and not entry.no_ranges:
+			# can't make sure that appended range belongs
+			# to the same resource: fetch it from scratch
+			entry.data = b''
+			entry.size = None
+
+		have = len(entry.data)
+		limit = end
+		if entry.no_ranges:
+			# each request returns data from resource start:
+			# grow fetched data geometrically
+			limit = end and max(end, have * 2)
+		else:
+			if end is None:
+				headers['Range'] = 'bytes=%d-' % have
+			else:
+				headers['Range'] = 'bytes=%d-%d' % (have, end - 1)
+			if have:
+				headers['If-Range'] = validator
+
+		self._store(entry, self.pool.get(entry.url, headers, limit), have, 'If-Range' in headers)
+
+	def _read_range(self, entry, start, end):
+		"Reads data range without caching it"
+		headers = {'Range': 'bytes=%d-%d' % (start, end - 1)}
+		validator = entry.range_validator()
+		if validator:
+			headers['If-Range'] = validator
+
+		response = self.pool.get(entry.url, headers, end - start)
+
+		m = re_content_range.match(response.headers.get('content-range', ''))
+		if response.status == 206 and m and int(m.group(1)) == start:
+			return response.body
+
+		if response.status == 416:
+			return b''
+
+		self._store(entry, response, len(entry.data), validator is not None)
+		return None
+
+	def _store(self, entry, response, offset, if_range=False):
+		"""
+		Updates entry with response data, received for `offset` position
+		@param if_range: Request was sent with `If-Range` header
+		"""
+		status = response.status
+		content_range = response.headers.get('content-range', '')
+		if status == 206:
+			m = re_content_range.match(content_range)
+			if not m or int(m.group(1)) != offset:
+				raise HTTPError('Unexpected range of %s: %s' % (entry.url, content_range))
+
+			entry.data = entry.data[:offset] + response.body
+			if m.group(3) != '*':
+				entry.size = int(m.group(3))
+		elif status == 200:
+			if if_range:
+				# resource was modified: server sends new one
+				entry.etag = response.headers.get('etag')
+				entry.last_modified = response.headers.get('last-modified')
+			else:
+				# server ignores ranges and sends resource from the start
+				entry.no_ranges = True
+
+			entry.data = response.body
+			entry.size = len(entry.data) if response.complete else None
+		elif status == 416:
+			# requested range is beyond resource end
+			m = re.search(r'/(\d+)', content_range)
+			entry.size = int(m.group(1)) if m else offset
+			entry.data = entry.data[:entry.size]
+		else:
+			raise HTTPError('HTTP %d: %s' % (status, entry.url))
+
+		self.cache.put(entry)
@@ -0,0 +1,245 @@
+# coding=utf-8
+"""
+Image dimensions probe.
+
+Reads just enough bytes of image to get its width and height:
+image headers are parsed incrementally, JPEG segments are skipped
+until frame header is found. Remote images are read with HTTP client
+which fetches data with Range requests and caches it.
+
+Supported formats: PNG, GIF, JPEG, WebP and SVG
+"""
+import re
+import struct
+import threading
+
+from httpcache import HTTPClient
+
+# Maximum amount of bytes to read for SVG root element lookup
+MAX_SVG_HEADER = 64 * 1024
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+re_svg_tag = re.compile(br'<svg\b[^>]*>', re.I)
+re_svg_number = br'\s*=\s*["\x27]\s*(\d+(?:\.\d+)?)\s*(?:px)?\s*["\x27]'
+re_svg_width = re.compile(br'\swidth' + re_svg_number)
+re_svg_height = re.compile(br'\sheight' + re_svg_number)
+re_svg_viewbox = re.compile(br'\sviewBox\s*=\s*["\x27]\s*([\d\.\-]+)[\s,]+([\d\.\-]+)[\s,]+([\d\.]+)[\s,]+([\d\.]+)', re.I)
+
+class ByteReader(object):
+	"""
+	Incremental reader of binary data. Subclasses should implement
+	`_fetch(pos, size)` method which returns data at given position
+	"""
+	chunk_size = 4096
+
+	def __init__(self):
+		self.pos = 0
+		# data size, known when end of data is reached
+		self.size = None
+		self._buf = b''
+		self._buf_pos = 0
+
+	def read(self, size):
+		buf_end = self._buf_pos + len(self._buf)
+		if not self._buf_pos <= self.pos <= buf_end:
+			# requested data is outside of buffer
+			self._buf = b''
+			self._buf_pos = buf_end = self.pos
+
+		end = self.pos + size
+		if end > buf_end and (self.size is None or buf_end < self.size):
+			fetch_size = max(end - buf_end, self.chunk_size)
+			data = self._fetch(buf_end, fetch_size)
+			if len(data) < fetch_size:
+				self.size = buf_end + len(data)
+
+			self._buf = self._buf[self.pos - self._buf_pos:] + data
+			self._buf_pos = self.pos
+
+		offset = self.pos - self._buf_pos
+		data = self._buf[offset:offset + size]
+		self.pos += len(data)
+		return data
+
+	def skip(self, size):
+		self.pos += size
+
+	def close(self):
+		pass
+
+class FileReader(ByteReader):
+	def __init__(self, path):
+		ByteReader.__init__(self)
+		self._fp = open(path, 'rb')
+
+	def _fetch(self, pos, size):
+		self._fp.seek(pos)
+		return self._fp.read(size)
+
+	def close(self):
+		self._fp.close()
+
+class HTTPReader(ByteReader):
+	"Reads remote file with given HTTP client"
+	def __init__(self, url, client):
+		ByteReader.__init__(self)
+		self.url = url
+		self.client = client
+
+	def _fetch(self, pos, size):
+		return self.client.read(self.url, pos, size)
+
+def image_size(reader):
+	"""
+	Returns `(width, height)` tuple of image from given reader
+	or `None` if image size can't be detected
+	"""
+	head = reader.read(30)
+
+	if head[:8] == PNG_SIGNATURE and head[12:16] == b'IHDR':
+		return struct.unpack('>II', head[16:24])
+
+	if head[:6] in (b'GIF87a', b'GIF89a'):
+		return struct.unpack('<HH', head[6:10])
+
+	if head[:2] == b'\xff\xd8':
+		reader.pos = 2
+		return jpeg_size(reader)
+
+	if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+		return webp_size(head)
+
+	if head.lstrip(b'\xef\xbb\xbf \t\r\n')[:1] == b'<':
+		reader.pos = 0
+		return svg_size(reader)
+
+	return None
+
+def jpeg_size(reader):
+	"Reads JPEG markers until frame header is found"
+	while True:
+		data = reader.read(2)
+		if len(data) < 2 or data[:1] != b'\xff':
+			return None
+
+		marker = ord(data[1:2])
+		while marker == 0xff:
+			# fill bytes
+			data = reader.read(1)
+			if not data:
+				return None
+			marker = ord(data)
+
+		if marker == 0xd8 or marker == 0x01 or 0xd0 <= marker <= 0xd7:
+			# markers without payload
+			continue
+
+		if marker in (0xd9, 0xda):
+			# end of image or start of scan: there's no frame header
+			return None
+
+		data = reader.read(2)
+		if len(data) < 2:
+			return None
+
+		length = struct.unpack('>H', data)[0]
+		if 0xc0 <= marker <= 0xcf and marker not in (0xc4, 0xc8, 0xcc):
+			data = reader.read(5)
+			if len(data) < 5:
+				return None
+
+			height, width = struct.unpack('>xHH', data)
+			return width, height
+
+		reader.skip(length - 2)
+
+def webp_size(head):
+	fmt = head[12:16]
+	if fmt == b'VP8 ' and len(head) >= 30:
+		width, height = struct.unpack('<HH', head[26:30])
+		return width & 0x3fff, height & 0x3fff
+
+	if fmt == b'VP8L' and len(head) >= 25:
+		b = bytearray(head[21:25])
+		width = 1 + (b[0] | (b[1] & 0x3f) << 8)
+		height = 1 + (b[1] >> 6 | b[2] << 2 | (b[3] & 0x0f) << 10)
+		return width, height
+
+	if fmt == b'VP8X' and len(head) >= 30:
+		b = bytearray(head[24:30])
+		width = 1 + (b[0] | b[1] << 8 | b[2] << 16)
+		height = 1 + (b[3] | b[4] << 8 | b[5] << 16)
+		return width, height
+
+	return None
+
+def svg_size(reader):
+	"Reads size from attributes of SVG root element"
+	data = b''
+	m = None
+	while not m and len(data) < MAX_SVG_HEADER:
+		chunk = reader.read(reader.chunk_size)
+		if not chunk:
+			break
+		data += chunk
+		m = re_svg_tag.search(data)
+
+	if not m:
+		return None
+
+	tag = m.group(0)
+	width = re_svg_width.search(tag)
+	height = re_svg_height.search(tag)
+	if width and height:
+		return int(round(float(width.group(1)))), int(round(float(height.group(1))))
+
+	view_box = re_svg_viewbox.search(tag)
+	if view_box:
+		return int(round(float(view_box.group(3)))), int(round(float(view_box.group(4))))
+
+	return None
+
+def probe(reader):
+	try:
+		return image_size(reader)
+	finally:
+		reader.close()
+
+def probe_file(path):
+	"Returns `(width, height)` tuple of local image or `None`"
+	return probe(FileReader(path))
+
+def probe_url(url, client=None):
+	"Returns `(width, height)` tuple of remote image or `None`"
+	return probe(HTTPReader(url, client or HTTPClient()))
+
+def probe_all(probe_fn, paths, workers=6):
+	"""
+	Probes given images concurrently with `probe_fn` function.
+	Returns dict of image sizes, `None` for images which size
+	can't be detected
+	"""
+	queue = list(paths)
+	result = {}
+	lock = threading.Lock()
+
+	def worker():
+		while True:
+			with lock:
+				if not queue:
+					return
+				path = queue.pop()
+
+			try:
+				result[path] = probe_fn(path)
+			except Exception as e:
+				result[path] = None
+
+	threads = [threading.Thread(target=worker) for i in range(min(workers, len(queue)))]
+	for t in threads:
+		t.start()
+	for t in threads:
+		t.join()
+
+	return result
@@ -21,6 +21,45 @@ function _toArray(obj, ix) {
 	return out;
 }
 
+var _b64Codes = (function() {
+	var chars = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/';
+	var codes = [];
+	for (var i = 0; i < chars.length; i++) {
+		codes[chars.charCodeAt(i)] = i;
+	}
+	return codes;
+})();
+
+/**
+ * Decodes base64 string into binary string (each char code is a byte value)
+ * @param {String} data
+ * @return {String}
+ */
+function _decodeBase64(data) {
+	var codes = _b64Codes;
+	var il = data.length;
+	while (il && data.charAt(il - 1) == '=') {
+		il--;
+	}
+
+	var out = [], bytes = [], bits = 0, buf = 0;
+	for (var i = 0; i < il; i++) {
+		buf = (buf << 6) | codes[data.charCodeAt(i)];
+		bits += 6;
+		if (bits >= 8) {
+			bits -= 8;
+			bytes.push((buf >> bits) & 0xff);
+			if (bytes.length == 4096) {
+				out.push(String.fromCharCode.apply(String, bytes));
+				bytes = [];
+			}
+		}
+	}
+
+	out.push(String.fromCharCode.apply(String, bytes));
+	return out.join('');
+}
+
 /**
  * Simple function alias to run Emmet action.
  * <code>editorProxy</code> object should be defined
@@ -38,16 +77,167 @@ function pyLoadCIU(data) {
 	emmet.loadCIU(data);
 }
 
+/**
+ * Loads raw Can I Use database and returns its optimized
+ * representation, suitable for lazy loading with `pyLoadLazyCIU()`.
+ * Stats of CSS sections are shared between many properties
+ * so they are stored only once
+ * @param  {String} data Raw Can I Use database
+ * @return {String}
+ */
+function pyOptimizeCIU(data) {
+	var ciu = emmet.require('assets/caniuse.js');
+	var db = ciu.optimize(data);
+	ciu.load(db, true);
+
+	var stats = [], css = {};
+	Object.keys(db.css).forEach(function(name) {
+		var ix = stats.indexOf(db.css[name]);
+		if (ix === -1) {
+			ix = stats.push(db.css[name]) - 1;
+		}
+		css[name] = ix;
+	});
+
+	return JSON.stringify({
+		vendors: db.vendors,
+		era: db.era,
+		css: css,
+		stats: stats
+	});
+}
+
+/**
+ * Loads Can I Use database index, created from `pyOptimizeCIU()`
+ * result. Stats of CSS sections are requested from `pyCIU`
+ * provider only when resolver actually needs them
+ * @param  {String} index
+ */
+function pyLoadLazyCIU(index) {
+	index = JSON.parse(index);
+	var stats = {};
+	var css = {};
+	Object.keys(index.css).forEach(function(name) {
+		var ix = index.css[name];
+		Object.defineProperty(css, name, {
+			enumerable: true,
+			get: function() {
+				if (!(ix in stats)) {
+					stats[ix] = JSON.parse(pyCIU.read(ix));
+				}
+				return stats[ix];
+			}
+		});
+	});
+
+	emmet.require('assets/caniuse.js').load({
+		vendors: index.vendors,
+		era: index.era,
+		css: css
+	}, true);
+}
+
 function pyLoadUserData(data) {
 	emmet.loadUserData(data);
+	_triggerUserDataChange();
+}
+
+// user data, loaded from extensions folder: required
+// to re-apply extension data when user data is patched
+var _extensionsData = {};
+var _userDataListeners = [];
+
+// groups of user data sections that share the same storage,
+// with a function that resets this storage
+var _userDataStorages = [{
+	sections: ['snippets', 'syntaxProfiles', 'syntaxprofiles'],
+	reset: function() {
+		emmet.resetSnippets();
+	}
+}, {
+	sections: ['preferences'],
+	reset: function() {
+		emmet.preferences.reset();
+	}
+}, {
+	sections: ['profiles'],
+	reset: function() {
+		emmet.profile.reset();
+	}
+}];
+
+function _pickSections(data, sections) {
+	var out = {};
+	sections.forEach(function(name) {
+		if (name in data) {
+			out[name] = data[name];
+		}
+	});
+	return out;
+}
+
+function _triggerUserDataChange() {
+	_userDataListeners.forEach(function(fn) {
+		fn();
+	});
+}
+
+/**
+ * Registers function that will be invoked when user data
+ * is changed, e.g. to drop caches that depend on it
+ * @param  {Function} fn
+ */
+function pyOnUserDataChange(fn) {
+	_userDataListeners.push(fn);
 }
 
 function pyLoadExtensions(fileList) {
-	emmet.loadExtensions(_toArray(fileList));
+	// intercept user data that extensions loader passes to Emmet
+	var loadUserData = emmet.loadUserData;
+	emmet.loadUserData = function(data) {
+		_extensionsData = emmet.utils.common.parseJSON(data);
+		return loadUserData.apply(this, arguments);
+	};
+
+	try {
+		emmet.loadExtensions(_toArray(fileList));
+	} finally {
+		emmet.loadUserData = loadUserData;
+	}
+	_triggerUserDataChange();
+}
+
+/**
+ * Applies changed sections of user data without resetting
+ * the rest of context. Only storages affected by changed sections
+ * are reset, then extensions data and given user data
+ * are loaded into them again
+ * @param  {String} data User data payload (JSON)
+ * @param  {Array} sections List of changed section names
+ */
+function pyPatchUserData(data, sections) {
+	data = emmet.utils.common.parseJSON(data);
+	sections = _toArray(sections);
+
+	_userDataStorages.forEach(function(storage) {
+		var changed = storage.sections.some(function(name) {
+			return sections.indexOf(name) !== -1;
+		});
+
+		if (changed) {
+			storage.reset();
+			emmet.loadUserData(_pickSections(_extensionsData, storage.sections));
+			emmet.loadUserData(_pickSections(data, storage.sections));
+		}
+	});
+
+	_triggerUserDataChange();
 }
 
 function pyResetUserData() {
+	_extensionsData = {};
 	emmet.resetUserData();
+	_triggerUserDataChange();
 }
 
 emmet.file({
@@ -75,10 +265,7 @@ emmet.file({
 					return params.callback(err, content);
 				}
 
-				content = _toArray(content || []).map(function(b) {
-					return String.fromCharCode(b);
-				}).join('');
-				params.callback(null, content);
+				params.callback(null, _decodeBase64(String(content || '')));
 			});
 		} catch(e) {
 			params.callback(e);
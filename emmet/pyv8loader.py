@@ -9,6 +9,9 @@ import subprocess
 import tempfile
 import collections
 import platform
+import hashlib
+import socket
+import shutil
 import semver
 import time
 import zipfile
@@ -16,10 +19,12 @@ import zipfile
 is_python3 = sys.version_info[0] > 2
 
 if is_python3:
+	import queue
 	import urllib.request as url_req
 	import urllib.error as url_err
 	import urllib.parse as url_parse
 else:
+	import Queue as queue
 	import urllib
 	import urllib2
 	url_req = urllib2
@@ -30,6 +35,24 @@ CHECK_INTERVAL = 60 * 60 * 24
 
 # PACKAGES_URL = 'https://api.github.com/repos/emmetio/pyv8-binaries/downloads'
 PACKAGES_URL = 'https://api.github.com/repos/emmetio/pyv8-binaries/contents'
+BINARY_URL = 'https://raw.github.com/emmetio/pyv8-binaries/master/%s'
+
+# Files in package directory which are not part of PyV8 binary
+KEEP_FILES = ['config.json', 'pack.zip']
+
+# Directories for new (staged) and replaced package files
+STAGING_DIR = '.staging'
+TRASH_DIR = '.trash'
+
+# Delay (in seconds) before the next download transport is started,
+# used when there are no latency statistics of transports yet
+HEDGE_DELAY = 3
+
+# Returned by downloader if conditional request wasn't modified
+NOT_MODIFIED = object()
+
+# Packages list, loaded in current session, as `(time, packages)` tuple
+packages_cache = None
 
 def load(dest_path, delegate=None):
 	"""
@@ -58,12 +81,18 @@ def load(dest_path, delegate=None):
 			config['last_id'] = result				
 			if 'PyV8' not in sys.modules:
 				# PyV8 is not loaded yet, we can safely unpack it 
-				unpack_pyv8(dest_path)
+				unpack_pyv8(dest_path, lambda extracted, total: delegate.on_progress(
+					progress=kwargs.get('progress'), phase='unpack', received=extracted, total=total))
 
 		config['last_update'] = time.time()
 		save_loader_config(dest_path, config)
 		delegate.on_complete(*args, **kwargs)
 
+	def on_error(*args, **kwargs):
+		# keep transport latency, recorded by failed download
+		save_loader_config(dest_path, config)
+		delegate.on_error(*args, **kwargs)
+
 	# try to download most recent version of PyV8
 	# As PyV8 for Sublime Text spreads the world, it's possible
 	# that multiple distinct PyV8Loader's may start doing the same
@@ -89,7 +118,8 @@ def load(dest_path, delegate=None):
 	# watch on download progress
 	prog = ThreadProgress(thread, delegate, thread_exists)
 	prog.on('complete', on_complete if not thread_exists else delegate.on_complete)
-	prog.on('error', delegate.on_error)
+	prog.on('error', on_error if not thread_exists else delegate.on_error)
+	prog.start()
 
 def get_arch():
 	"Returns architecture name for PyV8 binary"
@@ -114,7 +144,11 @@ def get_loader_config(path):
 	config = {
 		"last_id": 0,
 		"last_update": 0,
-		"skip_update": False
+		"skip_update": False,
+		# average latency (in seconds) of download transports
+		"transport_latency": {},
+		# cached packages list with response validators
+		"manifest": None
 	}
 
 	config_path = os.path.join(path, 'config.json')
@@ -134,21 +168,102 @@ def save_loader_config(path, data):
 	fp.write(json.dumps(data))
 	fp.close()
 
-def clean_old_data():
-	for f in os.listdir('.'):
-		if f.lower() != 'config.json' and f.lower() != 'pack.zip':
-			try:
-				os.remove(f)
-			except Exception as e:
-				pass
+def read_chunks(stream, progress=None, total=None, chunk_size=64 * 1024, output=None, received=0):
+	"""
+	Reads all data from given stream. If `output` file is given,
+	data is written into it instead of being returned. Amount of
+	received bytes (starting with `received`) is reported to
+	`progress` callback after each chunk
+	"""
+	chunks = []
+	while True:
+		chunk = stream.read(chunk_size)
+		if not chunk:
+			break
+
+		if output:
+			output.write(chunk)
+		else:
+			chunks.append(chunk)
+
+		received += len(chunk)
+		if progress:
+			progress(received, total)
+
+	return b''.join(chunks)
+
+def is_packages_list(data):
+	"Check if given data is a valid JSON list of packages"
+	try:
+		if isinstance(data, bytes):
+			data = data.decode('utf-8')
+		return isinstance(json.loads(data), list)
+	except ValueError as e:
+		return False
+
+def partial_size(dest):
+	"Returns size of partially downloaded file"
+	return dest and os.path.exists(dest) and os.path.getsize(dest) or 0
+
+def git_blob_sha(path):
+	"Returns SHA-1 of given file as Git blob, like `sha` of GitHub contents API"
+	digest = hashlib.sha1(('blob %d\0' % os.path.getsize(path)).encode('ascii'))
+	with open(path, 'rb') as fd:
+		while True:
+			chunk = fd.read(64 * 1024)
+			if not chunk:
+				break
+			digest.update(chunk)
+
+	return digest.hexdigest()
+
+def replace_file(src, dest):
+	"Renames `src` file into `dest`, replacing existing file"
+	if hasattr(os, 'replace'):
+		return os.replace(src, dest)
+
+	# Windows doesn't allow to rename file into existing one
+	if os.path.exists(dest):
+		os.remove(dest)
+	os.rename(src, dest)
+
+def remove_path(path):
+	"Removes given file or directory, if exists"
+	if os.path.isdir(path):
+		shutil.rmtree(path, True)
+	elif os.path.exists(path):
+		try:
+			os.remove(path)
+		except Exception as e:
+			pass
 
-def unpack_pyv8(package_dir):
+def unpack_pyv8(package_dir, progress=None):
+	"""
+	Extracts downloaded PyV8 package (`pack.zip`) into `package_dir`.
+	Package is extracted into staging directory first, then staged
+	files replace the old ones. Process working directory is not
+	changed, so it's safe to unpack package from background thread
+	@param progress: Callback that receives amount of extracted
+	and total bytes
+	"""
 	f = os.path.join(package_dir, 'pack.zip')
 	if not os.path.exists(f):
 		return
 
+	staging = os.path.join(package_dir, STAGING_DIR)
+	remove_path(staging)
+
 	package_zip = zipfile.ZipFile(f, 'r')
+	try:
+		extract_package(package_zip, staging, progress)
+	finally:
+		package_zip.close()
 
+	swap_package(package_dir, staging)
+	os.remove(f)
+
+def extract_package(package_zip, dest_dir, progress=None):
+	"Streams files of given zip package into `dest_dir`"
 	root_level_paths = []
 	last_path = None
 	for path in package_zip.namelist():
@@ -156,21 +271,20 @@ def unpack_pyv8(package_dir):
 		if path.find('/') in [len(path) - 1, -1]:
 			root_level_paths.append(path)
 		if path[0] == '/' or path.find('../') != -1 or path.find('..\\') != -1:
-			raise 'The PyV8 package contains files outside of the package dir and cannot be safely installed.'
+			raise ValueError('The PyV8 package contains files outside of the package dir and cannot be safely installed.')
 
 	if last_path and len(root_level_paths) == 0:
 		root_level_paths.append(last_path[0:last_path.find('/') + 1])
 
-	prev_dir = os.getcwd()
-	os.chdir(package_dir)
-
-	clean_old_data()
-
 	# Here we don't use .extractall() since it was having issues on OS X
 	skip_root_dir = len(root_level_paths) == 1 and \
 		root_level_paths[0].endswith('/')
-	extracted_paths = []
-	for path in package_zip.namelist():
+
+	members = package_zip.infolist()
+	total = sum(info.file_size for info in members)
+	extracted = 0
+	for info in members:
+		path = info.filename
 		dest = path
 
 		if not is_python3:
@@ -183,8 +297,8 @@ def unpack_pyv8(package_dir):
 		if os.name == 'nt':
 			regex = ':|\*|\?|"|<|>|\|'
 			if re.search(regex, dest) != None:
-				print ('%s: Skipping file from package named %s due to ' +
-					'an invalid filename') % (__name__, path)
+				print('%s: Skipping file from package named %s due to '
+					'an invalid filename' % (__name__, path))
 				continue
 
 		# If there was only a single directory in the package, we remove
@@ -197,34 +311,74 @@ def unpack_pyv8(package_dir):
 		else:
 			dest = dest.replace('\\', '/')
 
-		dest = os.path.join(package_dir, dest)
-
-		def add_extracted_dirs(dir):
-			while dir not in extracted_paths:
-				extracted_paths.append(dir)
-				dir = os.path.dirname(dir)
-				if dir == package_dir:
-					break
+		dest = os.path.join(dest_dir, dest)
 
 		if path.endswith('/'):
 			if not os.path.exists(dest):
 				os.makedirs(dest)
-			add_extracted_dirs(dest)
-		else:
-			dest_dir = os.path.dirname(dest)
-			if not os.path.exists(dest_dir):
-				os.makedirs(dest_dir)
-			add_extracted_dirs(dest_dir)
-			extracted_paths.append(dest)
+			continue
+
+		dest_parent = os.path.dirname(dest)
+		if not os.path.exists(dest_parent):
+			os.makedirs(dest_parent)
+
+		try:
+			src = package_zip.open(info)
+			try:
+				with open(dest, 'wb') as fp:
+					read_chunks(src, output=fp)
+			finally:
+				src.close()
+		except (IOError, UnicodeDecodeError):
+			print('%s: Skipping file from package named %s due to '
+				'an invalid filename' % (__name__, path))
+
+		extracted += info.file_size
+		if progress:
+			progress(extracted, total)
+
+def swap_package(package_dir, staging):
+	"""
+	Replaces files of package directory with staged ones. Old files
+	are moved away first, so they don't mix with new package. Since
+	kept files (like loader config) stay in place, files are swapped
+	one by one rather than with a single directory rename: if any
+	rename fails, package directory is restored from moved away files
+	"""
+	trash = os.path.join(package_dir, TRASH_DIR)
+	remove_path(trash)
+	os.makedirs(trash)
+
+	moved = []
+	installed = []
+	try:
+		for name in os.listdir(package_dir):
+			if name.lower() in KEEP_FILES or name in (STAGING_DIR, TRASH_DIR):
+				continue
+			os.rename(os.path.join(package_dir, name), os.path.join(trash, name))
+			moved.append(name)
+
+		for name in os.listdir(staging):
+			replace_file(os.path.join(staging, name), os.path.join(package_dir, name))
+			installed.append(name)
+	except OSError as e:
+		# roll back: put old files back in place
+		restored = True
+		for name in installed:
+			remove_path(os.path.join(package_dir, name))
+		for name in moved:
 			try:
-				open(dest, 'wb').write(package_zip.read(path))
-			except (IOError, UnicodeDecodeError):
-				print ('%s: Skipping file from package named %s due to ' +
-					'an invalid filename') % (__name__, path)
-	package_zip.close()
+				replace_file(os.path.join(trash, name), os.path.join(package_dir, name))
+			except OSError as e:
+				restored = False
 
-	os.chdir(prev_dir)
-	os.remove(f)
+		remove_path(staging)
+		if restored:
+			remove_path(trash)
+		raise
+
+	remove_path(staging)
+	remove_path(trash)
 
 class LoaderDelegate():
 	"""
@@ -239,7 +393,11 @@ class LoaderDelegate():
 		pass
 
 	def on_progress(self, *args, **kwargs):
-		"Invoked on download progress"
+		"""
+		Invoked on download progress. Keyword arguments: `phase`
+		(`packages`, `binary` or `unpack`), amount of `received` bytes and
+		`total` size, if known
+		"""
 		pass
 
 	def on_complete(self, *args, **kwargs):
@@ -258,22 +416,45 @@ class LoaderDelegate():
 		pass
 
 class ThreadProgress():
+	"""
+	Dispatches events of loader thread to delegate and callbacks.
+	Events are received from loader's queue by a single thread,
+	which sleeps until loader reports progress or completion
+	"""
 	def __init__(self, thread, delegate, is_background=False):
 		self.thread = thread
 		self.delegate = delegate
 		self.is_background = is_background
 		self._callbacks = {}
-		threading.Timer(0, self.run).start()
+
+	def start(self):
+		t = threading.Thread(target=self.run)
+		t.daemon = True
+		t.start()
+		return self
 
 	def run(self):
-		if not self.thread.is_alive():
+		if not hasattr(self.thread, 'subscribe'):
+			# thread was created by a loader without event queue
+			self.thread.join()
 			if self.thread.exit_code != 0:
 				return self.trigger('error', exit_code=self.thread.exit_code, progress=self)
-				
+
 			return self.trigger('complete', result=self.thread.result, progress=self)
 
-		self.trigger('progress', progress=self)
-		threading.Timer(0.1, self.run).start()
+		events = self.thread.subscribe()
+		while True:
+			name, kwargs = events.get()
+			while name == 'progress':
+				# report the most recent progress only
+				try:
+					name, kwargs = events.get_nowait()
+				except queue.Empty:
+					break
+
+			self.trigger(name, progress=self, **kwargs)
+			if name != 'progress':
+				return
 
 	def on(self, event_name, callback):
 		if event_name not in self._callbacks:
@@ -307,9 +488,22 @@ class NonCleanExitError(Exception):
 
 
 class CliDownloader():
+	cancelled = False
+	proc = None
+
 	def __init__(self, settings):
 		self.settings = settings
 
+	def cancel(self):
+		"Stops download and kills running process"
+		self.cancelled = True
+		proc = self.proc
+		if proc and proc.poll() is None:
+			try:
+				proc.kill()
+			except OSError as e:
+				pass
+
 	def find_binary(self, name):
 		for dir in os.environ['PATH'].split(os.pathsep):
 			path = os.path.join(dir, name)
@@ -318,15 +512,28 @@ class CliDownloader():
 
 		raise BinaryNotFoundError('The binary %s could not be located' % name)
 
-	def execute(self, args):
-		proc = subprocess.Popen(args, stdin=subprocess.PIPE,
-			stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+	def execute(self, args, progress=None, dest=None, append=False):
+		"""
+		Runs given command and returns its output. If `dest` path
+		is given, output is written (or appended) into it and error
+		output is returned instead
+		"""
+		if not dest:
+			self.proc = proc = subprocess.Popen(args, stdin=subprocess.PIPE,
+				stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+			output = read_chunks(proc.stdout, progress)
+		else:
+			self.proc = proc = subprocess.Popen(args, stdin=subprocess.PIPE,
+				stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+			received = append and partial_size(dest)
+			with open(dest, append and 'ab' or 'wb') as fp:
+				read_chunks(proc.stdout, progress, output=fp, received=received)
+			output = proc.stderr.read()
 
-		output = proc.stdout.read()
 		returncode = proc.wait()
 		if returncode != 0:
 			error = NonCleanExitError(returncode)
-			error.output = output
+			error.output = output.decode('utf-8', 'replace') if is_python3 else output
 			raise error
 		return output
 
@@ -336,9 +543,10 @@ class WgetDownloader(CliDownloader):
 		self.wget = self.find_binary('wget')
 
 	def clean_tmp_file(self):
-		os.remove(self.tmp_file)
+		if os.path.exists(self.tmp_file):
+			os.remove(self.tmp_file)
 
-	def download(self, url, error_message, timeout, tries):
+	def download(self, url, error_message, timeout, tries, progress=None, dest=None, validators=None):
 		if not self.wget:
 			return False
 
@@ -356,45 +564,49 @@ class WgetDownloader(CliDownloader):
 		if self.settings.get('https_proxy'):
 			os.putenv('https_proxy', self.settings.get('https_proxy'))
 
-		while tries > 0:
-			tries -= 1
-			try:
-				result = self.execute(command)
-				self.clean_tmp_file()
-				return result
-			except NonCleanExitError as e:
-				error_line = ''
-				with open(self.tmp_file) as f:
-					for line in list(f):
-						if re.search('ERROR[: ]|failed: ', line):
-							error_line = line
-							break
-
-				if e.returncode == 8:
-					regex = re.compile('^.*ERROR (\d+):.*', re.S)
-					if re.sub(regex, '\\1', error_line) == '503':
-						# GitHub and BitBucket seem to rate limit via 503
-						print('%s: Downloading %s was rate limited, trying again' % (__name__, url))
-						continue
-					error_string = 'HTTP error ' + re.sub('^.*? ERROR ', '',
-						error_line)
-
-				elif e.returncode == 4:
-					error_string = re.sub('^.*?failed: ', '', error_line)
-					# GitHub and BitBucket seem to time out a lot
-					if error_string.find('timed out') != -1:
-						print('%s: Downloading %s timed out, trying again' % (__name__, url))
-						continue
-
-				else:
-					error_string = re.sub('^.*?(ERROR[: ]|failed: )', '\\1',
-						error_line)
-
-				error_string = re.sub('\\.?\s*\n\s*$', '', error_string)
-				print('%s: %s %s downloading %s.' % (__name__, error_message,
-						error_string, url))
+		try:
+			while tries > 0 and not self.cancelled:
+				tries -= 1
+				try:
+					result = self.execute(command, progress, dest)
+					return dest and True or result
+				except NonCleanExitError as e:
+					if self.cancelled:
+						break
+
+					error_line = ''
+					with open(self.tmp_file) as f:
+						for line in list(f):
+							if re.search('ERROR[: ]|failed: ', line):
+								error_line = line
+								break
+
+					if e.returncode == 8:
+						regex = re.compile('^.*ERROR (\d+):.*', re.S)
+						if re.sub(regex, '\\1', error_line) == '503':
+							# GitHub and BitBucket seem to rate limit via 503
+							print('%s: Downloading %s was rate limited, trying again' % (__name__, url))
+							continue
+						error_string = 'HTTP error ' + re.sub('^.*? ERROR ', '',
+							error_line)
+
+					elif e.returncode == 4:
+						error_string = re.sub('^.*?failed: ', '', error_line)
+						# GitHub and BitBucket seem to time out a lot
+						if error_string.find('timed out') != -1:
+							print('%s: Downloading %s timed out, trying again' % (__name__, url))
+							continue
+
+					else:
+						error_string = re.sub('^.*?(ERROR[: ]|failed: )', '\\1',
+							error_line)
+
+					error_string = re.sub('\\.?\s*\n\s*$', '', error_string)
+					print('%s: %s %s downloading %s.' % (__name__, error_message,
+							error_string, url))
+				break
+		finally:
 			self.clean_tmp_file()
-			break
 		return False
 
 
@@ -403,14 +615,12 @@ class CurlDownloader(CliDownloader):
 		self.settings = settings
 		self.curl = self.find_binary('curl')
 
-	def download(self, url, error_message, timeout, tries):
+	def download(self, url, error_message, timeout, tries, progress=None, dest=None, validators=None):
 		if not self.curl:
 			return False
 		command = [self.curl, '-f', '--user-agent', 'Emmet PyV8 Loader',
 			'--connect-timeout', str(int(timeout)), '-sSL']
 
-		command.append(url)
-
 		if self.settings.get('http_proxy'):
 			os.putenv('http_proxy', self.settings.get('http_proxy'))
 			if not self.settings.get('https_proxy'):
@@ -418,13 +628,31 @@ class CurlDownloader(CliDownloader):
 		if self.settings.get('https_proxy'):
 			os.putenv('HTTPS_PROXY', self.settings.get('https_proxy'))
 
-		while tries > 0:
+		while tries > 0 and not self.cancelled:
 			tries -= 1
+			offset = partial_size(dest)
 			try:
-				return self.execute(command)
+				if not dest:
+					return self.execute(command + [url], progress)
+
+				# resume partial download
+				resume = offset and ['-C', str(offset)] or []
+				self.execute(command + resume + [url], progress, dest, True)
+				return True
 			except NonCleanExitError as e:
+				if self.cancelled:
+					break
+
+				if e.returncode == 33 and offset:
+					# server doesn't support ranges: download from scratch
+					os.remove(dest)
+					tries += 1
+					continue
 				if e.returncode == 22:
 					code = re.sub('^.*?(\d+)\s*$', '\\1', e.output)
+					if code == '416' and offset:
+						# partial download is already complete
+						return True
 					if code == '503':
 						# GitHub and BitBucket seem to rate limit via 503
 						print('%s: Downloading %s was rate limited, trying again' % (__name__, url))
@@ -432,7 +660,7 @@ class CurlDownloader(CliDownloader):
 					error_string = 'HTTP error ' + code
 				elif e.returncode == 6:
 					error_string = 'URL error host not found'
-				elif e.returncode == 28:
+				elif e.returncode in (18, 28):
 					# GitHub and BitBucket seem to time out a lot
 					print('%s: Downloading %s timed out, trying again' % (__name__, url))
 					continue
@@ -445,10 +673,23 @@ class CurlDownloader(CliDownloader):
 
 
 class UrlLib2Downloader():
+	cancelled = False
+	response = None
+
 	def __init__(self, settings):
 		self.settings = settings
 
-	def download(self, url, error_message, timeout, tries):
+	def cancel(self):
+		"Stops download and closes connection"
+		self.cancelled = True
+		response = self.response
+		if response:
+			try:
+				response.close()
+			except Exception as e:
+				pass
+
+	def download(self, url, error_message, timeout, tries, progress=None, dest=None, validators=None):
 		http_proxy = self.settings.get('http_proxy')
 		https_proxy = self.settings.get('https_proxy')
 		if http_proxy or https_proxy:
@@ -473,15 +714,57 @@ class UrlLib2Downloader():
 		# 	handlers.append(VerifiedHTTPSHandler(ca_certs=bundle_path))
 		url_req.install_opener(url_req.build_opener(*handlers))
 
-		while tries > 0:
+		while tries > 0 and not self.cancelled:
 			tries -= 1
+			offset = partial_size(dest)
 			try:
-				request = url_req.Request(url, headers={"User-Agent":
-					"Emmet PyV8 Loader"})
-				http_file = url_req.urlopen(request, timeout=timeout)
-				return http_file.read()
+				headers = {"User-Agent": "Emmet PyV8 Loader"}
+				if validators:
+					# conditional request
+					if validators.get('etag'):
+						headers['If-None-Match'] = validators['etag']
+					if validators.get('last_modified'):
+						headers['If-Modified-Since'] = validators['last_modified']
+				if offset:
+					# resume partial download
+					headers['Range'] = 'bytes=%d-' % offset
+
+				request = url_req.Request(url, headers=headers)
+				self.response = http_file = url_req.urlopen(request, timeout=timeout)
+				total = http_file.info().get('Content-Length')
+				total = total and int(total)
+				if not dest:
+					result = read_chunks(http_file, progress, total)
+					if total and len(result) < total:
+						raise IOError('connection closed')
+
+					if validators is not None:
+						validators.clear()
+						info = http_file.info()
+						for k, h in [('etag', 'ETag'), ('last_modified', 'Last-Modified')]:
+							if info.get(h):
+								validators[k] = info.get(h)
+					return result
+
+				if http_file.getcode() != 206:
+					# server sends the whole file
+					offset = 0
+
+				with open(dest, offset and 'ab' or 'wb') as fp:
+					read_chunks(http_file, progress, total and total + offset, output=fp, received=offset)
+
+				if total and partial_size(dest) < total + offset:
+					raise IOError('connection closed')
+				return True
 
 			except url_err.HTTPError as e:
+				if e.code == 304 and validators:
+					return NOT_MODIFIED
+
+				if e.code == 416 and offset:
+					# partial download is already complete
+					return True
+
 				# Bitbucket and Github ratelimit using 503 a decent amount
 				if str(e.code) == '503':
 					print('%s: Downloading %s was rate limited, trying again' % (__name__, url))
@@ -495,9 +778,167 @@ class UrlLib2Downloader():
 					print('%s: Downloading %s timed out, trying again' % (__name__, url))
 					continue
 				print('%s: %s URL error %s downloading %s.' % (__name__, error_message, str(e.reason), url))
+
+			except (socket.error, IOError) as e:
+				# connection was interrupted: partial download is resumed
+				print('%s: Downloading %s was interrupted (%s), trying again' % (__name__, url, e))
+				continue
 			break
 		return False
 
+class HedgedDownloader():
+	"""
+	Downloads URL with a number of transports (downloaders). The first
+	transport is started immediately, the next one is started if there's
+	no result after hedge delay or if previous transport failed. The first
+	verified result wins, other transports are cancelled.
+	@param transports: List of `(name, downloader)` tuples
+	@param stats: Dict of average latency of transports, updated
+	after each download
+	"""
+	def __init__(self, transports, stats):
+		self.stats = stats
+		self.transports = sorted(transports, key=lambda t: self.stats.get(t[0], HEDGE_DELAY))
+
+	def hedge_delay(self, timeout):
+		latency = self.stats.get(self.transports[0][0])
+		if latency is None:
+			return HEDGE_DELAY
+
+		return min(max(latency * 2, 1), timeout)
+
+	def record(self, name, latency):
+		"Updates average latency of given transport"
+		prev = self.stats.get(name)
+		if prev is not None:
+			latency = prev * 0.7 + latency * 0.3
+
+		self.stats[name] = round(latency, 3)
+
+	def download(self, url, error_message, timeout, tries, progress=None, dest=None, validators=None, verify=None):
+		"""
+		Downloads given URL. Accepts the same arguments as downloaders,
+		plus `verify` function which receives downloaded data (or `dest`
+		path) and returns `False` if it's invalid.
+		First started transport downloads into `dest` so it can resume
+		partial download, other transports use their own files
+		"""
+		results = queue.Queue()
+		pending = list(self.transports)
+		running = {}
+		received = {}
+
+		def report(name, amount, total):
+			received[name] = amount
+			if progress and amount >= max(received.values()):
+				progress(amount, total)
+
+		def start():
+			name, downloader = pending.pop(0)
+			target = dest
+			if dest and running:
+				target = '%s.%s%s' % (os.path.splitext(dest)[0], name, os.path.splitext(dest)[1])
+
+			task = {
+				'downloader': downloader,
+				'dest': target,
+				'validators': dict(validators) if validators is not None else None,
+				'start': time.time(),
+				'first_byte': None
+			}
+
+			def on_progress(amount, total=None):
+				if task['first_byte'] is None:
+					task['first_byte'] = time.time() - task['start']
+				report(name, amount, total)
+
+			def run():
+				try:
+					result = downloader.download(url, error_message, timeout, tries,
+						on_progress, task['dest'], task['validators'])
+				except Exception as e:
+					print('%s: %s error %s downloading %s.' % (__name__, name, e, url))
+					result = False
+
+				results.put((name, result))
+
+			running[name] = task
+			task['thread'] = t = threading.Thread(target=run)
+			t.daemon = True
+			t.start()
+
+		def latency(task):
+			return task['first_byte'] if task['first_byte'] is not None else time.time() - task['start']
+
+		start()
+		winner = None
+		while running:
+			try:
+				name, result = results.get(True, self.hedge_delay(timeout)) if pending else results.get()
+			except queue.Empty:
+				start()
+				continue
+
+			task = running.pop(name)
+			if result:
+				if result is NOT_MODIFIED or not verify or verify(task['dest'] or result):
+					self.record(name, latency(task))
+					winner = (task, result)
+					break
+
+				# invalid response
+				remove_path(task['dest'] or '')
+
+			# failed transport is penalized with timeout
+			self.record(name, max(latency(task), timeout))
+			if pending:
+				start()
+
+		for name, task in running.items():
+			# cancel may block until pending read is finished
+			t = threading.Thread(target=task['downloader'].cancel)
+			t.daemon = True
+			t.start()
+			if task['first_byte'] is not None:
+				# latency of loser is known only if it received
+				# some data, otherwise it may look faster than winner
+				self.record(name, latency(task))
+			if task['dest'] != dest:
+				remove_path(task['dest'])
+
+		if not winner:
+			return False
+
+		task, result = winner
+		if validators is not None and result is not NOT_MODIFIED:
+			# transports that don't support conditional requests
+			# leave validators intact: they're outdated now
+			updated = task['validators'] if task['validators'] != validators else {}
+			validators.clear()
+			validators.update(updated)
+
+		if dest:
+			if task['dest'] != dest:
+				primary = [loser for loser in running.values() if loser['dest'] == dest]
+				if primary:
+					# cancelled transport may still write into `dest`:
+					# wait until it's finished before replacing file
+					primary[0]['thread'].join(timeout)
+					if primary[0]['thread'].is_alive():
+						print('%s: Unable to stop downloading %s into %s' % (__name__, url, dest))
+						remove_path(task['dest'])
+						return False
+
+				try:
+					replace_file(task['dest'], dest)
+				except OSError as e:
+					print('%s: Unable to replace %s: %s' % (__name__, dest, e))
+					remove_path(task['dest'])
+					return False
+			return True
+
+		return result
+
 class PyV8Loader(threading.Thread):
 	def __init__(self, arch, download_path, config, delegate=None):
 		self.arch = arch
@@ -507,52 +948,142 @@ class PyV8Loader(threading.Thread):
 		self.result = None
 		self.delegate = delegate or LoaderDelegate()
 		self.is_pyv8_thread = True
+		self._listeners = []
+		self._final_event = None
+		self._lock = threading.Lock()
 
 		threading.Thread.__init__(self)
 		self.delegate.log('Creating thread')
 
-	def download_url(self, url, error_message):
-		# TODO add settings
+	def subscribe(self):
+		"""
+		Returns queue that receives loader events as `(name, kwargs)`
+		tuples. The last event is either `complete` or `error`
+		"""
+		events = queue.Queue()
+		with self._lock:
+			if self._final_event:
+				events.put(self._final_event)
+			else:
+				self._listeners.append(events)
+
+		return events
+
+	def emit(self, name, **kwargs):
+		event = (name, kwargs)
+		with self._lock:
+			listeners = list(self._listeners)
+			if name != 'progress':
+				self._final_event = event
+				self._listeners = []
+
+		for events in listeners:
+			events.put(event)
+
+	def reporter(self, phase):
+		"Returns callback that reports download progress of given phase"
+		def report(received, total=None):
+			self.emit('progress', phase=phase, received=received, total=total)
+
+		return report
+
+	def get_transports(self, url):
+		"Returns list of available downloaders for given URL as `(name, downloader)` tuples"
+		settings = self.delegate.settings
 		has_ssl = 'ssl' in sys.modules and hasattr(url_req, 'HTTPSHandler')
 		is_ssl = re.search('^https://', url) != None
 
+		transports = []
 		if (is_ssl and has_ssl) or not is_ssl:
-			downloader = UrlLib2Downloader(self.delegate.settings)
-		else:
-			for downloader_class in [CurlDownloader, WgetDownloader]:
-				try:
-					downloader = downloader_class(self.delegate.settings)
-					break
-				except BinaryNotFoundError:
-					pass
+			transports.append(('urllib', UrlLib2Downloader(settings)))
+
+		for name, downloader_class in [('curl', CurlDownloader), ('wget', WgetDownloader)]:
+			try:
+				transports.append((name, downloader_class(settings)))
+			except BinaryNotFoundError:
+				pass
+
+		return transports
 
-		if not downloader:
+	def download_url(self, url, error_message, progress=None, dest=None, validators=None, verify=None):
+		transports = self.get_transports(url)
+		if not transports:
 			self.delegate.log('Unable to download PyV8 binary due to invalid downloader')
 			return False
 
+		if 'transport_latency' not in self.config:
+			self.config['transport_latency'] = {}
+
 		timeout = self.delegate.settings.get('timeout', 60)
 		# timeout = 3
-		return downloader.download(url.replace(' ', '%20'), error_message, timeout, 3)
+		downloader = HedgedDownloader(transports, self.config['transport_latency'])
+		return downloader.download(url.replace(' ', '%20'), error_message, timeout, 3,
+			progress, dest, validators, verify)
 
 	def run(self):
-		# get list of available packages first
+		try:
+			self._run()
+		except Exception as e:
+			self.delegate.log('Unable to load PyV8 binary: %s' % e)
+			self.exit_code = 6
+		finally:
+			if self.exit_code != 0:
+				self.emit('error', exit_code=self.exit_code)
+			else:
+				self.emit('complete', result=self.result)
+
+	def load_packages(self):
+		"""
+		Returns list of available packages. List is cached for current
+		session and stored in loader config with validators of response,
+		so it's requested conditionally and isn't downloaded again if
+		it wasn't modified
+		"""
+		global packages_cache
+		if packages_cache and time.time() < packages_cache[0] + CHECK_INTERVAL:
+			return packages_cache[1]
+
+		manifest = self.config.get('manifest') or {}
+		validators = {}
+		if manifest.get('packages'):
+			for k in ['etag', 'last_modified']:
+				if manifest.get(k):
+					validators[k] = manifest[k]
+
 		self.delegate.log('Loading %s' % PACKAGES_URL)
+		packages = self.download_url(PACKAGES_URL, 'Unable to download packages list.',
+			self.reporter('packages'), validators=validators, verify=is_packages_list)
+
+		if packages is NOT_MODIFIED:
+			self.delegate.log('Packages list is not modified')
+			files = manifest['packages']
+		elif not packages:
+			return None
+		else:
+			if isinstance(packages, bytes):
+				packages = packages.decode('utf-8')
+
+			# keep only data required by loader
+			files = [{'name': f['name'], 'sha': f['sha']} for f in json.loads(packages)]
+			manifest = dict(validators, packages=files)
+			self.config['manifest'] = manifest
+
+		packages_cache = (time.time(), files)
+		return files
+
+	def _run(self):
+		# get list of available packages first
 		try:
-			packages = self.download_url(PACKAGES_URL, 'Unable to download packages list.')
+			files = self.load_packages()
 		except Exception as e:
 			self.delegate.log('Unable to download file: %s' % e)
 			self.exit_code = 4
 			return
 
-		if not packages:
+		if not files:
 			self.exit_code = 1
 			return
 
-		if isinstance(packages, bytes):
-			packages = packages.decode('utf-8')
-
-		files = json.loads(packages)
-
 		# find package for current architecture
 		cur_item = None
 		bundle_name = 'pyv8-%s.zip' % self.arch
@@ -570,13 +1101,6 @@ class PyV8Loader(threading.Thread):
 			self.delegate.log('You have the most recent PyV8 binary')
 			return
 
-		url = 'https://raw.github.com/emmetio/pyv8-binaries/master/%s' % cur_item['name']
-		self.delegate.log('Loading PyV8 binary from %s' % url)
-		package = self.download_url(url, 'Unable to download package from %s' % url)
-		if not package:
-			self.exit_code = 3
-			return
-
 		# we should only save downloaded package and delegate module
 		# loading/unloading to main thread since improper PyV8 unload
 		# may cause editor crash
@@ -584,11 +1108,32 @@ class PyV8Loader(threading.Thread):
 			os.makedirs(self.download_path)
 		except Exception as e:
 			pass
-		
-		fp = open(os.path.join(self.download_path, 'pack.zip'), 'wb')
-		fp.write(package)
-		fp.close()
 
+		# package is downloaded into partial file, named after
+		# package sha, so interrupted download can be resumed
+		part_name = 'pack-%s.part' % cur_item['sha']
+		for f in os.listdir(self.download_path):
+			if f.endswith('.part') and f != part_name:
+				os.remove(os.path.join(self.download_path, f))
+
+		part_path = os.path.join(self.download_path, part_name)
+		url = BINARY_URL % cur_item['name']
+		self.delegate.log('Loading PyV8 binary from %s' % url)
+		corrupted = []
+		def verify(path):
+			if git_blob_sha(path) == cur_item['sha']:
+				return True
+
+			self.delegate.log('Downloaded PyV8 binary is corrupted')
+			corrupted.append(path)
+			return False
+
+		if not self.download_url(url, 'Unable to download package from %s' % url,
+			self.reporter('binary'), part_path, verify=verify):
+			self.exit_code = corrupted and 5 or 3
+			return
+
+		replace_file(part_path, os.path.join(self.download_path, 'pack.zip'))
 		self.result = cur_item['sha']
 		# Done!
 		
@@ -14,9 +14,17 @@ mods_load_order = [
 	'emmet.semver',
 	'emmet.pyv8loader',
 	'emmet_completions.trackers',
+	'emmet_completions.tables',
+	'emmet_completions.trie',
+	'emmet_completions.cache',
 	'emmet_completions.meta',
 	'emmet_completions',
+	'emmet.snapshot',
+	'emmet.httpcache',
+	'emmet.imagesize',
 	'emmet.file',
+	'emmet.ciu',
+	'emmet.tagindex',
 	'emmet.context'
 ]
 
@@ -0,0 +1,113 @@
+# coding=utf-8
+"""
+Warm start snapshots for Emmet JS core.
+
+Some resources, loaded into JS context on startup, are very expensive
+to parse: for example, Can I Use database is ~500 KB of JSON that is
+reduced to a tiny lookup table by Emmet core. Snapshot keeps
+such post-bootstrap state on disk, keyed by hash of source files,
+so the next context creation can rehydrate it instead of parsing
+everything again.
+"""
+import os
+import os.path
+import json
+import codecs
+import hashlib
+
+# Increment this number every time snapshot data format is changed
+SNAPSHOT_VERSION = 2
+
+def resource_key(*sources):
+	"Returns hash key for given list of resource contents"
+	h = hashlib.sha1()
+	h.update(('v%d' % SNAPSHOT_VERSION).encode('utf-8'))
+	for s in sources:
+		if not isinstance(s, bytes):
+			s = s.encode('utf-8')
+		h.update(s)
+
+	return h.hexdigest()
+
+def file_stamp(file_path):
+	"""
+	Returns stamp (size and modification time) of given file.
+	If file is located inside archive (like .sublime-package),
+	stamp of archive is used. Returns `None` if stamp can't be
+	obtained
+	"""
+	p = file_path
+	while not os.path.exists(p):
+		parent = os.path.dirname(p)
+		if not parent or parent == p:
+			return None
+		p = parent
+
+	if p != file_path and not os.path.isfile(p):
+		return None
+
+	st = os.stat(p)
+	return '%s:%d:%d' % (file_path, st.st_size, int(st.st_mtime))
+
+def atomic_write(file_path, data):
+	"Writes given binary data into file as a single operation"
+	dirname = os.path.dirname(file_path)
+	if not os.path.exists(dirname):
+		os.makedirs(dirname)
+
+	tmp = '%s.tmp' % file_path
+	with open(tmp, 'wb') as fd:
+		fd.write(data)
+
+	# Windows doesn't allow to rename file into existing one
+	if os.path.exists(file_path):
+		os.remove(file_path)
+	os.rename(tmp, file_path)
+
+class Snapshot():
+	"""
+	On-disk storage of warm start snapshot.
+	@param path: Directory where snapshot files should be stored
+	"""
+	def __init__(self, path, name='snapshot.json'):
+		self.path = path
+		self.name = name
+
+	def file_path(self):
+		return os.path.join(self.path, self.name)
+
+	def load(self, key):
+		"""
+		Returns snapshot payload for given key or `None` if there's no
+		valid snapshot. Payload is returned as-is, e.g. as a string
+		that should be passed to JS context
+		"""
+		f = self.file_path()
+		if not os.path.exists(f):
+			return None
+
+		try:
+			with codecs.open(f, 'r', 'utf-8') as fd:
+				header = json.loads(fd.readline())
+				if header.get('version') != SNAPSHOT_VERSION or header.get('key') != key:
+					return None
+
+				return fd.read()
+		except Exception as e:
+			return None
+
+	def save(self, key, payload):
+		"""
+		Saves snapshot payload for given key. Snapshot is stored
+		as a JSON header line followed by payload string
+		"""
+		header = json.dumps({
+			'version': SNAPSHOT_VERSION,
+			'key': key
+		})
+		atomic_write(self.file_path(), ('%s\n%s' % (header, payload)).encode('utf-8'))
+
+	def clear(self):
+		f = self.file_path()
+		if os.path.exists(f):
+			os.remove(f)
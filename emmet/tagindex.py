@@ -0,0 +1,220 @@
+# coding=utf-8
+"""
+Tag pair index of HTML document.
+
+Emmet’s HTML matcher parses document from caret position every time
+it’s invoked, which is slow on large documents. Tag index tokenizes
+document once and pairs tags exactly like HTML matcher does, so
+tag pair for any position can be found with binary search.
+
+Index is updated incrementally: edits that don't touch any tag are
+recorded as offset shifts and applied on query, so index doesn't have
+to be rebuilt on every keystroke.
+"""
+import re
+from bisect import bisect_left, bisect_right
+
+# Same expressions as in Emmet’s HTML matcher
+re_token = re.compile(r'''
+	(?P<comment><!(?=--).*?-->)
+	| <(?P<open>[A-Za-z0-9_:\-]+)(?:\s+[A-Za-z0-9_\-.@:]+(?:\s*=\s*(?:"[^"]*"|'[^']*'|[^>\s]+))?)*\s*(?P<self>/?)>
+	| </(?P<close>[A-Za-z0-9_:\-]+)[^>]*>
+	| (?P<stray><)
+''', re.S | re.X)
+
+OPEN = 1
+CLOSE = 2
+SELF_CLOSE = 3
+COMMENT = 4
+# angle bracket that doesn't start any tag
+STRAY = 5
+
+# Maximum amount of recorded edits before offsets are recalculated
+MAX_EDITS = 64
+
+class TagIndex(object):
+	"""
+	Index of tag tokens of given text. Every token is stored in
+	parallel lists, sorted by token start
+	"""
+	def __init__(self, text):
+		self.starts = []
+		self.ends = []
+		self.kinds = []
+		self.names = []
+		# index of paired token or -1
+		self.pairs = []
+		# index of open token which was on top of stack when token
+		# was found or -1
+		self.parents = []
+		self.edits = []
+		self.size = len(text)
+		self._parse(text)
+
+	def _parse(self, text):
+		stack = []
+		for m in re_token.finditer(text):
+			ix = len(self.starts)
+			name = m.group('open') or m.group('close')
+			if m.group('open'):
+				kind = SELF_CLOSE if m.group('self') else OPEN
+			elif m.group('close'):
+				kind = CLOSE
+			elif m.group('comment'):
+				kind = COMMENT
+			else:
+				kind = STRAY
+
+			self.starts.append(m.start())
+			self.ends.append(m.end())
+			self.kinds.append(kind)
+			self.names.append(name)
+			self.pairs.append(-1)
+
+			if kind == CLOSE:
+				# pair closing tag like HTML matcher does: all unmatched
+				# tags above matched one are considered unclosed
+				while stack:
+					top = stack.pop()
+					if self.names[top] == name:
+						self.pairs[top] = ix
+						self.pairs[ix] = top
+						break
+
+			self.parents.append(stack[-1] if stack else -1)
+			if kind == OPEN:
+				stack.append(ix)
+
+	def _to_current(self, pt, is_end=False):
+		"Translates indexed offset to current document offset"
+		for pos, delta in self.edits:
+			if pt > pos or (pt == pos and not is_end):
+				pt += delta
+		return pt
+
+	def _to_indexed(self, pt):
+		"Translates current document offset to indexed one"
+		for pos, delta in reversed(self.edits):
+			if pt >= pos + delta:
+				pt -= delta
+			elif pt > pos:
+				# inside inserted text
+				pt = pos
+		return pt
+
+	def _token(self, ix):
+		return self._to_current(self.starts[ix]), self._to_current(self.ends[ix], True)
+
+	def _contains(self, ix, pt):
+		end = self.ends[ix]
+		if self.kinds[ix] == OPEN and self.pairs[ix] != -1:
+			end = self.ends[self.pairs[ix]]
+		return self.starts[ix] < pt < end
+
+	def in_comment(self, pt):
+		"Check if given position is inside comment"
+		pt = self._to_indexed(pt)
+		ix = bisect_right(self.starts, pt) - 1
+		return ix >= 0 and self.kinds[ix] == COMMENT and pt < self.ends[ix]
+
+	def tag(self, pt):
+		"""
+		Returns innermost tag for given position as `(name, open, close)`
+		tuple, where `open` and `close` are `(start, end)` tuples of tag
+		ranges. `close` is `None` for unclosed and self-closing tags.
+		Returns `None` if there's no tag at given position
+		"""
+		pt = self._to_indexed(pt)
+		ix = bisect_left(self.starts, pt) - 1
+		if ix >= 0 and self.kinds[ix] == CLOSE and self.pairs[ix] != -1:
+			# closing tag: start with its own pair
+			ix = self.pairs[ix]
+		elif ix >= 0 and self.kinds[ix] not in (OPEN, SELF_CLOSE):
+			ix = self.parents[ix]
+
+		while ix != -1 and not self._contains(ix, pt):
+			ix = self.parents[ix]
+
+		if ix == -1:
+			return None
+
+		pair = self.pairs[ix]
+		return (self.names[ix], self._token(ix),
+			self._token(pair) if pair != -1 else None)
+
+	def edit(self, begin, end, text):
+		"""
+		Records replacement of `begin:end` region of current document
+		with given text. Returns `False` if edit changes tokens so
+		index should be rebuilt
+		"""
+		if '<' in text or '>' in text:
+			return False
+
+		a = self._to_indexed(begin)
+		b = self._to_indexed(end)
+		# tokens don't overlap so they're sorted by end as well
+		ix = bisect_left(self.starts, b) - 1
+		if ix >= 0 and (self.ends[ix] > a or self.kinds[ix] == STRAY):
+			# edit touches token or may complete unfinished tag
+			return False
+
+		delta = len(text) - (end - begin)
+		self.size += delta
+		if delta:
+			self.edits.append((end, delta))
+			if len(self.edits) > MAX_EDITS:
+				self._apply_edits()
+
+		return True
+
+	def _apply_edits(self):
+		self.starts = [self._to_current(pt) for pt in self.starts]
+		self.ends = [self._to_current(pt, True) for pt in self.ends]
+		self.edits = []
+
+class TagIndexCache(object):
+	"""
+	Tag indexes of documents, keyed by document id. Index is rebuilt
+	when stamp of document (like change count) doesn't match the one
+	index was created or updated for
+	"""
+	def __init__(self):
+		self._items = {}
+
+	def get(self, key, stamp):
+		"""
+		Returns index for given document or `None` if there's no index
+		for given document stamp
+		"""
+		item = self._items.get(key)
+		if item is not None and item[0] == stamp:
+			return item[1]
+
+	def put(self, key, stamp, index):
+		self._items[key] = (stamp, index)
+
+	def edit(self, key, stamp, size, changes):
+		"""
+		Updates index of given document with list of `(begin, end, text)`
+		changes. `stamp` and `size` describe document after changes.
+		Index is dropped if it can't be updated
+		"""
+		item = self._items.get(key)
+		if item is None:
+			return
+
+		index = item[1]
+		for begin, end, text in changes:
+			if not index.edit(begin, end, text):
+				break
+		else:
+			if index.size == size:
+				self._items[key] = (stamp, index)
+				return
+
+		self.drop(key)
+
+	def drop(self, key):
+		if key in self._items:
+			del self._items[key]
@@ -2,7 +2,9 @@ import sys
 import sublime
 import sublime_plugin
 
-from trackers import back_track, track_regex, track_scope
+from trackers import back_track, back_stages, last_region, track_regex, track_scope, BACK
+from trie import CompletionIndex
+from cache import LRUCache
 
 __authors__     = ['"Sergey Chikuyonok" <serge.che@gmail.com>'
 				   '"Nicholas Dudfield" <ndudfield@gmail.com>']
@@ -34,9 +36,18 @@ def find_tag_name(view, start_pt):
 	return name
 
 def find_attribute_name(view, start_pt):
-	conds   = track_scope('string'), track_regex('\s|='), track_regex('\S')
-	regions = back_track(view, start_pt, *conds)
-	return view.substr(regions[-1])
+	stages = back_stages(track_scope('string'), track_regex('\s|='), track_regex('\S'))
+	region = last_region(view, start_pt - 1, *stages)
+	return view.substr(region) if region else ''
+
+def find_typed_prefix(view, start_pt, stop=r'[\s"\'=<>/]'):
+	"""
+	Returns text typed before given point, up to `stop` character.
+	Unlike completion prefix, passed by Sublime, it isn't cut at word
+	separators like `-` or `:`
+	"""
+	region = last_region(view, start_pt - 1, (BACK, track_regex(stop, False)))
+	return view.substr(region) if region else ''
 
 def remove_html_completions():
     for completer in "TagCompletions", "HtmlCompletions":
@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+#coding: utf8
+################################################################################
+
+class LRUCache(object):
+    """
+    Bounded cache that evicts least recently used entries. Keeps hit/miss
+    counters to help tuning cache size. Recency is tracked with a plain
+    list since `OrderedDict` isn't available in Python 2.6 (ST2); cache
+    is small, so list updates are cheap
+    """
+    def __init__(self, size=64):
+        self.size    = size
+        self.hits    = 0
+        self.misses  = 0
+        self._data   = {}
+        # keys from least to most recently used
+        self._order  = []
+
+    def get(self, key, default=None):
+        if key not in self._data:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        # move entry to the end of queue
+        self._order.remove(key)
+        self._order.append(key)
+        return self._data[key]
+
+    def set(self, key, value):
+        if key in self._data:
+            self._order.remove(key)
+        elif len(self._data) >= self.size:
+            del self._data[self._order.pop(0)]
+
+        self._data[key] = value
+        self._order.append(key)
+
+    def clear(self):
+        self._data.clear()
+        del self._order[:]
+
+    def stats(self):
+        return {
+            'size'  : len(self._data),
+            'hits'  : self.hits,
+            'misses': self.misses
+        }
+
+    def __len__(self):
+        return len(self._data)
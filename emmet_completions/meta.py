@@ -1,3246 +1,1712 @@
+# coding=utf-8
+# DO NOT EDIT: generated by misc/generate-meta.py from misc/completions-meta.json
+from tables import CompactTable
+
 CSS_PSEUDO_CLASSES = [
-  'active',
-  'checked',
-  'disabled',
-  'empty',
-  'enabled',
-  'first-child',
-  'first-of-type',
-  'focus',
-  'hover',
-  'indeterminate',
-  'last-child',
-  'last-of-type',
-  'link',
-  'lang(|)',
-  'not(|)',
-  'nth-child(|)',
-  'nth-last-child(|)',
-  'nth-last-of-type(|)',
-  'nth-of-type(|)',
-  'only-child',
-  'only-of-type',
-  'root',
-  'target',
-  'visited']
+ "active",
+ "checked",
+ "disabled",
+ "empty",
+ "enabled",
+ "first-child",
+ "first-of-type",
+ "focus",
+ "hover",
+ "indeterminate",
+ "last-child",
+ "last-of-type",
+ "link",
+ "lang(|)",
+ "not(|)",
+ "nth-child(|)",
+ "nth-last-child(|)",
+ "nth-last-of-type(|)",
+ "nth-of-type(|)",
+ "only-child",
+ "only-of-type",
+ "root",
+ "target",
+ "visited"
+]
 
-CSS_PROP_VALUES = {'-moz-binding': [],
- '-moz-border-bottom-colors': [],
- '-moz-border-left-colors': [],
- '-moz-border-radius': [],
- '-moz-border-radius-bottomleft': [],
- '-moz-border-radius-bottomright': [],
- '-moz-border-radius-topleft': [],
- '-moz-border-radius-topright': [],
- '-moz-border-right-colors': [],
- '-moz-border-top-colors': [],
- '-moz-opacity': [],
- '-moz-outline': ['#ffffff',
-                  'dashed',
-                  'dotted',
-                  'double',
-                  'groove',
-                  'hidden',
-                  'inherit',
-                  'inset',
-                  'medium',
-                  'none',
-                  'outset',
-                  'ridge',
-                  'solid',
-                  'thick',
-                  'thin'],
- '-moz-outline-color': [],
- '-moz-outline-style': ['dashed',
-                        'dotted',
-                        'double',
-                        'groove',
-                        'hidden',
-                        'inherit',
-                        'inset',
-                        'none',
-                        'outset',
-                        'ridge',
-                        'solid'],
- '-moz-outline-width': ['*', 'inherit', 'medium', 'thick', 'thin'],
- '-moz-user-focus': ['auto', 'ignore', 'inherit', 'none', 'normal'],
- '-moz-user-input': ['auto', 'disabled', 'enabled', 'inherit', 'none'],
- '-moz-user-modify': ['inherit', 'read-only', 'read-write', 'write-only'],
- '-moz-user-select': ['all',
-                      'element',
-                      'elements',
-                      'inherit',
-                      'none',
-                      'text',
-                      'toggle',
-                      'tri-state'],
- '-o-link': [],
- '-o-link-source': ['current', 'next', 'none'],
- 'accelerator': ['false', 'inherit', 'true'],
- 'alignment-adjust': ['<length>',
-                      '<percentage>',
-                      'after-edge',
-                      'alphabetic',
-                      'auto',
-                      'baseline',
-                      'before-edge ',
-                      'central',
-                      'hanging',
-                      'ideographic',
-                      'mathematical',
-                      'middle',
-                      'text-after-edge',
-                      'text-before-edge'],
- 'alignment-baseline': ['after-edge',
-                        'alphabetic',
-                        'baseline',
-                        'before-edge',
-                        'central',
-                        'hanging',
-                        'ideographic',
-                        'mathematical',
-                        'middle',
-                        'text-after-edge',
-                        'text-before-edge',
-                        'use-script'],
- 'animation': [],
- 'animation-delay': [],
- 'animation-direction': ['alternate', 'normal'],
- 'animation-duration': [],
- 'animation-iteration-count': [],
- 'animation-name': [],
- 'animation-play-state': [],
- 'appearance': [],
- 'azimuth': ['*',
-             'behind',
-             'center',
-             'center-left',
-             'center-right',
-             'far-left',
-             'far-right',
-             'inherit',
-             'left',
-             'left-side',
-             'leftwards',
-             'right',
-             'right-side',
-             'rightwards'],
- 'background': ['#ffffff',
-                '*',
-                'bottom',
-                'center',
-                'fixed',
-                'inherit',
-                'left',
-                'no-repeat',
-                'none',
-                'repeat',
-                'repeat-x',
-                'repeat-y',
-                'right',
-                'scroll',
-                'top',
-                'url(image-url.gif)'],
- 'background-attachment': ['fixed', 'inherit', 'scroll'],
- 'background-clip': ['border-box', 'padding-box'],
- 'background-color': [],
- 'background-image': [],
- 'background-origin': ['border-box', 'content-box', 'padding-box'],
- 'background-position': ['*', 'bottom', 'center', 'left', 'right', 'top'],
- 'background-position-x': ['*', 'center', 'left', 'right'],
- 'background-position-y': ['*', 'bottom', 'center', 'top'],
- 'background-repeat': ['no-repeat', 'repeat', 'repeat-x', 'repeat-y'],
- 'background-size': ['contain', 'cover'],
- 'baseline-shift': ['<length>', '<percentage>', 'baseline', 'sub', 'super'],
- 'binding': ['<uri>', 'none'],
- 'bookmark-label': [],
- 'bookmark-level': [],
- 'bookmark-target': [],
- 'border': ['#ffffff',
-            '*',
-            'dashed',
-            'dotted',
-            'double',
-            'groove',
-            'hidden',
-            'inherit',
-            'inset',
-            'medium',
-            'none',
-            'outset',
-            'ridge',
-            'solid',
-            'thick',
-            'thin'],
- 'border-bottom': ['#ffffff',
-                   '*',
-                   'dashed',
-                   'dotted',
-                   'double',
-                   'groove',
-                   'hidden',
-                   'inherit',
-                   'inset',
-                   'medium',
-                   'none',
-                   'outset',
-                   'ridge',
-                   'solid',
-                   'thick',
-                   'thin'],
- 'border-bottom-color': [],
- 'border-bottom-left-radius': [],
- 'border-bottom-right-radius': [],
- 'border-bottom-style': ['dashed',
-                         'dotted',
-                         'double',
-                         'groove',
-                         'hidden',
-                         'inherit',
-                         'inset',
-                         'none',
-                         'outset',
-                         'ridge',
-                         'solid'],
- 'border-bottom-width': ['*', 'inherit', 'medium', 'thick', 'thin'],
- 'border-collapse': ['collapse', 'inherit', 'separate'],
- 'border-color': [],
- 'border-left': ['#ffffff',
-                 '*',
-                 'dashed',
-                 'dotted',
-                 'double',
-                 'groove',
-                 'hidden',
-                 'inherit',
-                 'inset',
-                 'medium',
-                 'none',
-                 'outset',
-                 'ridge',
-                 'solid',
-                 'thick',
-                 'thin'],
- 'border-left-color': [],
- 'border-left-style': ['dashed',
-                       'dotted',
-                       'double',
-                       'groove',
-                       'hidden',
-                       'inherit',
-                       'inset',
-                       'none',
-                       'outset',
-                       'ridge',
-                       'solid'],
- 'border-left-width': ['*', 'inherit', 'medium', 'thick', 'thin'],
- 'border-length': [],
- 'border-radius': [],
- 'border-right': ['#ffffff',
-                  '*',
-                  'dashed',
-                  'dotted',
-                  'double',
-                  'groove',
-                  'hidden',
-                  'inherit',
-                  'inset',
-                  'medium',
-                  'none',
-                  'outset',
-                  'ridge',
-                  'solid',
-                  'thick',
-                  'thin'],
- 'border-right-color': [],
- 'border-right-style': ['dashed',
-                        'dotted',
-                        'double',
-                        'groove',
-                        'hidden',
-                        'inherit',
-                        'inset',
-                        'none',
-                        'outset',
-                        'ridge',
-                        'solid'],
- 'border-right-width': ['*', 'inherit', 'medium', 'thick', 'thin'],
- 'border-spacing': [],
- 'border-style': ['dashed',
-                  'dotted',
-                  'double',
-                  'groove',
-                  'hidden',
-                  'inherit',
-                  'inset',
-                  'none',
-                  'outset',
-                  'ridge',
-                  'solid'],
- 'border-top': ['#ffffff',
-                '*',
-                'dashed',
-                'dotted',
-                'double',
-                'groove',
-                'hidden',
-                'inherit',
-                'inset',
-                'medium',
-                'none',
-                'outset',
-                'ridge',
-                'solid',
-                'thick',
-                'thin'],
- 'border-top-color': [],
- 'border-top-left-radius': [],
- 'border-top-right-radius': [],
- 'border-top-style': ['dashed',
-                      'dotted',
-                      'double',
-                      'groove',
-                      'hidden',
-                      'inherit',
-                      'inset',
-                      'none',
-                      'outset',
-                      'ridge',
-                      'solid'],
- 'border-top-width': ['*', 'inherit', 'medium', 'thick', 'thin'],
- 'border-width': ['*', 'inherit', 'medium', 'thick', 'thin'],
- 'bottom': ['*', 'auto', 'inherit'],
- 'box-align': ['baseline ', 'center', 'end', 'start', 'stretch'],
- 'box-direction': ['normal', 'reverse'],
- 'box-flex': [],
- 'box-flex-group': [],
- 'box-lines': ['multiple', 'single'],
- 'box-ordinal-group': [],
- 'box-orient': ['block-axis', 'horizontal', 'inline-axis', 'vertical'],
- 'box-pack': ['center', 'end', 'justify', 'start'],
- 'box-sizing': ['border-box', 'content-box'],
- 'caption-side': ['bottom', 'inherit', 'left', 'right', 'top'],
- 'clear': ['all', 'both', 'inherit', 'left', 'none', 'right'],
- 'clip': ['*', 'auto', 'inherit'],
- 'color': [],
- 'color-profile': ['<name>', '<url>', 'auto', 'sRGB'],
- 'column-count': ['<integer>', 'auto'],
- 'column-fill': ['auto', 'balance'],
- 'column-gap': ['<length>', 'normal'],
- 'column-rule-color': [],
- 'column-rule-style': [],
- 'column-rule-width': [],
- 'column-span': ['1', 'all'],
- 'column-width': ['<length>', 'auto'],
- 'columns': [],
- 'columns-rule': [],
- 'content': ['*',
-             'close-quote',
-             'inherit',
-             'no-close-quote',
-             'no-open-quote',
-             'open-quote'],
- 'counter-increment': ['*',
-                       'decimal',
-                       'decimal-leading-zero',
-                       'inherit',
-                       'lower-greek',
-                       'lower-latin',
-                       'lower-roman',
-                       'none',
-                       'upper-latin',
-                       'upper-roman'],
- 'counter-reset': ['*', 'inherit', 'none'],
- 'crop': ['auto',
-          'inset-rect(top, right, bottom, left)',
-          'rect(top, right, bottom, left)'],
- 'cue': [],
- 'cue-after': [],
- 'cue-before': [],
- 'cursor': ['*',
-            'auto',
-            'crosshair',
-            'default',
-            'e-resize',
-            'hand',
-            'help',
-            'inherit',
-            'move',
-            'n-resize',
-            'ne-resize',
-            'nw-resize',
-            'pointer',
-            'progress',
-            's-resize',
-            'se-resize',
-            'sw-resize',
-            'text',
-            'w-resize',
-            'wait'],
- 'direction': ['inherit', 'ltr', 'rtl'],
- 'display': ['block',
-             'compact',
-             'inherit',
-             'inline',
-             'inline-block',
-             'inline-table',
-             'list-item',
-             'marker',
-             'none',
-             'run-in',
-             'table',
-             'table-caption',
-             'table-cell',
-             'table-column',
-             'table-column-group',
-             'table-footer-group',
-             'table-header-group',
-             'table-row',
-             'table-row-group'],
- 'dominant-baseline': ['alphabetic',
-                       'auto',
-                       'central',
-                       'hanging',
-                       'ideographic',
-                       'mathematical',
-                       'middle',
-                       'no-change',
-                       'reset-size',
-                       'text-after-edge',
-                       'text-before-edge',
-                       'use-script'],
- 'drop-initial-after-adjust': ['<length>',
-                               '<percentage>',
-                               'before-edge',
-                               'central',
-                               'hanging',
-                               'mathematical',
-                               'middle',
-                               'text-before-edge'],
- 'drop-initial-after-align': ['after-edge',
-                              'alphabetic',
-                              'baseline',
-                              'before-edge',
-                              'central',
-                              'hanging',
-                              'ideographic',
-                              'mathematical',
-                              'middle',
-                              'text-after-edge',
-                              'text-before-edge',
-                              'use-script'],
- 'drop-initial-before-adjust': ['<length>',
-                                '<percentage>',
-                                'before-edge',
-                                'central',
-                                'hanging',
-                                'mathematical',
-                                'middle',
-                                'text-before-edge'],
- 'drop-initial-before-align': ['after-edge',
-                               'alphabetic',
-                               'baseline',
-                               'before-edge',
-                               'caps-height',
-                               'central',
-                               'hanging',
-                               'ideographic',
-                               'mathematical',
-                               'middle',
-                               'text-after-edge',
-                               'text-before-edge',
-                               'use-script'],
- 'drop-initial-size': ['<length>', '<line>', '<percentage>', 'auto'],
- 'drop-initial-value': ['<integer>', 'initial'],
- 'elevation': ['*', 'above', 'below', 'higher', 'inherit', 'level', 'lower'],
- 'empty-cells': ['hide', 'inherit', 'show'],
- 'filter': [],
- 'fit': ['fill', 'hidden', 'meet', 'slice'],
- 'fit-position': [],
- 'float': ['inherit', 'left', 'none', 'right'],
- 'font': ['"Agency FB"',
-          '"Arial Black"',
-          '"Arial Narrow"',
-          '"Arial Rounded MT Bold"',
-          '"Blackadder ITC"',
-          '"Bodoni MT Black"',
-          '"Bodoni MT Condensed"',
-          '"Bodoni MT"',
-          '"Book Antiqua"',
-          '"Bookman Old Style"',
-          '"Bookshelf Symbol 7"',
-          '"Bradley Hand ITC"',
-          '"Calisto MT"',
-          '"Century Gothic"',
-          '"Comic Sans MS"',
-          '"Copperplate Gothic Bold"',
-          '"Copperplate Gothic Light"',
-          '"Courier New"',
-          '"Courier New", Courier, monospace',
-          '"Curlz MT"',
-          '"Edwardian Script ITC"',
-          '"Engravers MT"',
-          '"Eras Bold ITC"',
-          '"Eras Demi ITC"',
-          '"Eras Light ITC"',
-          '"Eras Medium ITC"',
-          '"Estrangelo Edessa"',
-          '"Felix Titling"',
-          '"Franklin Gothic Book"',
-          '"Franklin Gothic Demi Cond"',
-          '"Franklin Gothic Demi"',
-          '"Franklin Gothic Heavy"',
-          '"Franklin Gothic Medium Cond"',
-          '"Franklin Gothic Medium"',
-          '"French Script MT"',
-          '"Gill Sans MT Condensed"',
-          '"Gill Sans MT Ext Condensed Bold"',
-          '"Gill Sans MT"',
-          '"Gill Sans Ultra Bold Condensed"',
-          '"Gill Sans Ultra Bold"',
-          '"Gloucester MT Extra Condensed"',
-          '"Goudy Old Style"',
-          '"Goudy Stout"',
-          '"Imprint MT Shadow"',
-          '"Lucida Console"',
-          '"Lucida Grande"',
-          '"Lucida Sans Typewriter"',
-          '"Lucida Sans Unicode"',
-          '"Lucida Sans"',
-          '"MS Outlook"',
-          '"MS Reference Sans Serif"',
-          '"MS Reference Specialty"',
-          '"MS Sans Serif"',
-          '"MS Sans Serif", Geneva, sans-serif',
-          '"MS Serif"',
-          '"MS Serif", "New York", serif',
-          '"MV Boli"',
-          '"Maiandra GD"',
-          '"Microsoft Sans Serif"',
-          '"Monotype Corsiva"',
-          '"New York"',
-          '"OCR A Extended"',
-          '"Palace Script MT"',
-          '"Palatino Linotype"',
-          '"Perpetua Titling MT"',
-          '"Rage Italic"',
-          '"Rockwell Condensed"',
-          '"Rockwell Extra Bold"',
-          '"SF Collegiate Solid"',
-          '"SF Collegiate"',
-          '"Script MT Bold"',
-          '"Small Fonts"',
-          '"Times New Roman"',
-          '"Times New Roman", Times, serif',
-          '"Trebuchet MS"',
-          '"Tw Cen MT Condensed Extra Bold"',
-          '"Tw Cen MT Condensed"',
-          '"Tw Cen MT"',
-          '"Wingdings 2"',
-          '"Wingdings 3"',
-          '"Zapf Dingbats"',
-          '*',
-          '100',
-          '200',
-          '300',
-          '400',
-          '500',
-          '600',
-          '700',
-          '800',
-          '900',
-          'Arial',
-          'Arial, Helvetica, sans-serif',
-          'Castellar',
-          'Charcoal',
-          'Collegiate-Normal',
-          'Courier',
-          'Default',
-          'Elephant',
-          'Fixedsys',
-          'Forte',
-          'Futura',
-          'Gadget',
-          'Garamond',
-          'Gautami',
-          'Geneva',
-          'Georgia',
-          'Gigi',
-          'Haettenschweiler',
-          'Helvetica',
-          'Impact',
-          'Kartika',
-          'Latha',
-          'Mangal',
-          'Marlett',
-          'Modern',
-          'Monaco',
-          'Nina',
-          'Palatino Linotype',
-          'Papyrus',
-          'Perpetua',
-          'Pristina',
-          'Raavi',
-          'Rockwell',
-          'Roman',
-          'Script',
-          'Shruti',
-          'Sylfaen',
-          'Symbol',
-          'System',
-          'Tahoma',
-          'Terminal',
-          'Times',
-          'Tunga',
-          'Verdana',
-          'Verdana, Geneva, Arial, Helvetica, sans-serif',
-          'Vrinda',
-          'WST_Czec',
-          'WST_Engl',
-          'WST_Fren',
-          'WST_Germ',
-          'WST_Ital',
-          'WST_Span',
-          'WST_Swed',
-          'Webdings',
-          'Wingdings',
-          'ZWAdobeF',
-          'bold',
-          'bolder',
-          'condensed',
-          'cursive',
-          'expanded',
-          'extra-condensed',
-          'extra-expanded',
-          'fantasy',
-          'inherit',
-          'italic',
-          'large',
-          'larger',
-          'lighter',
-          'medium',
-          'monospace',
-          'narrower',
-          'none',
-          'normal',
-          'number',
-          'oblique',
-          'sans-serif',
-          'semi-condensed',
-          'semi-expanded',
-          'serif',
-          'small',
-          'small-caps',
-          'smaller',
-          'ultra-condensed',
-          'ultra-expanded',
-          'wider',
-          'x-large',
-          'x-small',
-          'xx-large',
-          'xx-small'],
- 'font-family': ['"Agency FB"',
-                 '"Arial Black"',
-                 '"Arial Narrow"',
-                 '"Arial Rounded MT Bold"',
-                 '"Blackadder ITC"',
-                 '"Bodoni MT Black"',
-                 '"Bodoni MT Condensed"',
-                 '"Bodoni MT"',
-                 '"Book Antiqua"',
-                 '"Bookman Old Style"',
-                 '"Bookshelf Symbol 7"',
-                 '"Bradley Hand ITC"',
-                 '"Calisto MT"',
-                 '"Century Gothic"',
-                 '"Comic Sans MS"',
-                 '"Copperplate Gothic Bold"',
-                 '"Copperplate Gothic Light"',
-                 '"Courier New"',
-                 '"Courier New", Courier, monospace',
-                 '"Curlz MT"',
-                 '"Edwardian Script ITC"',
-                 '"Engravers MT"',
-                 '"Eras Bold ITC"',
-                 '"Eras Demi ITC"',
-                 '"Eras Light ITC"',
-                 '"Eras Medium ITC"',
-                 '"Estrangelo Edessa"',
-                 '"Felix Titling"',
-                 '"Franklin Gothic Book"',
-                 '"Franklin Gothic Demi Cond"',
-                 '"Franklin Gothic Demi"',
-                 '"Franklin Gothic Heavy"',
-                 '"Franklin Gothic Medium Cond"',
-                 '"Franklin Gothic Medium"',
-                 '"French Script MT"',
-                 '"Gill Sans MT Condensed"',
-                 '"Gill Sans MT Ext Condensed Bold"',
-                 '"Gill Sans MT"',
-                 '"Gill Sans Ultra Bold Condensed"',
-                 '"Gill Sans Ultra Bold"',
-                 '"Gloucester MT Extra Condensed"',
-                 '"Goudy Old Style"',
-                 '"Goudy Stout"',
-                 '"Imprint MT Shadow"',
-                 '"Lucida Console"',
-                 '"Lucida Grande"',
-                 '"Lucida Sans Typewriter"',
-                 '"Lucida Sans Unicode"',
-                 '"Lucida Sans"',
-                 '"MS Outlook"',
-                 '"MS Reference Sans Serif"',
-                 '"MS Reference Specialty"',
-                 '"MS Sans Serif"',
-                 '"MS Sans Serif", Geneva, sans-serif',
-                 '"MS Serif"',
-                 '"MS Serif", "New York", serif',
-                 '"MV Boli"',
-                 '"Maiandra GD"',
-                 '"Microsoft Sans Serif"',
-                 '"Monotype Corsiva"',
-                 '"New York"',
-                 '"OCR A Extended"',
-                 '"Palace Script MT"',
-                 '"Palatino Linotype"',
-                 '"Perpetua Titling MT"',
-                 '"Rage Italic"',
-                 '"Rockwell Condensed"',
-                 '"Rockwell Extra Bold"',
-                 '"SF Collegiate Solid"',
-                 '"SF Collegiate"',
-                 '"Script MT Bold"',
-                 '"Small Fonts"',
-                 '"Times New Roman"',
-                 '"Times New Roman", Times, serif',
-                 '"Trebuchet MS"',
-                 '"Tw Cen MT Condensed Extra Bold"',
-                 '"Tw Cen MT Condensed"',
-                 '"Tw Cen MT"',
-                 '"Wingdings 2"',
-                 '"Wingdings 3"',
-                 '"Zapf Dingbats"',
-                 '*',
-                 'Arial',
-                 'Arial, Helvetica, sans-serif',
-                 'Castellar',
-                 'Charcoal',
-                 'Collegiate-Normal',
-                 'Courier',
-                 'Default',
-                 'Elephant',
-                 'Fixedsys',
-                 'Forte',
-                 'Futura',
-                 'Gadget',
-                 'Garamond',
-                 'Gautami',
-                 'Geneva',
-                 'Georgia',
-                 'Gigi',
-                 'Haettenschweiler',
-                 'Helvetica',
-                 'Impact',
-                 'Kartika',
-                 'Latha',
-                 'Mangal',
-                 'Marlett',
-                 'Modern',
-                 'Monaco',
-                 'Nina',
-                 'Palatino Linotype',
-                 'Papyrus',
-                 'Perpetua',
-                 'Pristina',
-                 'Raavi',
-                 'Rockwell',
-                 'Roman',
-                 'Script',
-                 'Shruti',
-                 'Sylfaen',
-                 'Symbol',
-                 'System',
-                 'Tahoma',
-                 'Terminal',
-                 'Times',
-                 'Tunga',
-                 'Verdana',
-                 'Verdana, Geneva, Arial, Helvetica, sans-serif',
-                 'Vrinda',
-                 'WST_Czec',
-                 'WST_Engl',
-                 'WST_Fren',
-                 'WST_Germ',
-                 'WST_Ital',
-                 'WST_Span',
-                 'WST_Swed',
-                 'Webdings',
-                 'Wingdings',
-                 'ZWAdobeF',
-                 'cursive',
-                 'fantasy',
-                 'inherit',
-                 'monospace',
-                 'sans-serif',
-                 'serif'],
- 'font-size': ['*',
-               'inherit',
-               'large',
-               'larger',
-               'medium',
-               'small',
-               'smaller',
-               'x-large',
-               'x-small',
-               'xx-large',
-               'xx-small'],
- 'font-size-adjust': [],
- 'font-stretch': ['condensed',
-                  'expanded',
-                  'extra-condensed',
-                  'extra-expanded',
-                  'narrower',
-                  'normal',
-                  'semi-condensed',
-                  'semi-expanded',
-                  'ultra-condensed',
-                  'ultra-expanded',
-                  'wider'],
- 'font-style': ['inherit', 'italic', 'normal', 'oblique'],
- 'font-variant': ['inherit', 'normal', 'small-caps'],
- 'font-weight': ['100',
-                 '200',
-                 '300',
-                 '400',
-                 '500',
-                 '600',
-                 '700',
-                 '800',
-                 '900',
-                 'bold',
-                 'bolder',
-                 'inherit',
-                 'lighter',
-                 'normal'],
- 'hanging-punctuation': ['end', 'end-edge', 'start'],
- 'height': ['*', 'auto', 'inherit'],
- 'hyphenate-after': [],
- 'hyphenate-before': [],
- 'hyphenate-lines': [],
- 'hyphenate-resource': [],
- 'hyphens': ['auto', 'manual', 'none'],
- 'icon': ['<uri>', 'auto'],
- 'image-orientation': ['<angle>', 'auto'],
- 'image-resolution': ['<dpi>', 'auto', 'normal'],
- 'ime-mode': ['active', 'auto', 'disabled', 'inactive'],
- 'inline-box-align': ['<integer>', 'initial', 'last'],
- 'layout-flow': ['horizontal', 'vertical-ideographic'],
- 'layout-grid': ['horizontal', 'vertical-ideographic'],
- 'layout-grid-char': ['*', 'auto', 'none'],
- 'layout-grid-line': ['*', 'auto', 'none'],
- 'layout-grid-mode': ['both', 'char', 'line', 'none'],
- 'layout-grid-type': ['fixed', 'loose', 'strict'],
- 'left': ['*', 'auto', 'inherit'],
- 'letter-spacing': ['*', 'inherit', 'normal'],
- 'line-break': ['normal', 'strict'],
- 'line-height': ['*', 'inherit', 'normal'],
- 'line-stacking': [],
- 'line-stacking-ruby': ['exclude-ruby', 'include-ruby'],
- 'line-stacking-shift': ['consider-shifts', 'disregard-shifts'],
- 'line-stacking-strategy': ['block-line-height',
-                            'grid-height',
-                            'inline-line-height',
-                            'max-height'],
- 'list-style': ['armenian',
-                'circle',
-                'cjk-ideographic',
-                'decimal',
-                'decimal-leading-zero',
-                'disc',
-                'georgian',
-                'hebrew',
-                'hiragana',
-                'hiragana-iroha',
-                'inherit',
-                'inside',
-                'katakana',
-                'katakana-iroha',
-                'lower-alpha',
-                'lower-greek',
-                'lower-latin',
-                'lower-roman',
-                'none',
-                'outside',
-                'square',
-                'upper-alpha',
-                'upper-latin',
-                'upper-roman',
-                'url(image-url.gif)'],
- 'list-style-image': [],
- 'list-style-position': ['inherit', 'inside', 'outside'],
- 'list-style-type': ['armenian',
-                     'circle',
-                     'cjk-ideographic',
-                     'decimal',
-                     'decimal-leading-zero',
-                     'disc',
-                     'georgian',
-                     'hebrew',
-                     'hiragana',
-                     'hiragana-iroha',
-                     'inherit',
-                     'katakana',
-                     'katakana-iroha',
-                     'lower-alpha',
-                     'lower-greek',
-                     'lower-latin',
-                     'lower-roman',
-                     'none',
-                     'square',
-                     'upper-alpha',
-                     'upper-latin',
-                     'upper-roman'],
- 'margin': [],
- 'margin-bottom': [],
- 'margin-left': [],
- 'margin-right': [],
- 'margin-top': [],
- 'mark': [],
- 'mark-after': [],
- 'mark-before': [],
- 'marker-offset': [],
- 'marks': ['crop', 'cross', 'inherit', 'none'],
- 'marquee-direction': ['forward', 'reverse'],
- 'marquee-play-count': [],
- 'marquee-speed': ['fast', 'normal', 'slow'],
- 'marquee-style': ['alternate', 'scroll', 'slide'],
- 'max-height': [],
- 'max-width': [],
- 'min-height': [],
- 'min-width': [],
- 'move-to': ['<identifier>', 'here', 'normal'],
- 'nav-down': ['<id>', '<target-name>', 'auto'],
- 'nav-index': ['<number>', 'auto'],
- 'nav-left': ['<id>', '<target-name>', 'auto'],
- 'nav-up': ['<id>', '<target-name>', 'auto'],
- 'opacity': [],
- 'orphans': [],
- 'outline': ['#ffffff',
-             'dashed',
-             'dotted',
-             'double',
-             'groove',
-             'hidden',
-             'inherit',
-             'inset',
-             'medium',
-             'none',
-             'outset',
-             'ridge',
-             'solid',
-             'thick',
-             'thin'],
- 'outline-color': [],
- 'outline-offset': [],
- 'outline-style': ['dashed',
-                   'dotted',
-                   'double',
-                   'groove',
-                   'hidden',
-                   'inherit',
-                   'inset',
-                   'none',
-                   'outset',
-                   'ridge',
-                   'solid'],
- 'outline-width': ['*', 'inherit', 'medium', 'thick', 'thin'],
- 'overflow': ['auto', 'hidden', 'inherit', 'scroll', 'visible'],
- 'overflow-style': ['auto', 'marquee-block', 'marquee-line'],
- 'overflow-x': ['auto', 'hidden', 'inherit', 'scroll', 'visible'],
- 'overflow-y': ['auto', 'hidden', 'inherit', 'scroll', 'visible'],
- 'padding': [],
- 'padding-bottom': [],
- 'padding-left': [],
- 'padding-right': [],
- 'padding-top': [],
- 'page': [],
- 'page-break-after': ['always', 'auto', 'avoid', 'inherit', 'left', 'right'],
- 'page-break-before': ['always', 'auto', 'avoid', 'inherit', 'left', 'right'],
- 'page-break-inside': ['always', 'auto', 'avoid', 'inherit'],
- 'page-policy': ['first', 'last', 'start'],
- 'pause': [],
- 'pause-after': [],
- 'pause-before': [],
- 'phonemes': [],
- 'pitch': ['high', 'inherit', 'low', 'medium', 'x-high', 'x-low'],
- 'pitch-range': [],
- 'play-during': ['auto', 'inherit', 'mix', 'none', 'repeat'],
- 'position': ['absolute', 'fixed', 'inherit', 'relative', 'static'],
- 'presentation-level': ['<integer>', 'increment', 'same'],
- 'punctuation-trim': ['adjacent', 'end', 'none', 'start'],
- 'quotes': [],
- 'rendering-intent': [],
- 'resize': ['both', 'horizontal', 'none', 'vertical'],
- 'rest': [],
- 'rest-after': ['<length>',
-                'medium',
-                'none',
-                'strong',
-                'weak',
-                'x-strong',
-                'x-weak'],
- 'rest-before': ['<length>',
-                 'medium',
-                 'none',
-                 'strong',
-                 'weak',
-                 'x-strong',
-                 'x-weak'],
- 'richness': [],
- 'right': ['*', 'auto', 'inherit'],
- 'rotation': [],
- 'rotation-point': [],
- 'ruby-align': ['auto',
-                'center',
-                'distribute-letter',
-                'distribute-space',
-                'inherit',
-                'left',
-                'line-edge',
-                'right'],
- 'ruby-overhang': ['auto', 'none', 'whitespace'],
- 'ruby-position': ['above', 'inline'],
- 'ruby-span': ['attr(x)', 'none'],
- 'scrollbar-3dlight-color': [],
- 'scrollbar-arrow-color': [],
- 'scrollbar-base-color': [],
- 'scrollbar-darkshadow-color': [],
- 'scrollbar-face-color': [],
- 'scrollbar-highlight-color': [],
- 'scrollbar-shadow-color': [],
- 'scrollbar-track-color': [],
- 'size': ['*', 'auto', 'landscape', 'portrait'],
- 'speak': ['inherit', 'none', 'normal', 'spell-out'],
- 'speak-header': ['always', 'inherit', 'once'],
- 'speak-numeral': ['continuous', 'digits', 'inherit'],
- 'speak-punctuation': ['code', 'inherit', 'none'],
- 'speech-rate': ['*',
-                 'fast',
-                 'faster',
-                 'inherit',
-                 'medium',
-                 'slow',
-                 'slower',
-                 'x-fast',
-                 'x-slow'],
- 'stress': [],
- 'string-set': [],
- 'table-layout': ['auto', 'fixed', 'inherit'],
- 'target': [],
- 'target-name': ['<string>', 'current', 'modal', 'new', 'parent ', 'root'],
- 'target-new': ['none', 'tab', 'window'],
- 'target-position': ['above', 'back', 'behind', 'front'],
- 'text-align': ['center', 'inherit', 'justify', 'left', 'right'],
- 'text-align-last': ['auto', 'center', 'inherit', 'justify', 'left', 'right'],
- 'text-decoration': ['blink',
-                     'inherit',
-                     'line-through',
-                     'none',
-                     'overline',
-                     'underline'],
- 'text-emphasis': ['accent',
-                   'after',
-                   'before',
-                   'circle',
-                   'disc',
-                   'dot',
-                   'none'],
- 'text-height': ['auto', 'font-size', 'max-size', 'text-size'],
- 'text-indent': [],
- 'text-justify': ['auto',
-                  'distribute',
-                  'distribute-all-lines',
-                  'distribute-center-last',
-                  'inter-cluster',
-                  'inter-ideograph',
-                  'inter-word',
-                  'kashida',
-                  'newspaper'],
- 'text-outline': [],
- 'text-overflow': ['clip', 'ellipsis'],
- 'text-replace': [],
- 'text-shadow': [],
- 'text-transform': ['capitalize', 'inherit', 'lowercase', 'none', 'uppercase'],
- 'text-underline-position': ['above', 'auto', 'auto-pos', 'below'],
- 'text-wrap': ['capitalize', 'lowercase', 'none', 'uppercase'],
- 'top': ['*', 'auto', 'inherit'],
- 'transition': [],
- 'transition-delay': [],
- 'transition-duration': [],
- 'transition-property': [],
- 'unicode-bidi': ['bidi-override', 'embed', 'inherit', 'normal'],
- 'vertical-align': ['*',
-                    'baseline',
-                    'bottom',
-                    'inherit',
-                    'middle',
-                    'sub',
-                    'super',
-                    'text-bottom',
-                    'text-top',
-                    'top'],
- 'visibility': ['collapse', 'hidden', 'inherit', 'visible'],
- 'voice-balance': ['<length>',
-                   'center',
-                   'left',
-                   'leftwards',
-                   'right',
-                   'rightwards'],
- 'voice-duration': ['<time>'],
- 'voice-family': ['*', 'child', 'female', 'male'],
- 'voice-pitch': ['<number>',
-                 '<percentage>',
-                 'high',
-                 'low',
-                 'medium',
-                 'x-high',
-                 'x-low'],
- 'voice-pitch-range': ['<number>',
-                       '<percentage>',
-                       'high',
-                       'low',
-                       'medium',
-                       'x-high',
-                       'x-low'],
- 'voice-rate': ['<percentage>', 'fast', 'medium', 'slow', 'x-fast', 'x-slow'],
- 'voice-stress': ['moderate', 'none', 'reduced', 'strong'],
- 'voice-volume': ['<number>',
-                  '<percentage>',
-                  'loud',
-                  'medium',
-                  'soft',
-                  'x-loud',
-                  'x-soft'],
- 'volume': ['*', 'loud', 'medium', 'silent', 'soft', 'x-loud', 'x-soft'],
- 'white-space': ['normal', 'nowrap', 'pre', 'pre-line', 'pre-wrap'],
- 'white-space-collapse': ['collapse',
-                          'discard',
-                          'preserve',
-                          'preserve-breaks'],
- 'widows': [],
- 'width': ['*', 'auto', 'inherit'],
- 'word-break': ['break-all', 'keep-all', 'normal'],
- 'word-spacing': [],
- 'word-wrap': ['break-word', 'normal'],
- 'writing-mode': ['lr-tb', 'tb-rl'],
- 'z-index': [],
- 'zoom': ['*', 'normal']}
+STRINGS = (
+	"-moz-binding",
+	"-moz-border-bottom-colors",
+	"-moz-border-left-colors",
+	"-moz-border-radius",
+	"-moz-border-radius-bottomleft",
+	"-moz-border-radius-bottomright",
+	"-moz-border-radius-topleft",
+	"-moz-border-radius-topright",
+	"-moz-border-right-colors",
+	"-moz-border-top-colors",
+	"-moz-opacity",
+	"-moz-outline",
+	"#ffffff",
+	"dashed",
+	"dotted",
+	"double",
+	"groove",
+	"hidden",
+	"inherit",
+	"inset",
+	"medium",
+	"none",
+	"outset",
+	"ridge",
+	"solid",
+	"thick",
+	"thin",
+	"-moz-outline-color",
+	"-moz-outline-style",
+	"-moz-outline-width",
+	"*",
+	"-moz-user-focus",
+	"auto",
+	"ignore",
+	"normal",
+	"-moz-user-input",
+	"disabled",
+	"enabled",
+	"-moz-user-modify",
+	"read-only",
+	"read-write",
+	"write-only",
+	"-moz-user-select",
+	"all",
+	"element",
+	"elements",
+	"text",
+	"toggle",
+	"tri-state",
+	"-o-link",
+	"-o-link-source",
+	"current",
+	"next",
+	"accelerator",
+	"false",
+	"true",
+	"alignment-adjust",
+	"<length>",
+	"<percentage>",
+	"after-edge",
+	"alphabetic",
+	"baseline",
+	"before-edge ",
+	"central",
+	"hanging",
+	"ideographic",
+	"mathematical",
+	"middle",
+	"text-after-edge",
+	"text-before-edge",
+	"alignment-baseline",
+	"before-edge",
+	"use-script",
+	"animation",
+	"animation-delay",
+	"animation-direction",
+	"alternate",
+	"animation-duration",
+	"animation-iteration-count",
+	"animation-name",
+	"animation-play-state",
+	"appearance",
+	"azimuth",
+	"behind",
+	"center",
+	"center-left",
+	"center-right",
+	"far-left",
+	"far-right",
+	"left",
+	"left-side",
+	"leftwards",
+	"right",
+	"right-side",
+	"rightwards",
+	"background",
+	"bottom",
+	"fixed",
+	"no-repeat",
+	"repeat",
+	"repeat-x",
+	"repeat-y",
+	"scroll",
+	"top",
+	"url(image-url.gif)",
+	"background-attachment",
+	"background-clip",
+	"border-box",
+	"padding-box",
+	"background-color",
+	"background-image",
+	"background-origin",
+	"content-box",
+	"background-position",
+	"background-position-x",
+	"background-position-y",
+	"background-repeat",
+	"background-size",
+	"contain",
+	"cover",
+	"baseline-shift",
+	"sub",
+	"super",
+	"binding",
+	"<uri>",
+	"bookmark-label",
+	"bookmark-level",
+	"bookmark-target",
+	"border",
+	"border-bottom",
+	"border-bottom-color",
+	"border-bottom-left-radius",
+	"border-bottom-right-radius",
+	"border-bottom-style",
+	"border-bottom-width",
+	"border-collapse",
+	"collapse",
+	"separate",
+	"border-color",
+	"border-left",
+	"border-left-color",
+	"border-left-style",
+	"border-left-width",
+	"border-length",
+	"border-radius",
+	"border-right",
+	"border-right-color",
+	"border-right-style",
+	"border-right-width",
+	"border-spacing",
+	"border-style",
+	"border-top",
+	"border-top-color",
+	"border-top-left-radius",
+	"border-top-right-radius",
+	"border-top-style",
+	"border-top-width",
+	"border-width",
+	"box-align",
+	"baseline ",
+	"end",
+	"start",
+	"stretch",
+	"box-direction",
+	"reverse",
+	"box-flex",
+	"box-flex-group",
+	"box-lines",
+	"multiple",
+	"single",
+	"box-ordinal-group",
+	"box-orient",
+	"block-axis",
+	"horizontal",
+	"inline-axis",
+	"vertical",
+	"box-pack",
+	"justify",
+	"box-sizing",
+	"caption-side",
+	"clear",
+	"both",
+	"clip",
+	"color",
+	"color-profile",
+	"<name>",
+	"<url>",
+	"sRGB",
+	"column-count",
+	"<integer>",
+	"column-fill",
+	"balance",
+	"column-gap",
+	"column-rule-color",
+	"column-rule-style",
+	"column-rule-width",
+	"column-span",
+	"1",
+	"column-width",
+	"columns",
+	"columns-rule",
+	"content",
+	"close-quote",
+	"no-close-quote",
+	"no-open-quote",
+	"open-quote",
+	"counter-increment",
+	"decimal",
+	"decimal-leading-zero",
+	"lower-greek",
+	"lower-latin",
+	"lower-roman",
+	"upper-latin",
+	"upper-roman",
+	"counter-reset",
+	"crop",
+	"inset-rect(top, right, bottom, left)",
+	"rect(top, right, bottom, left)",
+	"cue",
+	"cue-after",
+	"cue-before",
+	"cursor",
+	"crosshair",
+	"default",
+	"e-resize",
+	"hand",
+	"help",
+	"move",
+	"n-resize",
+	"ne-resize",
+	"nw-resize",
+	"pointer",
+	"progress",
+	"s-resize",
+	"se-resize",
+	"sw-resize",
+	"w-resize",
+	"wait",
+	"direction",
+	"ltr",
+	"rtl",
+	"display",
+	"block",
+	"compact",
+	"inline",
+	"inline-block",
+	"inline-table",
+	"list-item",
+	"marker",
+	"run-in",
+	"table",
+	"table-caption",
+	"table-cell",
+	"table-column",
+	"table-column-group",
+	"table-footer-group",
+	"table-header-group",
+	"table-row",
+	"table-row-group",
+	"dominant-baseline",
+	"no-change",
+	"reset-size",
+	"drop-initial-after-adjust",
+	"drop-initial-after-align",
+	"drop-initial-before-adjust",
+	"drop-initial-before-align",
+	"caps-height",
+	"drop-initial-size",
+	"<line>",
+	"drop-initial-value",
+	"initial",
+	"elevation",
+	"above",
+	"below",
+	"higher",
+	"level",
+	"lower",
+	"empty-cells",
+	"hide",
+	"show",
+	"filter",
+	"fit",
+	"fill",
+	"meet",
+	"slice",
+	"fit-position",
+	"float",
+	"font",
+	"\"Agency FB\"",
+	"\"Arial Black\"",
+	"\"Arial Narrow\"",
+	"\"Arial Rounded MT Bold\"",
+	"\"Blackadder ITC\"",
+	"\"Bodoni MT Black\"",
+	"\"Bodoni MT Condensed\"",
+	"\"Bodoni MT\"",
+	"\"Book Antiqua\"",
+	"\"Bookman Old Style\"",
+	"\"Bookshelf Symbol 7\"",
+	"\"Bradley Hand ITC\"",
+	"\"Calisto MT\"",
+	"\"Century Gothic\"",
+	"\"Comic Sans MS\"",
+	"\"Copperplate Gothic Bold\"",
+	"\"Copperplate Gothic Light\"",
+	"\"Courier New\"",
+	"\"Courier New\", Courier, monospace",
+	"\"Curlz MT\"",
+	"\"Edwardian Script ITC\"",
+	"\"Engravers MT\"",
+	"\"Eras Bold ITC\"",
+	"\"Eras Demi ITC\"",
+	"\"Eras Light ITC\"",
+	"\"Eras Medium ITC\"",
+	"\"Estrangelo Edessa\"",
+	"\"Felix Titling\"",
+	"\"Franklin Gothic Book\"",
+	"\"Franklin Gothic Demi Cond\"",
+	"\"Franklin Gothic Demi\"",
+	"\"Franklin Gothic Heavy\"",
+	"\"Franklin Gothic Medium Cond\"",
+	"\"Franklin Gothic Medium\"",
+	"\"French Script MT\"",
+	"\"Gill Sans MT Condensed\"",
+	"\"Gill Sans MT Ext Condensed Bold\"",
+	"\"Gill Sans MT\"",
+	"\"Gill Sans Ultra Bold Condensed\"",
+	"\"Gill Sans Ultra Bold\"",
+	"\"Gloucester MT Extra Condensed\"",
+	"\"Goudy Old Style\"",
+	"\"Goudy Stout\"",
+	"\"Imprint MT Shadow\"",
+	"\"Lucida Console\"",
+	"\"Lucida Grande\"",
+	"\"Lucida Sans Typewriter\"",
+	"\"Lucida Sans Unicode\"",
+	"\"Lucida Sans\"",
+	"\"MS Outlook\"",
+	"\"MS Reference Sans Serif\"",
+	"\"MS Reference Specialty\"",
+	"\"MS Sans Serif\"",
+	"\"MS Sans Serif\", Geneva, sans-serif",
+	"\"MS Serif\"",
+	"\"MS Serif\", \"New York\", serif",
+	"\"MV Boli\"",
+	"\"Maiandra GD\"",
+	"\"Microsoft Sans Serif\"",
+	"\"Monotype Corsiva\"",
+	"\"New York\"",
+	"\"OCR A Extended\"",
+	"\"Palace Script MT\"",
+	"\"Palatino Linotype\"",
+	"\"Perpetua Titling MT\"",
+	"\"Rage Italic\"",
+	"\"Rockwell Condensed\"",
+	"\"Rockwell Extra Bold\"",
+	"\"SF Collegiate Solid\"",
+	"\"SF Collegiate\"",
+	"\"Script MT Bold\"",
+	"\"Small Fonts\"",
+	"\"Times New Roman\"",
+	"\"Times New Roman\", Times, serif",
+	"\"Trebuchet MS\"",
+	"\"Tw Cen MT Condensed Extra Bold\"",
+	"\"Tw Cen MT Condensed\"",
+	"\"Tw Cen MT\"",
+	"\"Wingdings 2\"",
+	"\"Wingdings 3\"",
+	"\"Zapf Dingbats\"",
+	"100",
+	"200",
+	"300",
+	"400",
+	"500",
+	"600",
+	"700",
+	"800",
+	"900",
+	"Arial",
+	"Arial, Helvetica, sans-serif",
+	"Castellar",
+	"Charcoal",
+	"Collegiate-Normal",
+	"Courier",
+	"Default",
+	"Elephant",
+	"Fixedsys",
+	"Forte",
+	"Futura",
+	"Gadget",
+	"Garamond",
+	"Gautami",
+	"Geneva",
+	"Georgia",
+	"Gigi",
+	"Haettenschweiler",
+	"Helvetica",
+	"Impact",
+	"Kartika",
+	"Latha",
+	"Mangal",
+	"Marlett",
+	"Modern",
+	"Monaco",
+	"Nina",
+	"Palatino Linotype",
+	"Papyrus",
+	"Perpetua",
+	"Pristina",
+	"Raavi",
+	"Rockwell",
+	"Roman",
+	"Script",
+	"Shruti",
+	"Sylfaen",
+	"Symbol",
+	"System",
+	"Tahoma",
+	"Terminal",
+	"Times",
+	"Tunga",
+	"Verdana",
+	"Verdana, Geneva, Arial, Helvetica, sans-serif",
+	"Vrinda",
+	"WST_Czec",
+	"WST_Engl",
+	"WST_Fren",
+	"WST_Germ",
+	"WST_Ital",
+	"WST_Span",
+	"WST_Swed",
+	"Webdings",
+	"Wingdings",
+	"ZWAdobeF",
+	"bold",
+	"bolder",
+	"condensed",
+	"cursive",
+	"expanded",
+	"extra-condensed",
+	"extra-expanded",
+	"fantasy",
+	"italic",
+	"large",
+	"larger",
+	"lighter",
+	"monospace",
+	"narrower",
+	"number",
+	"oblique",
+	"sans-serif",
+	"semi-condensed",
+	"semi-expanded",
+	"serif",
+	"small",
+	"small-caps",
+	"smaller",
+	"ultra-condensed",
+	"ultra-expanded",
+	"wider",
+	"x-large",
+	"x-small",
+	"xx-large",
+	"xx-small",
+	"font-family",
+	"font-size",
+	"font-size-adjust",
+	"font-stretch",
+	"font-style",
+	"font-variant",
+	"font-weight",
+	"hanging-punctuation",
+	"end-edge",
+	"height",
+	"hyphenate-after",
+	"hyphenate-before",
+	"hyphenate-lines",
+	"hyphenate-resource",
+	"hyphens",
+	"manual",
+	"icon",
+	"image-orientation",
+	"<angle>",
+	"image-resolution",
+	"<dpi>",
+	"ime-mode",
+	"active",
+	"inactive",
+	"inline-box-align",
+	"last",
+	"layout-flow",
+	"vertical-ideographic",
+	"layout-grid",
+	"layout-grid-char",
+	"layout-grid-line",
+	"layout-grid-mode",
+	"char",
+	"line",
+	"layout-grid-type",
+	"loose",
+	"strict",
+	"letter-spacing",
+	"line-break",
+	"line-height",
+	"line-stacking",
+	"line-stacking-ruby",
+	"exclude-ruby",
+	"include-ruby",
+	"line-stacking-shift",
+	"consider-shifts",
+	"disregard-shifts",
+	"line-stacking-strategy",
+	"block-line-height",
+	"grid-height",
+	"inline-line-height",
+	"max-height",
+	"list-style",
+	"armenian",
+	"circle",
+	"cjk-ideographic",
+	"disc",
+	"georgian",
+	"hebrew",
+	"hiragana",
+	"hiragana-iroha",
+	"inside",
+	"katakana",
+	"katakana-iroha",
+	"lower-alpha",
+	"outside",
+	"square",
+	"upper-alpha",
+	"list-style-image",
+	"list-style-position",
+	"list-style-type",
+	"margin",
+	"margin-bottom",
+	"margin-left",
+	"margin-right",
+	"margin-top",
+	"mark",
+	"mark-after",
+	"mark-before",
+	"marker-offset",
+	"marks",
+	"cross",
+	"marquee-direction",
+	"forward",
+	"marquee-play-count",
+	"marquee-speed",
+	"fast",
+	"slow",
+	"marquee-style",
+	"slide",
+	"max-width",
+	"min-height",
+	"min-width",
+	"move-to",
+	"<identifier>",
+	"here",
+	"nav-down",
+	"<id>",
+	"<target-name>",
+	"nav-index",
+	"<number>",
+	"nav-left",
+	"nav-up",
+	"opacity",
+	"orphans",
+	"outline",
+	"outline-color",
+	"outline-offset",
+	"outline-style",
+	"outline-width",
+	"overflow",
+	"visible",
+	"overflow-style",
+	"marquee-block",
+	"marquee-line",
+	"overflow-x",
+	"overflow-y",
+	"padding",
+	"padding-bottom",
+	"padding-left",
+	"padding-right",
+	"padding-top",
+	"page",
+	"page-break-after",
+	"always",
+	"avoid",
+	"page-break-before",
+	"page-break-inside",
+	"page-policy",
+	"first",
+	"pause",
+	"pause-after",
+	"pause-before",
+	"phonemes",
+	"pitch",
+	"high",
+	"low",
+	"x-high",
+	"x-low",
+	"pitch-range",
+	"play-during",
+	"mix",
+	"position",
+	"absolute",
+	"relative",
+	"static",
+	"presentation-level",
+	"increment",
+	"same",
+	"punctuation-trim",
+	"adjacent",
+	"quotes",
+	"rendering-intent",
+	"resize",
+	"rest",
+	"rest-after",
+	"strong",
+	"weak",
+	"x-strong",
+	"x-weak",
+	"rest-before",
+	"richness",
+	"rotation",
+	"rotation-point",
+	"ruby-align",
+	"distribute-letter",
+	"distribute-space",
+	"line-edge",
+	"ruby-overhang",
+	"whitespace",
+	"ruby-position",
+	"ruby-span",
+	"attr(x)",
+	"scrollbar-3dlight-color",
+	"scrollbar-arrow-color",
+	"scrollbar-base-color",
+	"scrollbar-darkshadow-color",
+	"scrollbar-face-color",
+	"scrollbar-highlight-color",
+	"scrollbar-shadow-color",
+	"scrollbar-track-color",
+	"size",
+	"landscape",
+	"portrait",
+	"speak",
+	"spell-out",
+	"speak-header",
+	"once",
+	"speak-numeral",
+	"continuous",
+	"digits",
+	"speak-punctuation",
+	"code",
+	"speech-rate",
+	"faster",
+	"slower",
+	"x-fast",
+	"x-slow",
+	"stress",
+	"string-set",
+	"table-layout",
+	"target",
+	"target-name",
+	"<string>",
+	"modal",
+	"new",
+	"parent ",
+	"root",
+	"target-new",
+	"tab",
+	"window",
+	"target-position",
+	"back",
+	"front",
+	"text-align",
+	"text-align-last",
+	"text-decoration",
+	"blink",
+	"line-through",
+	"overline",
+	"underline",
+	"text-emphasis",
+	"accent",
+	"after",
+	"before",
+	"dot",
+	"text-height",
+	"max-size",
+	"text-size",
+	"text-indent",
+	"text-justify",
+	"distribute",
+	"distribute-all-lines",
+	"distribute-center-last",
+	"inter-cluster",
+	"inter-ideograph",
+	"inter-word",
+	"kashida",
+	"newspaper",
+	"text-outline",
+	"text-overflow",
+	"ellipsis",
+	"text-replace",
+	"text-shadow",
+	"text-transform",
+	"capitalize",
+	"lowercase",
+	"uppercase",
+	"text-underline-position",
+	"auto-pos",
+	"text-wrap",
+	"transition",
+	"transition-delay",
+	"transition-duration",
+	"transition-property",
+	"unicode-bidi",
+	"bidi-override",
+	"embed",
+	"vertical-align",
+	"text-bottom",
+	"text-top",
+	"visibility",
+	"voice-balance",
+	"voice-duration",
+	"<time>",
+	"voice-family",
+	"child",
+	"female",
+	"male",
+	"voice-pitch",
+	"voice-pitch-range",
+	"voice-rate",
+	"voice-stress",
+	"moderate",
+	"reduced",
+	"voice-volume",
+	"loud",
+	"soft",
+	"x-loud",
+	"x-soft",
+	"volume",
+	"silent",
+	"white-space",
+	"nowrap",
+	"pre",
+	"pre-line",
+	"pre-wrap",
+	"white-space-collapse",
+	"discard",
+	"preserve",
+	"preserve-breaks",
+	"widows",
+	"width",
+	"word-break",
+	"break-all",
+	"keep-all",
+	"word-spacing",
+	"word-wrap",
+	"break-word",
+	"writing-mode",
+	"lr-tb",
+	"tb-rl",
+	"z-index",
+	"zoom",
+	"!DOCTYPE",
+	"a",
+	"accesskey",
+	"charset",
+	"class",
+	"contenteditable",
+	"coords",
+	"datafld",
+	"datasrc",
+	"dir",
+	"hidefocus",
+	"href",
+	"hreflang",
+	"id",
+	"lang",
+	"language",
+	"methods",
+	"name",
+	"rel",
+	"rev",
+	"shape",
+	"style",
+	"tabindex",
+	"title",
+	"type",
+	"unselectable",
+	"urn",
+	"abbr",
+	"acronym",
+	"address",
+	"applet",
+	"align",
+	"alt",
+	"archive",
+	"codebase",
+	"hspace",
+	"mayscript",
+	"object",
+	"src",
+	"vspace",
+	"area",
+	"nohref",
+	"article",
+	"contextmenu",
+	"draggable",
+	"spellcheck",
+	"aside",
+	"audio",
+	"autoplay",
+	"controls",
+	"loop",
+	"preload",
+	"b",
+	"base",
+	"basefont",
+	"face",
+	"bdo",
+	"bgsound",
+	"big",
+	"blockquote",
+	"cite",
+	"body",
+	"alink",
+	"bgcolor",
+	"bgproperties",
+	"bottommargin",
+	"leftmargin",
+	"link",
+	"marginheight",
+	"marginwidth",
+	"rightmargin",
+	"vlink",
+	"br",
+	"button",
+	"dataformatas",
+	"value",
+	"canvas",
+	"caption",
+	"valign",
+	"col",
+	"charoff",
+	"span",
+	"colgroup",
+	"command",
+	"checked",
+	"label",
+	"radiogroup",
+	"comment",
+	"data",
+	"datalist",
+	"dd",
+	"del",
+	"datetime",
+	"details",
+	"open",
+	"dfn",
+	"div",
+	"dl",
+	"dt",
+	"em",
+	"palette",
+	"pluginspage",
+	"units",
+	"fieldset",
+	"figcaption",
+	"figure",
+	"point-size",
+	"weight",
+	"footer",
+	"form",
+	"accept-charset",
+	"action",
+	"autocomplete",
+	"enctype",
+	"method",
+	"frame",
+	"allowtransparency",
+	"application",
+	"bordercolor",
+	"frameborder",
+	"longdesc",
+	"noresize",
+	"scrolling",
+	"security",
+	"frameset",
+	"cols",
+	"framespacing",
+	"rows",
+	"h1",
+	"h2",
+	"h3",
+	"h4",
+	"h5",
+	"h6",
+	"head",
+	"profile",
+	"header",
+	"hgroup",
+	"hr",
+	"noshade",
+	"html",
+	"xmlns",
+	"i",
+	"iframe",
+	"ilayer",
+	"pagex",
+	"pagey",
+	"img",
+	"dynsrc",
+	"galleryimg",
+	"ismap",
+	"lowsrc",
+	"usemap",
+	"input",
+	"accept",
+	"maxlength",
+	"readonly",
+	"ins",
+	"isindex",
+	"kbd",
+	"keygen",
+	"autofocus",
+	"challenge",
+	"keytype",
+	"for",
+	"layer",
+	"legend",
+	"li",
+	"media",
+	"map",
+	"marquee",
+	"behavior",
+	"scrollamount",
+	"scrolldelay",
+	"truespeed",
+	"math",
+	"menu",
+	"meta",
+	"http-equiv",
+	"scheme",
+	"meter",
+	"max",
+	"min",
+	"optimum",
+	"nav",
+	"nobr",
+	"noembed",
+	"noframes",
+	"noscript",
+	"classid",
+	"codetype",
+	"declare",
+	"standby",
+	"ol",
+	"reversed",
+	"optgroup",
+	"option",
+	"selected",
+	"output",
+	"p",
+	"param",
+	"valuetype",
+	"wrap",
+	"xml:space",
+	"q",
+	"rp",
+	"rt",
+	"ruby",
+	"s",
+	"samp",
+	"script",
+	"defer",
+	"event",
+	"section",
+	"select",
+	"source",
+	"strike",
+	"summary",
+	"sup",
+	"svg",
+	"bordercolordark",
+	"bordercolorlight",
+	"cellpadding",
+	"cellspacing",
+	"datapagesize",
+	"rules",
+	"tbody",
+	"td",
+	"axis",
+	"colspan",
+	"headers",
+	"rowspan",
+	"scope",
+	"textarea",
+	"tfoot",
+	"th",
+	"thead",
+	"time",
+	"pubdate",
+	"tr",
+	"tt",
+	"u",
+	"ul",
+	"var",
+	"video",
+	"poster",
+	"wbr",
+	"xml",
+	"xmp",
+	"application/msexcel",
+	"application/msword",
+	"application/pdf",
+	"application/rtf",
+	"application/x-zip-compressed",
+	"text/html",
+	"text/plain",
+	"ISO-8859-1",
+	"unknown",
+	"absbottom",
+	"absmiddle",
+	"texttop",
+	"no",
+	"yes",
+	"off",
+	"on",
+	"HZ-GB-2312",
+	"ISO-2022-JP",
+	"ISO-2022-JP-2",
+	"ISO-2022-KR",
+	"ISO-8859-10",
+	"ISO-8859-15",
+	"ISO-8859-2",
+	"ISO-8859-3",
+	"ISO-8859-4",
+	"ISO-8859-5",
+	"ISO-8859-6",
+	"ISO-8859-7",
+	"ISO-8859-8",
+	"ISO-8859-9",
+	"Shift_JIS",
+	"UTF-8",
+	"cp1250",
+	"cp1251",
+	"cp1252",
+	"cp1253",
+	"cp1254",
+	"cp1255",
+	"cp1256",
+	"cp1257",
+	"cp1258",
+	"text/html; charset=HZ-GB-2312",
+	"text/html; charset=ISO-2022-JP",
+	"text/html; charset=ISO-2022-JP-2",
+	"text/html; charset=ISO-2022-KR",
+	"text/html; charset=ISO-8859-10",
+	"text/html; charset=ISO-8859-15",
+	"text/html; charset=ISO-8859-2",
+	"text/html; charset=ISO-8859-3",
+	"text/html; charset=ISO-8859-4",
+	"text/html; charset=ISO-8859-5",
+	"text/html; charset=ISO-8859-6",
+	"text/html; charset=ISO-8859-7",
+	"text/html; charset=ISO-8859-8",
+	"text/html; charset=ISO-8859-9",
+	"text/html; charset=Shift_JIS",
+	"text/html; charset=UTF-8",
+	"text/html; charset=cp1250",
+	"text/html; charset=cp1251",
+	"text/html; charset=cp1252",
+	"text/html; charset=cp1253",
+	"text/html; charset=cp1254",
+	"text/html; charset=cp1255",
+	"text/html; charset=cp1256",
+	"text/html; charset=cp1257",
+	"text/html; charset=cp1258",
+	"text/html; charset=iso-8859-1",
+	"down",
+	"up",
+	"application/x-www-form-urlencoded",
+	"multipart/form-data",
+	"box",
+	"hsides",
+	"lhs",
+	"rhs",
+	"void",
+	"vsides",
+	"0",
+	"Content-Type",
+	"JScript",
+	"JavaScript",
+	"JavaScript1.1",
+	"JavaScript1.2",
+	"VBScript",
+	"javascript",
+	"jscript",
+	"php",
+	"vbs",
+	"vbscript",
+	"aural",
+	"braille",
+	"other",
+	"print",
+	"projection",
+	"screen",
+	"get",
+	"post",
+	"foreground",
+	"metadata",
+	"bookmark",
+	"chapter",
+	"contents",
+	"copyright",
+	"glossary",
+	"index",
+	"prev",
+	"stylesheet",
+	"subsection",
+	"groups",
+	"row",
+	"rowgroup",
+	"poly",
+	"rect",
+	"2",
+	"3",
+	"4",
+	"5",
+	"6",
+	"7",
+	"_blank",
+	"_parent",
+	"_self",
+	"_top",
+	"A",
+	"I",
+	"application/javascript",
+	"application/x-shockwave-flash",
+	"checkbox",
+	"date",
+	"datetime-local",
+	"email",
+	"file",
+	"image",
+	"month",
+	"password",
+	"radio",
+	"range",
+	"reset",
+	"search",
+	"submit",
+	"tel",
+	"text/css",
+	"text/javascript",
+	"text/jscript",
+	"text/php",
+	"text/tcl",
+	"text/vbscript",
+	"url",
+	"week",
+	"px",
+	"ref",
+	"shown",
+	"hard",
+	"http://www.w3.org/1999/xhtml",
+)
 
-HTML_ELEMENTS_ATTRIBUTES = {'!DOCTYPE': [],
- 'a': ['accesskey',
-       'charset',
-       'class',
-       'contenteditable',
-       'coords',
-       'datafld',
-       'datasrc',
-       'dir',
-       'disabled',
-       'hidefocus',
-       'href',
-       'hreflang',
-       'id',
-       'lang',
-       'language',
-       'methods',
-       'name',
-       'rel',
-       'rev',
-       'shape',
-       'style',
-       'tabindex',
-       'target',
-       'title',
-       'type',
-       'unselectable',
-       'urn'],
- 'abbr': ['class', 'dir', 'id', 'lang', 'style', 'title'],
- 'acronym': ['class', 'dir', 'id', 'lang', 'style', 'title'],
- 'address': ['accesskey',
-             'class',
-             'contenteditable',
-             'dir',
-             'disabled',
-             'hidefocus',
-             'id',
-             'lang',
-             'language',
-             'style',
-             'tabindex',
-             'title',
-             'unselectable'],
- 'applet': ['accesskey',
-            'align',
-            'alt',
-            'archive',
-            'class',
-            'code',
-            'codebase',
-            'datafld',
-            'datasrc',
-            'height',
-            'hidefocus',
-            'hspace',
-            'id',
-            'mayscript',
-            'name',
-            'object',
-            'src',
-            'style',
-            'tabindex',
-            'title',
-            'unselectable',
-            'vspace',
-            'width'],
- 'area': ['accesskey',
-          'alt',
-          'class',
-          'coords',
-          'dir',
-          'hidefocus',
-          'href',
-          'id',
-          'lang',
-          'nohref',
-          'shape',
-          'style',
-          'tabindex',
-          'target',
-          'title',
-          'unselectable'],
- 'article': ['accesskey',
-             'class',
-             'contenteditable',
-             'contextmenu',
-             'dir',
-             'draggable',
-             'hidden',
-             'id',
-             'lang',
-             'spellcheck',
-             'style',
-             'tabindex',
-             'title'],
- 'aside': ['accesskey',
-           'class',
-           'contenteditable',
-           'contextmenu',
-           'dir',
-           'draggable',
-           'hidden',
-           'id',
-           'lang',
-           'spellcheck',
-           'style',
-           'tabindex',
-           'title'],
- 'audio': ['accesskey',
-           'autoplay',
-           'class',
-           'contenteditable',
-           'contextmenu',
-           'controls',
-           'dir',
-           'draggable',
-           'hidden',
-           'id',
-           'lang',
-           'loop',
-           'preload',
-           'spellcheck',
-           'src',
-           'style',
-           'tabindex',
-           'title'],
- 'b': ['accesskey',
-       'class',
-       'contenteditable',
-       'dir',
-       'hidefocus',
-       'id',
-       'lang',
-       'language',
-       'style',
-       'tabindex',
-       'title',
-       'unselectable'],
- 'base': ['href', 'id', 'target'],
- 'basefont': ['color', 'face', 'id', 'size'],
- 'bdo': ['accesskey',
-         'class',
-         'contenteditable',
-         'dir',
-         'hidefocus',
-         'id',
-         'lang',
-         'language',
-         'style',
-         'tabindex',
-         'title',
-         'unselectable'],
- 'bgsound': ['balance', 'id', 'loop', 'src', 'volume'],
- 'big': ['accesskey',
-         'class',
-         'contenteditable',
-         'dir',
-         'disabled',
-         'hidefocus',
-         'id',
-         'lang',
-         'language',
-         'style',
-         'tabindex',
-         'title',
-         'unselectable'],
- 'blink': ['class', 'id', 'lang', 'style'],
- 'blockquote': ['accesskey',
-                'cite',
-                'class',
-                'contenteditable',
-                'dir',
-                'disabled',
-                'hidefocus',
-                'id',
-                'lang',
-                'language',
-                'style',
-                'tabindex',
-                'title',
-                'unselectable'],
- 'body': ['accesskey',
-          'alink',
-          'background',
-          'bgcolor',
-          'bgproperties',
-          'bottommargin',
-          'class',
-          'contenteditable',
-          'dir',
-          'disabled',
-          'hidefocus',
-          'id',
-          'lang',
-          'language',
-          'leftmargin',
-          'link',
-          'marginheight',
-          'marginwidth',
-          'nowrap',
-          'rightmargin',
-          'scroll',
-          'style',
-          'tabindex',
-          'text',
-          'title',
-          'unselectable',
-          'vlink'],
- 'br': ['class', 'clear', 'id', 'style', 'title'],
- 'button': ['accesskey',
-            'class',
-            'contenteditable',
-            'datafld',
-            'dataformatas',
-            'datasrc',
-            'hidefocus',
-            'id',
-            'lang',
-            'language',
-            'name',
-            'style',
-            'tabindex',
-            'title',
-            'type',
-            'value'],
- 'canvas': ['accesskey',
-            'class',
-            'contenteditable',
-            'contextmenu',
-            'dir',
-            'draggable',
-            'height',
-            'hidden',
-            'id',
-            'lang',
-            'spellcheck',
-            'style',
-            'tabindex',
-            'title',
-            'width'],
- 'caption': ['accesskey',
-             'align',
-             'class',
-             'contenteditable',
-             'dir',
-             'hidefocus',
-             'id',
-             'lang',
-             'language',
-             'style',
-             'tabindex',
-             'title',
-             'unselectable',
-             'valign'],
- 'center': ['accesskey',
-            'class',
-            'contenteditable',
-            'dir',
-            'disabled',
-            'hidefocus',
-            'id',
-            'lang',
-            'language',
-            'style',
-            'tabindex',
-            'title',
-            'unselectable'],
- 'cite': ['accesskey',
-          'class',
-          'contenteditable',
-          'dir',
-          'disabled',
-          'hidefocus',
-          'id',
-          'lang',
-          'language',
-          'style',
-          'tabindex',
-          'title',
-          'unselectable'],
- 'code': ['class',
-          'contenteditable',
-          'dir',
-          'disabled',
-          'id',
-          'lang',
-          'language',
-          'style',
-          'title',
-          'unselectable'],
- 'col': ['align',
-         'bgcolor',
-         'char',
-         'charoff',
-         'class',
-         'dir',
-         'id',
-         'lang',
-         'span',
-         'style',
-         'title',
-         'valign',
-         'width'],
- 'colgroup': ['align',
-              'bgcolor',
-              'char',
-              'charoff',
-              'class',
-              'dir',
-              'id',
-              'lang',
-              'span',
-              'style',
-              'title',
-              'valign',
-              'width'],
- 'command': ['accesskey',
-             'checked',
-             'class',
-             'contenteditable',
-             'contextmenu',
-             'dir',
-             'disabled',
-             'draggable',
-             'height',
-             'hidden',
-             'icon',
-             'id',
-             'label',
-             'lang',
-             'radiogroup',
-             'spellcheck',
-             'style',
-             'tabindex',
-             'title',
-             'type',
-             'width'],
- 'comment': ['data', 'id', 'lang', 'title'],
- 'datalist': ['accesskey',
-              'class',
-              'contenteditable',
-              'contextmenu',
-              'dir',
-              'draggable',
-              'hidden',
-              'id',
-              'lang',
-              'spellcheck',
-              'style',
-              'tabindex',
-              'title'],
- 'dd': ['accesskey',
-        'class',
-        'contenteditable',
-        'dir',
-        'disabled',
-        'hidefocus',
-        'id',
-        'lang',
-        'language',
-        'nowrap',
-        'style',
-        'tabindex',
-        'title',
-        'unselectable'],
- 'del': ['accesskey',
-         'cite',
-         'class',
-         'contenteditable',
-         'datetime',
-         'dir',
-         'disabled',
-         'id',
-         'lang',
-         'language',
-         'style',
-         'tabindex',
-         'title',
-         'unselectable'],
- 'details': ['accesskey',
-             'class',
-             'contenteditable',
-             'contextmenu',
-             'dir',
-             'draggable',
-             'hidden',
-             'id',
-             'lang',
-             'open',
-             'spellcheck',
-             'style',
-             'tabindex',
-             'title'],
- 'dfn': ['accesskey',
-         'class',
-         'contenteditable',
-         'dir',
-         'disabled',
-         'hidefocus',
-         'id',
-         'lang',
-         'language',
-         'style',
-         'tabindex',
-         'title',
-         'unselectable'],
- 'dir': ['accesskey',
-         'contenteditable',
-         'dir',
-         'disabled',
-         'hidefocus',
-         'language',
-         'tabindex',
-         'unselectable'],
- 'div': ['accesskey',
-         'align',
-         'class',
-         'contenteditable',
-         'dir',
-         'disabled',
-         'hidefocus',
-         'id',
-         'lang',
-         'language',
-         'nowrap',
-         'style',
-         'tabindex',
-         'title',
-         'unselectable'],
- 'dl': ['accesskey',
-        'class',
-        'compact',
-        'contenteditable',
-        'dir',
-        'disabled',
-        'hidefocus',
-        'id',
-        'lang',
-        'language',
-        'style',
-        'tabindex',
-        'title',
-        'unselectable'],
- 'dt': ['accesskey',
-        'class',
-        'compact',
-        'contenteditable',
-        'dir',
-        'disabled',
-        'hidefocus',
-        'id',
-        'lang',
-        'language',
-        'nowrap',
-        'style',
-        'tabindex',
-        'title',
-        'unselectable'],
- 'em': ['accesskey',
-        'class',
-        'contenteditable',
-        'dir',
-        'disabled',
-        'hidefocus',
-        'id',
-        'lang',
-        'language',
-        'style',
-        'tabindex',
-        'title',
-        'unselectable'],
- 'embed': ['accesskey',
-           'align',
-           'alt',
-           'border',
-           'class',
-           'code',
-           'codebase',
-           'height',
-           'hidden',
-           'hspace',
-           'id',
-           'language',
-           'name',
-           'palette',
-           'pluginspage',
-           'src',
-           'style',
-           'title',
-           'type',
-           'units',
-           'unselectable',
-           'vspace',
-           'width'],
- 'fieldset': ['accesskey',
-              'align',
-              'class',
-              'contenteditable',
-              'datafld',
-              'dir',
-              'disabled',
-              'hidefocus',
-              'id',
-              'lang',
-              'language',
-              'style',
-              'tabindex',
-              'title',
-              'unselectable'],
- 'figcaption': ['accesskey',
-                'class',
-                'contenteditable',
-                'contextmenu',
-                'dir',
-                'draggable',
-                'hidden',
-                'id',
-                'lang',
-                'spellcheck',
-                'style',
-                'tabindex',
-                'title'],
- 'figure': ['accesskey',
-            'class',
-            'contenteditable',
-            'contextmenu',
-            'dir',
-            'draggable',
-            'hidden',
-            'id',
-            'lang',
-            'spellcheck',
-            'style',
-            'tabindex',
-            'title'],
- 'font': ['accesskey',
-          'class',
-          'color',
-          'contenteditable',
-          'dir',
-          'disabled',
-          'face',
-          'hidefocus',
-          'id',
-          'lang',
-          'language',
-          'point-size',
-          'size',
-          'style',
-          'tabindex',
-          'title',
-          'unselectable',
-          'weight'],
- 'footer': ['accesskey',
-            'class',
-            'contenteditable',
-            'contextmenu',
-            'dir',
-            'draggable',
-            'hidden',
-            'id',
-            'lang',
-            'spellcheck',
-            'style',
-            'tabindex',
-            'title'],
- 'form': ['accept-charset',
-          'action',
-          'autocomplete',
-          'class',
-          'contenteditable',
-          'dir',
-          'disabled',
-          'enctype',
-          'hidefocus',
-          'id',
-          'lang',
-          'language',
-          'method',
-          'name',
-          'style',
-          'tabindex',
-          'target',
-          'title',
-          'unselectable'],
- 'frame': ['allowtransparency',
-           'application',
-           'bordercolor',
-           'class',
-           'datafld',
-           'datasrc',
-           'frameborder',
-           'height',
-           'hidefocus',
-           'id',
-           'lang',
-           'language',
-           'longdesc',
-           'marginheight',
-           'marginwidth',
-           'name',
-           'noresize',
-           'scrolling',
-           'security',
-           'style',
-           'tabindex',
-           'title',
-           'unselectable',
-           'width'],
- 'frameset': ['border',
-              'bordercolor',
-              'class',
-              'cols',
-              'frameborder',
-              'framespacing',
-              'hidefocus',
-              'id',
-              'lang',
-              'language',
-              'longdesc',
-              'rows',
-              'style',
-              'tabindex',
-              'title',
-              'unselectable'],
- 'h1': ['accesskey',
-        'align',
-        'class',
-        'contenteditable',
-        'dir',
-        'disabled',
-        'hidefocus',
-        'id',
-        'lang',
-        'language',
-        'style',
-        'tabindex',
-        'title',
-        'unselectable'],
- 'h2': ['accesskey',
-        'align',
-        'class',
-        'contenteditable',
-        'dir',
-        'disabled',
-        'hidefocus',
-        'id',
-        'lang',
-        'language',
-        'style',
-        'tabindex',
-        'title',
-        'unselectable'],
- 'h3': ['accesskey',
-        'align',
-        'class',
-        'contenteditable',
-        'dir',
-        'disabled',
-        'hidefocus',
-        'id',
-        'lang',
-        'language',
-        'style',
-        'tabindex',
-        'title',
-        'unselectable'],
- 'h4': ['accesskey',
-        'align',
-        'class',
-        'contenteditable',
-        'dir',
-        'disabled',
-        'hidefocus',
-        'id',
-        'lang',
-        'language',
-        'style',
-        'tabindex',
-        'title',
-        'unselectable'],
- 'h5': ['accesskey',
-        'align',
-        'class',
-        'contenteditable',
-        'dir',
-        'disabled',
-        'hidefocus',
-        'id',
-        'lang',
-        'language',
-        'style',
-        'tabindex',
-        'title',
-        'unselectable'],
- 'h6': ['accesskey',
-        'align',
-        'class',
-        'contenteditable',
-        'dir',
-        'disabled',
-        'hidefocus',
-        'id',
-        'lang',
-        'language',
-        'style',
-        'tabindex',
-        'title',
-        'unselectable'],
- 'head': ['class', 'dir', 'id', 'lang', 'profile'],
- 'header': ['accesskey',
-            'class',
-            'contenteditable',
-            'contextmenu',
-            'dir',
-            'draggable',
-            'hidden',
-            'id',
-            'lang',
-            'spellcheck',
-            'style',
-            'tabindex',
-            'title'],
- 'hgroup': ['accesskey',
-            'class',
-            'contenteditable',
-            'contextmenu',
-            'dir',
-            'draggable',
-            'hidden',
-            'id',
-            'lang',
-            'spellcheck',
-            'style',
-            'tabindex',
-            'title'],
- 'hr': ['accesskey',
-        'align',
-        'class',
-        'dir',
-        'hidefocus',
-        'id',
-        'lang',
-        'language',
-        'noshade',
-        'size',
-        'style',
-        'tabindex',
-        'title',
-        'unselectable'],
- 'html': ['class', 'dir', 'id', 'lang', 'scroll', 'xmlns'],
- 'i': ['accesskey',
-       'class',
-       'dir',
-       'disabled',
-       'hidefocus',
-       'id',
-       'lang',
-       'language',
-       'style',
-       'tabindex',
-       'title',
-       'unselectable'],
- 'iframe': ['align',
-            'allowtransparency',
-            'application',
-            'bordercolor',
-            'class',
-            'datafld',
-            'datasrc',
-            'frameborder',
-            'height',
-            'hidefocus',
-            'hspace',
-            'id',
-            'lang',
-            'language',
-            'longdesc',
-            'marginheight',
-            'marginwidth',
-            'name',
-            'scrolling',
-            'security',
-            'src',
-            'style',
-            'tabindex',
-            'title',
-            'unselectable',
-            'vspace',
-            'width'],
- 'ilayer': ['above',
-            'background',
-            'below',
-            'class',
-            'clip',
-            'height',
-            'id',
-            'left',
-            'name',
-            'pagex',
-            'pagey',
-            'src',
-            'style',
-            'top',
-            'visibility',
-            'width',
-            'z-index'],
- 'img': ['accesskey',
-         'align',
-         'alt',
-         'border',
-         'class',
-         'datafld',
-         'datasrc',
-         'dir',
-         'dynsrc',
-         'galleryimg',
-         'height',
-         'hidefocus',
-         'hspace',
-         'id',
-         'ismap',
-         'lang',
-         'language',
-         'longdesc',
-         'loop',
-         'lowsrc',
-         'src',
-         'style',
-         'tabindex',
-         'title',
-         'unselectable',
-         'usemap',
-         'vspace',
-         'width'],
- 'input': ['accept',
-           'accesskey',
-           'align',
-           'alt',
-           'autocomplete',
-           'checked',
-           'class',
-           'dir',
-           'disabled',
-           'dynsrc',
-           'hidefocus',
-           'hspace',
-           'id',
-           'lang',
-           'language',
-           'loop',
-           'lowsrc',
-           'maxlength',
-           'name',
-           'readonly',
-           'size',
-           'src',
-           'style',
-           'tabindex',
-           'title',
-           'type',
-           'unselectable',
-           'value',
-           'vspace'],
- 'ins': ['accesskey',
-         'cite',
-         'class',
-         'contenteditable',
-         'datetime',
-         'dir',
-         'disabled',
-         'id',
-         'lang',
-         'language',
-         'style',
-         'tabindex',
-         'title',
-         'unselectable'],
- 'isindex': ['accesskey',
-             'action',
-             'class',
-             'dir',
-             'disabled',
-             'hidefocus',
-             'href',
-             'id',
-             'lang',
-             'language',
-             'style',
-             'tabindex',
-             'title',
-             'unselectable'],
- 'kbd': ['accesskey',
-         'class',
-         'contenteditable',
-         'dir',
-         'disabled',
-         'hidefocus',
-         'id',
-         'lang',
-         'language',
-         'style',
-         'tabindex',
-         'title',
-         'unselectable'],
- 'keygen': ['accesskey',
-            'autofocus',
-            'challenge',
-            'class',
-            'contenteditable',
-            'contextmenu',
-            'dir',
-            'disabled',
-            'draggable',
-            'form',
-            'hidden',
-            'id',
-            'keytype',
-            'lang',
-            'name',
-            'spellcheck',
-            'style',
-            'tabindex',
-            'title'],
- 'label': ['accesskey',
-           'class',
-           'contenteditable',
-           'datafld',
-           'dataformatas',
-           'datasrc',
-           'dir',
-           'disabled',
-           'for',
-           'hidefocus',
-           'id',
-           'lang',
-           'language',
-           'style',
-           'tabindex',
-           'title',
-           'unselectable'],
- 'layer': ['above',
-           'background',
-           'below',
-           'bgcolor',
-           'class',
-           'clip',
-           'height',
-           'id',
-           'left',
-           'name',
-           'overflow',
-           'pagex',
-           'pagey',
-           'style',
-           'title',
-           'top',
-           'visibility',
-           'width',
-           'z-index'],
- 'legend': ['accesskey',
-            'align',
-            'class',
-            'contenteditable',
-            'dir',
-            'disabled',
-            'hidefocus',
-            'id',
-            'lang',
-            'language',
-            'style',
-            'tabindex',
-            'title',
-            'unselectable'],
- 'li': ['accesskey',
-        'class',
-        'contenteditable',
-        'dir',
-        'disabled',
-        'hidefocus',
-        'id',
-        'lang',
-        'language',
-        'style',
-        'tabindex',
-        'title',
-        'type',
-        'unselectable',
-        'value'],
- 'link': ['charset',
-          'class',
-          'dir',
-          'disabled',
-          'href',
-          'hreflang',
-          'id',
-          'lang',
-          'media',
-          'rel',
-          'rev',
-          'style',
-          'target',
-          'title',
-          'type'],
- 'map': ['class', 'dir', 'id', 'lang', 'style', 'title'],
- 'mark': ['accesskey',
-          'class',
-          'contenteditable',
-          'contextmenu',
-          'dir',
-          'draggable',
-          'hidden',
-          'id',
-          'lang',
-          'spellcheck',
-          'style',
-          'tabindex',
-          'title'],
- 'marquee': ['accesskey',
-             'behavior',
-             'bgcolor',
-             'class',
-             'contenteditable',
-             'datafld',
-             'dataformatas',
-             'datasrc',
-             'dir',
-             'direction',
-             'height',
-             'hidefocus',
-             'hspace',
-             'id',
-             'lang',
-             'language',
-             'loop',
-             'scrollamount',
-             'scrolldelay',
-             'style',
-             'tabindex',
-             'title',
-             'truespeed',
-             'unselectable',
-             'vspace',
-             'width'],
- 'math': ['accesskey',
-          'class',
-          'contenteditable',
-          'contextmenu',
-          'dir',
-          'draggable',
-          'hidden',
-          'id',
-          'lang',
-          'spellcheck',
-          'style',
-          'tabindex',
-          'title'],
- 'menu': ['accesskey',
-          'class',
-          'contenteditable',
-          'contextmenu',
-          'dir',
-          'draggable',
-          'hidden',
-          'id',
-          'label',
-          'lang',
-          'spellcheck',
-          'style',
-          'tabindex',
-          'title',
-          'type'],
- 'meta': ['content', 'dir', 'http-equiv', 'id', 'lang', 'name', 'scheme'],
- 'meter': ['accesskey',
-           'class',
-           'contenteditable',
-           'contextmenu',
-           'dir',
-           'draggable',
-           'form',
-           'hidden',
-           'high',
-           'id',
-           'label',
-           'lang',
-           'low',
-           'max',
-           'min',
-           'optimum',
-           'spellcheck',
-           'style',
-           'tabindex',
-           'title',
-           'type',
-           'value'],
- 'nav': ['accesskey',
-         'class',
-         'contenteditable',
-         'contextmenu',
-         'dir',
-         'draggable',
-         'hidden',
-         'id',
-         'lang',
-         'spellcheck',
-         'style',
-         'tabindex',
-         'title'],
- 'nobr': ['class',
-          'contenteditable',
-          'dir',
-          'disabled',
-          'id',
-          'style',
-          'title',
-          'unselectable'],
- 'noembed': ['class', 'id', 'style', 'title'],
- 'noframes': ['class', 'dir', 'id', 'lang', 'style', 'title'],
- 'noscript': ['class', 'dir', 'id', 'lang', 'style', 'title'],
- 'object': ['accesskey',
-            'align',
-            'archive',
-            'border',
-            'class',
-            'classid',
-            'code',
-            'codebase',
-            'codetype',
-            'data',
-            'datafld',
-            'datasrc',
-            'declare',
-            'dir',
-            'height',
-            'hidefocus',
-            'hspace',
-            'id',
-            'lang',
-            'name',
-            'standby',
-            'style',
-            'tabindex',
-            'title',
-            'type',
-            'unselectable',
-            'usemap',
-            'vspace',
-            'width'],
- 'ol': ['accesskey',
-        'class',
-        'compact',
-        'contenteditable',
-        'dir',
-        'disabled',
-        'hidefocus',
-        'id',
-        'lang',
-        'language',
-        'reversed',
-        'start',
-        'style',
-        'tabindex',
-        'title',
-        'type',
-        'unselectable'],
- 'optgroup': ['class',
-              'dir',
-              'disabled',
-              'id',
-              'label',
-              'lang',
-              'style',
-              'title'],
- 'option': ['class',
-            'dir',
-            'disabled',
-            'id',
-            'label',
-            'lang',
-            'language',
-            'selected',
-            'style',
-            'title',
-            'value'],
- 'output': ['accesskey',
-            'class',
-            'contenteditable',
-            'contextmenu',
-            'dir',
-            'draggable',
-            'for',
-            'form',
-            'hidden',
-            'id',
-            'lang',
-            'name',
-            'spellcheck',
-            'style',
-            'tabindex',
-            'title'],
- 'p': ['accesskey',
-       'align',
-       'class',
-       'contenteditable',
-       'dir',
-       'disabled',
-       'hidefocus',
-       'id',
-       'lang',
-       'language',
-       'style',
-       'tabindex',
-       'title',
-       'unselectable'],
- 'param': ['datafld',
-           'dataformatas',
-           'datasrc',
-           'id',
-           'name',
-           'type',
-           'value',
-           'valuetype'],
- 'pre': ['accesskey',
-         'class',
-         'contenteditable',
-         'dir',
-         'disabled',
-         'hidefocus',
-         'id',
-         'lang',
-         'language',
-         'style',
-         'tabindex',
-         'title',
-         'unselectable',
-         'width',
-         'wrap',
-         'xml:space'],
- 'progress': ['accesskey',
-              'class',
-              'contenteditable',
-              'contextmenu',
-              'dir',
-              'draggable',
-              'form',
-              'hidden',
-              'id',
-              'lang',
-              'max',
-              'spellcheck',
-              'style',
-              'tabindex',
-              'title',
-              'value'],
- 'q': ['accesskey',
-       'cite',
-       'class',
-       'contenteditable',
-       'dir',
-       'disabled',
-       'hidefocus',
-       'id',
-       'lang',
-       'language',
-       'style',
-       'tabindex',
-       'title',
-       'unselectable'],
- 'rp': ['accesskey',
-        'class',
-        'contenteditable',
-        'contextmenu',
-        'dir',
-        'draggable',
-        'hidden',
-        'id',
-        'lang',
-        'spellcheck',
-        'style',
-        'tabindex',
-        'title'],
- 'rt': ['accesskey',
-        'class',
-        'contenteditable',
-        'dir',
-        'disabled',
-        'hidefocus',
-        'id',
-        'lang',
-        'language',
-        'name',
-        'style',
-        'tabindex',
-        'title',
-        'unselectable'],
- 'ruby': ['accesskey',
-          'class',
-          'contenteditable',
-          'dir',
-          'disabled',
-          'hidefocus',
-          'id',
-          'lang',
-          'language',
-          'name',
-          'style',
-          'tabindex',
-          'title',
-          'unselectable'],
- 's': ['accesskey',
-       'class',
-       'contenteditable',
-       'dir',
-       'disabled',
-       'hidefocus',
-       'id',
-       'lang',
-       'language',
-       'style',
-       'tabindex',
-       'title',
-       'unselectable'],
- 'samp': ['accesskey',
-          'class',
-          'contenteditable',
-          'dir',
-          'disabled',
-          'hidefocus',
-          'id',
-          'lang',
-          'language',
-          'style',
-          'tabindex',
-          'title',
-          'unselectable'],
- 'script': ['charset',
-            'defer',
-            'event',
-            'for',
-            'id',
-            'language',
-            'src',
-            'type',
-            'xml:space'],
- 'section': ['accesskey',
-             'class',
-             'contenteditable',
-             'contextmenu',
-             'dir',
-             'draggable',
-             'hidden',
-             'id',
-             'lang',
-             'spellcheck',
-             'style',
-             'tabindex',
-             'title'],
- 'select': ['accesskey',
-            'align',
-            'class',
-            'datafld',
-            'datasrc',
-            'dir',
-            'disabled',
-            'hidefocus',
-            'id',
-            'lang',
-            'language',
-            'multiple',
-            'name',
-            'size',
-            'style',
-            'tabindex',
-            'title',
-            'unselectable'],
- 'small': ['accesskey',
-           'class',
-           'contenteditable',
-           'dir',
-           'hidefocus',
-           'id',
-           'lang',
-           'language',
-           'style',
-           'tabindex',
-           'title',
-           'unselectable'],
- 'source': ['accesskey',
-            'class',
-            'contenteditable',
-            'contextmenu',
-            'dir',
-            'draggable',
-            'hidden',
-            'id',
-            'lang',
-            'media',
-            'spellcheck',
-            'src',
-            'style',
-            'tabindex',
-            'title',
-            'type'],
- 'span': ['accesskey',
-          'class',
-          'contenteditable',
-          'datafld',
-          'dataformatas',
-          'datasrc',
-          'dir',
-          'hidefocus',
-          'id',
-          'lang',
-          'language',
-          'style',
-          'tabindex',
-          'title',
-          'unselectable'],
- 'strike': ['accesskey',
-            'class',
-            'contenteditable',
-            'dir',
-            'disabled',
-            'hidefocus',
-            'id',
-            'lang',
-            'language',
-            'style',
-            'tabindex',
-            'title',
-            'unselectable'],
- 'strong': ['accesskey',
-            'class',
-            'contenteditable',
-            'dir',
-            'disabled',
-            'hidefocus',
-            'id',
-            'lang',
-            'language',
-            'style',
-            'tabindex',
-            'title',
-            'unselectable'],
- 'style': ['dir',
-           'disabled',
-           'id',
-           'lang',
-           'media',
-           'title',
-           'type',
-           'xml:space'],
- 'sub': ['accesskey',
-         'class',
-         'contenteditable',
-         'dir',
-         'disabled',
-         'hidefocus',
-         'id',
-         'lang',
-         'language',
-         'style',
-         'tabindex',
-         'title',
-         'unselectable'],
- 'summary': ['accesskey',
-             'class',
-             'contenteditable',
-             'contextmenu',
-             'dir',
-             'draggable',
-             'hidden',
-             'id',
-             'lang',
-             'spellcheck',
-             'style',
-             'tabindex',
-             'title'],
- 'sup': ['accesskey',
-         'class',
-         'contenteditable',
-         'dir',
-         'hidefocus',
-         'id',
-         'lang',
-         'language',
-         'style',
-         'tabindex',
-         'title',
-         'unselectable'],
- 'svg': ['accesskey',
-         'class',
-         'contenteditable',
-         'contextmenu',
-         'dir',
-         'draggable',
-         'hidden',
-         'id',
-         'lang',
-         'spellcheck',
-         'style',
-         'tabindex',
-         'title'],
- 'table': ['accesskey',
-           'background',
-           'bgcolor',
-           'border',
-           'bordercolor',
-           'bordercolordark',
-           'bordercolorlight',
-           'cellpadding',
-           'cellspacing',
-           'class',
-           'cols',
-           'datapagesize',
-           'datasrc',
-           'dir',
-           'frame',
-           'height',
-           'hidefocus',
-           'hspace',
-           'id',
-           'lang',
-           'language',
-           'rules',
-           'style',
-           'summary',
-           'tabindex',
-           'title',
-           'unselectable',
-           'vspace',
-           'width'],
- 'tbody': ['accesskey',
-           'align',
-           'bgcolor',
-           'char',
-           'charoff',
-           'class',
-           'dir',
-           'hidefocus',
-           'id',
-           'lang',
-           'language',
-           'style',
-           'tabindex',
-           'title',
-           'unselectable',
-           'valign'],
- 'td': ['abbr',
-        'accesskey',
-        'align',
-        'axis',
-        'background',
-        'bgcolor',
-        'bordercolor',
-        'bordercolordark',
-        'bordercolorlight',
-        'char',
-        'charoff',
-        'class',
-        'colspan',
-        'dir',
-        'headers',
-        'height',
-        'hidefocus',
-        'id',
-        'lang',
-        'language',
-        'nowrap',
-        'rowspan',
-        'scope',
-        'style',
-        'tabindex',
-        'title',
-        'unselectable',
-        'valign',
-        'width'],
- 'textarea': ['accesskey',
-              'class',
-              'cols',
-              'datafld',
-              'datasrc',
-              'dir',
-              'disabled',
-              'hidefocus',
-              'id',
-              'lang',
-              'language',
-              'name',
-              'readonly',
-              'rows',
-              'style',
-              'tabindex',
-              'title',
-              'wrap'],
- 'tfoot': ['accesskey',
-           'align',
-           'char',
-           'charoff',
-           'class',
-           'dir',
-           'hidefocus',
-           'id',
-           'lang',
-           'language',
-           'style',
-           'tabindex',
-           'title',
-           'unselectable',
-           'valign'],
- 'th': ['abbr',
-        'accesskey',
-        'align',
-        'axis',
-        'background',
-        'bgcolor',
-        'bordercolor',
-        'bordercolordark',
-        'bordercolorlight',
-        'char',
-        'charoff',
-        'class',
-        'colspan',
-        'dir',
-        'headers',
-        'height',
-        'hidefocus',
-        'id',
-        'lang',
-        'language',
-        'nowrap',
-        'rowspan',
-        'scope',
-        'style',
-        'tabindex',
-        'title',
-        'unselectable',
-        'valign'],
- 'thead': ['accesskey',
-           'align',
-           'char',
-           'charoff',
-           'class',
-           'dir',
-           'hidefocus',
-           'id',
-           'lang',
-           'language',
-           'style',
-           'tabindex',
-           'title',
-           'unselectable',
-           'valign'],
- 'time': ['accesskey',
-          'class',
-          'contenteditable',
-          'contextmenu',
-          'datetime',
-          'dir',
-          'draggable',
-          'hidden',
-          'id',
-          'lang',
-          'pubdate',
-          'spellcheck',
-          'style',
-          'tabindex',
-          'title'],
- 'title': ['dir', 'id', 'lang'],
- 'tr': ['accesskey',
-        'align',
-        'bgcolor',
-        'bordercolor',
-        'bordercolordark',
-        'bordercolorlight',
-        'char',
-        'charoff',
-        'class',
-        'dir',
-        'height',
-        'hidefocus',
-        'id',
-        'lang',
-        'language',
-        'style',
-        'tabindex',
-        'title',
-        'valign'],
- 'tt': ['accesskey',
-        'class',
-        'contenteditable',
-        'dir',
-        'disabled',
-        'hidefocus',
-        'id',
-        'lang',
-        'language',
-        'style',
-        'tabindex',
-        'title',
-        'unselectable'],
- 'u': ['accesskey',
-       'class',
-       'contenteditable',
-       'dir',
-       'hidefocus',
-       'id',
-       'lang',
-       'language',
-       'style',
-       'tabindex',
-       'title',
-       'unselectable'],
- 'ul': ['accesskey',
-        'class',
-        'compact',
-        'contenteditable',
-        'dir',
-        'hidefocus',
-        'id',
-        'lang',
-        'language',
-        'style',
-        'tabindex',
-        'title',
-        'type',
-        'unselectable'],
- 'var': ['accesskey',
-         'class',
-         'contenteditable',
-         'dir',
-         'hidefocus',
-         'id',
-         'lang',
-         'language',
-         'style',
-         'tabindex',
-         'title',
-         'unselectable'],
- 'video': ['accesskey',
-           'autoplay',
-           'class',
-           'contenteditable',
-           'contextmenu',
-           'dir',
-           'draggable',
-           'height',
-           'hidden',
-           'id',
-           'lang',
-           'loop',
-           'poster',
-           'preload',
-           'spellcheck',
-           'src',
-           'style',
-           'tabindex',
-           'title',
-           'width'],
- 'wbr': ['id'],
- 'xml': ['id', 'src'],
- 'xmp': ['accesskey',
-         'class',
-         'contenteditable',
-         'dir',
-         'hidefocus',
-         'id',
-         'lang',
-         'language',
-         'style',
-         'tabindex',
-         'title',
-         'unselectable']}
+CSS_PROP_VALUES = CompactTable(STRINGS,
+	# keys
+	b'\x00\x00\x01\x00\x02\x00\x03\x00\x04\x00\x05\x00\x06\x00\x07\x00\x08\x00\x09'
+	b'\x00\x0a\x00\x0b\x00\x1b\x00\x1c\x00\x1d\x00\x1f\x00\x23\x00\x26\x00\x2a\x00'
+	b'\x31\x00\x32\x00\x35\x00\x38\x00\x46\x00\x49\x00\x4a\x00\x4b\x00\x4d\x00\x4e'
+	b'\x00\x4f\x00\x50\x00\x51\x00\x52\x00\x5f\x00\x69\x00\x6a\x00\x6d\x00\x6e\x00'
+	b'\x6f\x00\x71\x00\x72\x00\x73\x00\x74\x00\x75\x00\x78\x00\x7b\x00\x7d\x00\x7e'
+	b'\x00\x7f\x00\x80\x00\x81\x00\x82\x00\x83\x00\x84\x00\x85\x00\x86\x00\x87\x00'
+	b'\x8a\x00\x8b\x00\x8c\x00\x8d\x00\x8e\x00\x8f\x00\x90\x00\x91\x00\x92\x00\x93'
+	b'\x00\x94\x00\x95\x00\x96\x00\x97\x00\x98\x00\x99\x00\x9a\x00\x9b\x00\x9c\x00'
+	b'\x9d\x00\x60\x00\x9e\x00\xa3\x00\xa5\x00\xa6\x00\xa7\x00\xaa\x00\xab\x00\xb0'
+	b'\x00\xb2\x00\xb3\x00\xb4\x00\xb6\x00\xb7\x00\xb8\x00\xbc\x00\xbe\x00\xc0\x00'
+	b'\xc1\x00\xc2\x00\xc3\x00\xc4\x00\xc6\x00\xc7\x00\xc8\x00\xc9\x00\xce\x00\xd6'
+	b'\x00\xd7\x00\xda\x00\xdb\x00\xdc\x00\xdd\x00\xee\x00\xf1\x00\x03\x01\x06\x01'
+	b'\x07\x01\x08\x01\x09\x01\x0b\x01\x0d\x01\x0f\x01\x15\x01\x18\x01\x19\x01\x1d'
+	b'\x01\x1e\x01\x1f\x01\xd0\x01\xd1\x01\xd2\x01\xd3\x01\xd4\x01\xd5\x01\xd6\x01'
+	b'\xd7\x01\xd9\x01\xda\x01\xdb\x01\xdc\x01\xdd\x01\xde\x01\xe0\x01\xe1\x01\xe3'
+	b'\x01\xe5\x01\xe8\x01\xea\x01\xec\x01\xed\x01\xee\x01\xef\x01\xf2\x01\x59\x00'
+	b'\xf5\x01\xf6\x01\xf7\x01\xf8\x01\xf9\x01\xfc\x01\xff\x01\x04\x02\x14\x02\x15'
+	b'\x02\x16\x02\x17\x02\x18\x02\x19\x02\x1a\x02\x1b\x02\x1c\x02\x1d\x02\x1e\x02'
+	b'\x1f\x02\x20\x02\x22\x02\x24\x02\x25\x02\x28\x02\x03\x02\x2a\x02\x2b\x02\x2c'
+	b'\x02\x2d\x02\x30\x02\x33\x02\x35\x02\x36\x02\x37\x02\x38\x02\x39\x02\x3a\x02'
+	b'\x3b\x02\x3c\x02\x3d\x02\x3e\x02\x40\x02\x43\x02\x44\x02\x45\x02\x46\x02\x47'
+	b'\x02\x48\x02\x49\x02\x4a\x02\x4b\x02\x4e\x02\x4f\x02\x50\x02\x52\x02\x53\x02'
+	b'\x54\x02\x55\x02\x56\x02\x5b\x02\x5c\x02\x5e\x02\x62\x02\x65\x02\x67\x02\x68'
+	b'\x02\x69\x02\x6a\x02\x6b\x02\x70\x02\x71\x02\x5c\x00\x72\x02\x73\x02\x74\x02'
+	b'\x78\x02\x7a\x02\x7b\x02\x7d\x02\x7e\x02\x7f\x02\x80\x02\x81\x02\x82\x02\x83'
+	b'\x02\x84\x02\x85\x02\x88\x02\x8a\x02\x8c\x02\x8f\x02\x91\x02\x96\x02\x97\x02'
+	b'\x98\x02\x99\x02\x9a\x02\xa0\x02\xa3\x02\xa6\x02\xa7\x02\xa8\x02\xad\x02\xb2'
+	b'\x02\xb5\x02\xb6\x02\xbf\x02\xc0\x02\xc2\x02\xc3\x02\xc4\x02\xc8\x02\xca\x02'
+	b'\x67\x00\xcb\x02\xcc\x02\xcd\x02\xce\x02\xcf\x02\xd2\x02\xd5\x02\xd6\x02\xd7'
+	b'\x02\xd9\x02\xdd\x02\xde\x02\xdf\x02\xe0\x02\xe3\x02\xe8\x02\xea\x02\xef\x02'
+	b'\xf3\x02\xf4\x02\xf5\x02\xf8\x02\xf9\x02\xfb\x02\xfe\x02\xff\x02',
+	# offsets
+	b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+	b'\x00\x00\x00\x00\x00\x0f\x00\x0f\x00\x1a\x00\x1f\x00\x24\x00\x29\x00\x2d\x00'
+	b'\x35\x00\x35\x00\x38\x00\x3b\x00\x49\x00\x55\x00\x55\x00\x55\x00\x57\x00\x57'
+	b'\x00\x57\x00\x57\x00\x57\x00\x57\x00\x65\x00\x75\x00\x78\x00\x7a\x00\x7a\x00'
+	b'\x7a\x00\x7d\x00\x83\x00\x87\x00\x8b\x00\x8f\x00\x91\x00\x96\x00\x98\x00\x98'
+	b'\x00\x98\x00\x98\x00\xa8\x00\xb8\x00\xb8\x00\xb8\x00\xb8\x00\xc3\x00\xc8\x00'
+	b'\xcb\x00\xcb\x00\xdb\x00\xdb\x00\xe6\x00\xeb\x00\xeb\x00\xeb\x00\xfb\x00\xfb'
+	b'\x00\x06\x01\x0b\x01\x0b\x01\x16\x01\x26\x01\x26\x01\x26\x01\x26\x01\x31\x01'
+	b'\x36\x01\x3b\x01\x3e\x01\x43\x01\x45\x01\x45\x01\x45\x01\x47\x01\x47\x01\x4b'
+	b'\x01\x4f\x01\x51\x01\x56\x01\x5c\x01\x5f\x01\x5f\x01\x63\x01\x65\x01\x67\x01'
+	b'\x69\x01\x69\x01\x69\x01\x69\x01\x6b\x01\x6d\x01\x6d\x01\x6d\x01\x73\x01\x7d'
+	b'\x01\x80\x01\x83\x01\x83\x01\x83\x01\x83\x01\x97\x01\x9a\x01\xad\x01\xb9\x01'
+	b'\xc1\x01\xcd\x01\xd5\x01\xe2\x01\xe6\x01\xe8\x01\xef\x01\xf2\x01\xf2\x01\xf6'
+	b'\x01\xf6\x01\xfa\x01\xaf\x02\x3f\x03\x4a\x03\x4a\x03\x55\x03\x59\x03\x5c\x03'
+	b'\x6a\x03\x6d\x03\x70\x03\x70\x03\x70\x03\x70\x03\x70\x03\x73\x03\x75\x03\x77'
+	b'\x03\x7a\x03\x7e\x03\x81\x03\x83\x03\x85\x03\x88\x03\x8b\x03\x8f\x03\x92\x03'
+	b'\x95\x03\x98\x03\x9a\x03\x9d\x03\x9d\x03\x9f\x03\xa1\x03\xa5\x03\xbe\x03\xbe'
+	b'\x03\xc1\x03\xd7\x03\xd7\x03\xd7\x03\xd7\x03\xd7\x03\xd7\x03\xd7\x03\xd7\x03'
+	b'\xd7\x03\xd7\x03\xdb\x03\xdd\x03\xdd\x03\xe0\x03\xe3\x03\xe3\x03\xe3\x03\xe3'
+	b'\x03\xe3\x03\xe6\x03\xe9\x03\xeb\x03\xee\x03\xf1\x03\xf1\x03\xf1\x03\x00\x04'
+	b'\x00\x04\x00\x04\x0b\x04\x10\x04\x15\x04\x18\x04\x1d\x04\x22\x04\x22\x04\x22'
+	b'\x04\x22\x04\x22\x04\x22\x04\x22\x04\x28\x04\x2e\x04\x32\x04\x35\x04\x35\x04'
+	b'\x35\x04\x35\x04\x35\x04\x3b\x04\x3b\x04\x40\x04\x45\x04\x48\x04\x4c\x04\x4c'
+	b'\x04\x4c\x04\x50\x04\x50\x04\x57\x04\x5e\x04\x5e\x04\x61\x04\x61\x04\x61\x04'
+	b'\x69\x04\x6c\x04\x6e\x04\x70\x04\x70\x04\x70\x04\x70\x04\x70\x04\x70\x04\x70'
+	b'\x04\x70\x04\x70\x04\x74\x04\x78\x04\x7b\x04\x7e\x04\x81\x04\x8a\x04\x8a\x04'
+	b'\x8a\x04\x8d\x04\x8d\x04\x93\x04\x96\x04\x9a\x04\x9f\x04\xa5\x04\xab\x04\xb2'
+	b'\x04\xb6\x04\xb6\x04\xbf\x04\xbf\x04\xc1\x04\xc1\x04\xc1\x04\xc6\x04\xca\x04'
+	b'\xce\x04\xd1\x04\xd1\x04\xd1\x04\xd1\x04\xd1\x04\xd5\x04\xdf\x04\xe3\x04\xe9'
+	b'\x04\xea\x04\xee\x04\xf5\x04\xfc\x04\x02\x05\x06\x05\x0d\x05\x14\x05\x19\x05'
+	b'\x1d\x05\x1d\x05\x20\x05\x23\x05\x23\x05\x25\x05\x27\x05\x27\x05\x29\x05',
+	# values
+	b'\x0c\x00\x0d\x00\x0e\x00\x0f\x00\x10\x00\x11\x00\x12\x00\x13\x00\x14\x00\x15'
+	b'\x00\x16\x00\x17\x00\x18\x00\x19\x00\x1a\x00\x0d\x00\x0e\x00\x0f\x00\x10\x00'
+	b'\x11\x00\x12\x00\x13\x00\x15\x00\x16\x00\x17\x00\x18\x00\x1e\x00\x12\x00\x14'
+	b'\x00\x19\x00\x1a\x00\x20\x00\x21\x00\x12\x00\x15\x00\x22\x00\x20\x00\x24\x00'
+	b'\x25\x00\x12\x00\x15\x00\x12\x00\x27\x00\x28\x00\x29\x00\x2b\x00\x2c\x00\x2d'
+	b'\x00\x12\x00\x15\x00\x2e\x00\x2f\x00\x30\x00\x33\x00\x34\x00\x15\x00\x36\x00'
+	b'\x12\x00\x37\x00\x39\x00\x3a\x00\x3b\x00\x3c\x00\x20\x00\x3d\x00\x3e\x00\x3f'
+	b'\x00\x40\x00\x41\x00\x42\x00\x43\x00\x44\x00\x45\x00\x3b\x00\x3c\x00\x3d\x00'
+	b'\x47\x00\x3f\x00\x40\x00\x41\x00\x42\x00\x43\x00\x44\x00\x45\x00\x48\x00\x4c'
+	b'\x00\x22\x00\x1e\x00\x53\x00\x54\x00\x55\x00\x56\x00\x57\x00\x58\x00\x12\x00'
+	b'\x59\x00\x5a\x00\x5b\x00\x5c\x00\x5d\x00\x5e\x00\x0c\x00\x1e\x00\x60\x00\x54'
+	b'\x00\x61\x00\x12\x00\x59\x00\x62\x00\x15\x00\x63\x00\x64\x00\x65\x00\x5c\x00'
+	b'\x66\x00\x67\x00\x68\x00\x61\x00\x12\x00\x66\x00\x6b\x00\x6c\x00\x6b\x00\x70'
+	b'\x00\x6c\x00\x1e\x00\x60\x00\x54\x00\x59\x00\x5c\x00\x67\x00\x1e\x00\x54\x00'
+	b'\x59\x00\x5c\x00\x1e\x00\x60\x00\x54\x00\x67\x00\x62\x00\x63\x00\x64\x00\x65'
+	b'\x00\x76\x00\x77\x00\x39\x00\x3a\x00\x3d\x00\x79\x00\x7a\x00\x7c\x00\x15\x00'
+	b'\x0c\x00\x1e\x00\x0d\x00\x0e\x00\x0f\x00\x10\x00\x11\x00\x12\x00\x13\x00\x14'
+	b'\x00\x15\x00\x16\x00\x17\x00\x18\x00\x19\x00\x1a\x00\x0c\x00\x1e\x00\x0d\x00'
+	b'\x0e\x00\x0f\x00\x10\x00\x11\x00\x12\x00\x13\x00\x14\x00\x15\x00\x16\x00\x17'
+	b'\x00\x18\x00\x19\x00\x1a\x00\x0d\x00\x0e\x00\x0f\x00\x10\x00\x11\x00\x12\x00'
+	b'\x13\x00\x15\x00\x16\x00\x17\x00\x18\x00\x1e\x00\x12\x00\x14\x00\x19\x00\x1a'
+	b'\x00\x88\x00\x12\x00\x89\x00\x0c\x00\x1e\x00\x0d\x00\x0e\x00\x0f\x00\x10\x00'
+	b'\x11\x00\x12\x00\x13\x00\x14\x00\x15\x00\x16\x00\x17\x00\x18\x00\x19\x00\x1a'
+	b'\x00\x0d\x00\x0e\x00\x0f\x00\x10\x00\x11\x00\x12\x00\x13\x00\x15\x00\x16\x00'
+	b'\x17\x00\x18\x00\x1e\x00\x12\x00\x14\x00\x19\x00\x1a\x00\x0c\x00\x1e\x00\x0d'
+	b'\x00\x0e\x00\x0f\x00\x10\x00\x11\x00\x12\x00\x13\x00\x14\x00\x15\x00\x16\x00'
+	b'\x17\x00\x18\x00\x19\x00\x1a\x00\x0d\x00\x0e\x00\x0f\x00\x10\x00\x11\x00\x12'
+	b'\x00\x13\x00\x15\x00\x16\x00\x17\x00\x18\x00\x1e\x00\x12\x00\x14\x00\x19\x00'
+	b'\x1a\x00\x0d\x00\x0e\x00\x0f\x00\x10\x00\x11\x00\x12\x00\x13\x00\x15\x00\x16'
+	b'\x00\x17\x00\x18\x00\x0c\x00\x1e\x00\x0d\x00\x0e\x00\x0f\x00\x10\x00\x11\x00'
+	b'\x12\x00\x13\x00\x14\x00\x15\x00\x16\x00\x17\x00\x18\x00\x19\x00\x1a\x00\x0d'
+	b'\x00\x0e\x00\x0f\x00\x10\x00\x11\x00\x12\x00\x13\x00\x15\x00\x16\x00\x17\x00'
+	b'\x18\x00\x1e\x00\x12\x00\x14\x00\x19\x00\x1a\x00\x1e\x00\x12\x00\x14\x00\x19'
+	b'\x00\x1a\x00\x1e\x00\x20\x00\x12\x00\x9f\x00\x54\x00\xa0\x00\xa1\x00\xa2\x00'
+	b'\x22\x00\xa4\x00\xa8\x00\xa9\x00\xac\x00\xad\x00\xae\x00\xaf\x00\x54\x00\xa0'
+	b'\x00\xb1\x00\xa1\x00\x6b\x00\x70\x00\x60\x00\x12\x00\x59\x00\x5c\x00\x67\x00'
+	b'\x2b\x00\xb5\x00\x12\x00\x59\x00\x15\x00\x5c\x00\x1e\x00\x20\x00\x12\x00\xb9'
+	b'\x00\xba\x00\x20\x00\xbb\x00\xbd\x00\x20\x00\x20\x00\xbf\x00\x39\x00\x22\x00'
+	b'\xc5\x00\x2b\x00\x39\x00\x20\x00\x1e\x00\xca\x00\x12\x00\xcb\x00\xcc\x00\xcd'
+	b'\x00\x1e\x00\xcf\x00\xd0\x00\x12\x00\xd1\x00\xd2\x00\xd3\x00\x15\x00\xd4\x00'
+	b'\xd5\x00\x1e\x00\x12\x00\x15\x00\x20\x00\xd8\x00\xd9\x00\x1e\x00\x20\x00\xde'
+	b'\x00\xdf\x00\xe0\x00\xe1\x00\xe2\x00\x12\x00\xe3\x00\xe4\x00\xe5\x00\xe6\x00'
+	b'\xe7\x00\xe8\x00\xe9\x00\xea\x00\xeb\x00\x2e\x00\xec\x00\xed\x00\x12\x00\xef'
+	b'\x00\xf0\x00\xf2\x00\xf3\x00\x12\x00\xf4\x00\xf5\x00\xf6\x00\xf7\x00\xf8\x00'
+	b'\x15\x00\xf9\x00\xfa\x00\xfb\x00\xfc\x00\xfd\x00\xfe\x00\xff\x00\x00\x01\x01'
+	b'\x01\x02\x01\x3c\x00\x20\x00\x3f\x00\x40\x00\x41\x00\x42\x00\x43\x00\x04\x01'
+	b'\x05\x01\x44\x00\x45\x00\x48\x00\x39\x00\x3a\x00\x47\x00\x3f\x00\x40\x00\x42'
+	b'\x00\x43\x00\x45\x00\x3b\x00\x3c\x00\x3d\x00\x47\x00\x3f\x00\x40\x00\x41\x00'
+	b'\x42\x00\x43\x00\x44\x00\x45\x00\x48\x00\x39\x00\x3a\x00\x47\x00\x3f\x00\x40'
+	b'\x00\x42\x00\x43\x00\x45\x00\x3b\x00\x3c\x00\x3d\x00\x47\x00\x0a\x01\x3f\x00'
+	b'\x40\x00\x41\x00\x42\x00\x43\x00\x44\x00\x45\x00\x48\x00\x39\x00\x0c\x01\x3a'
+	b'\x00\x20\x00\xbd\x00\x0e\x01\x1e\x00\x10\x01\x11\x01\x12\x01\x12\x00\x13\x01'
+	b'\x14\x01\x16\x01\x12\x00\x17\x01\x1a\x01\x11\x00\x1b\x01\x1c\x01\x12\x00\x59'
+	b'\x00\x15\x00\x5c\x00\x20\x01\x21\x01\x22\x01\x23\x01\x24\x01\x25\x01\x26\x01'
+	b'\x27\x01\x28\x01\x29\x01\x2a\x01\x2b\x01\x2c\x01\x2d\x01\x2e\x01\x2f\x01\x30'
+	b'\x01\x31\x01\x32\x01\x33\x01\x34\x01\x35\x01\x36\x01\x37\x01\x38\x01\x39\x01'
+	b'\x3a\x01\x3b\x01\x3c\x01\x3d\x01\x3e\x01\x3f\x01\x40\x01\x41\x01\x42\x01\x43'
+	b'\x01\x44\x01\x45\x01\x46\x01\x47\x01\x48\x01\x49\x01\x4a\x01\x4b\x01\x4c\x01'
+	b'\x4d\x01\x4e\x01\x4f\x01\x50\x01\x51\x01\x52\x01\x53\x01\x54\x01\x55\x01\x56'
+	b'\x01\x57\x01\x58\x01\x59\x01\x5a\x01\x5b\x01\x5c\x01\x5d\x01\x5e\x01\x5f\x01'
+	b'\x60\x01\x61\x01\x62\x01\x63\x01\x64\x01\x65\x01\x66\x01\x67\x01\x68\x01\x69'
+	b'\x01\x6a\x01\x6b\x01\x6c\x01\x6d\x01\x6e\x01\x6f\x01\x70\x01\x1e\x00\x71\x01'
+	b'\x72\x01\x73\x01\x74\x01\x75\x01\x76\x01\x77\x01\x78\x01\x79\x01\x7a\x01\x7b'
+	b'\x01\x7c\x01\x7d\x01\x7e\x01\x7f\x01\x80\x01\x81\x01\x82\x01\x83\x01\x84\x01'
+	b'\x85\x01\x86\x01\x87\x01\x88\x01\x89\x01\x8a\x01\x8b\x01\x8c\x01\x8d\x01\x8e'
+	b'\x01\x8f\x01\x90\x01\x91\x01\x92\x01\x93\x01\x94\x01\x95\x01\x96\x01\x97\x01'
+	b'\x98\x01\x99\x01\x9a\x01\x9b\x01\x9c\x01\x9d\x01\x9e\x01\x9f\x01\xa0\x01\xa1'
+	b'\x01\xa2\x01\xa3\x01\xa4\x01\xa5\x01\xa6\x01\xa7\x01\xa8\x01\xa9\x01\xaa\x01'
+	b'\xab\x01\xac\x01\xad\x01\xae\x01\xaf\x01\xb0\x01\xb1\x01\xb2\x01\xb3\x01\xb4'
+	b'\x01\xb5\x01\xb6\x01\xb7\x01\xb8\x01\xb9\x01\x12\x00\xba\x01\xbb\x01\xbc\x01'
+	b'\xbd\x01\x14\x00\xbe\x01\xbf\x01\x15\x00\x22\x00\xc0\x01\xc1\x01\xc2\x01\xc3'
+	b'\x01\xc4\x01\xc5\x01\xc6\x01\xc7\x01\xc8\x01\xc9\x01\xca\x01\xcb\x01\xcc\x01'
+	b'\xcd\x01\xce\x01\xcf\x01\x20\x01\x21\x01\x22\x01\x23\x01\x24\x01\x25\x01\x26'
+	b'\x01\x27\x01\x28\x01\x29\x01\x2a\x01\x2b\x01\x2c\x01\x2d\x01\x2e\x01\x2f\x01'
+	b'\x30\x01\x31\x01\x32\x01\x33\x01\x34\x01\x35\x01\x36\x01\x37\x01\x38\x01\x39'
+	b'\x01\x3a\x01\x3b\x01\x3c\x01\x3d\x01\x3e\x01\x3f\x01\x40\x01\x41\x01\x42\x01'
+	b'\x43\x01\x44\x01\x45\x01\x46\x01\x47\x01\x48\x01\x49\x01\x4a\x01\x4b\x01\x4c'
+	b'\x01\x4d\x01\x4e\x01\x4f\x01\x50\x01\x51\x01\x52\x01\x53\x01\x54\x01\x55\x01'
+	b'\x56\x01\x57\x01\x58\x01\x59\x01\x5a\x01\x5b\x01\x5c\x01\x5d\x01\x5e\x01\x5f'
+	b'\x01\x60\x01\x61\x01\x62\x01\x63\x01\x64\x01\x65\x01\x66\x01\x67\x01\x68\x01'
+	b'\x69\x01\x6a\x01\x6b\x01\x6c\x01\x6d\x01\x6e\x01\x6f\x01\x70\x01\x1e\x00\x7a'
+	b'\x01\x7b\x01\x7c\x01\x7d\x01\x7e\x01\x7f\x01\x80\x01\x81\x01\x82\x01\x83\x01'
+	b'\x84\x01\x85\x01\x86\x01\x87\x01\x88\x01\x89\x01\x8a\x01\x8b\x01\x8c\x01\x8d'
+	b'\x01\x8e\x01\x8f\x01\x90\x01\x91\x01\x92\x01\x93\x01\x94\x01\x95\x01\x96\x01'
+	b'\x97\x01\x98\x01\x99\x01\x9a\x01\x9b\x01\x9c\x01\x9d\x01\x9e\x01\x9f\x01\xa0'
+	b'\x01\xa1\x01\xa2\x01\xa3\x01\xa4\x01\xa5\x01\xa6\x01\xa7\x01\xa8\x01\xa9\x01'
+	b'\xaa\x01\xab\x01\xac\x01\xad\x01\xae\x01\xaf\x01\xb0\x01\xb1\x01\xb5\x01\xb9'
+	b'\x01\x12\x00\xbe\x01\xc2\x01\xc5\x01\x1e\x00\x12\x00\xbb\x01\xbc\x01\x14\x00'
+	b'\xc6\x01\xc8\x01\xcc\x01\xcd\x01\xce\x01\xcf\x01\xb4\x01\xb6\x01\xb7\x01\xb8'
+	b'\x01\xbf\x01\x22\x00\xc3\x01\xc4\x01\xc9\x01\xca\x01\xcb\x01\x12\x00\xba\x01'
+	b'\x22\x00\xc1\x01\x12\x00\x22\x00\xc7\x01\x71\x01\x72\x01\x73\x01\x74\x01\x75'
+	b'\x01\x76\x01\x77\x01\x78\x01\x79\x01\xb2\x01\xb3\x01\x12\x00\xbd\x01\x22\x00'
+	b'\xa0\x00\xd8\x01\xa1\x00\x1e\x00\x20\x00\x12\x00\x20\x00\xdf\x01\x15\x00\x7c'
+	b'\x00\x20\x00\xe2\x01\x20\x00\xe4\x01\x20\x00\x22\x00\xe6\x01\x20\x00\x24\x00'
+	b'\xe7\x01\xbd\x00\x0e\x01\xe9\x01\xad\x00\xeb\x01\xad\x00\xeb\x01\x1e\x00\x20'
+	b'\x00\x15\x00\x1e\x00\x20\x00\x15\x00\xb5\x00\xf0\x01\xf1\x01\x15\x00\x61\x00'
+	b'\xf3\x01\xf4\x01\x1e\x00\x20\x00\x12\x00\x1e\x00\x12\x00\x22\x00\x22\x00\xf4'
+	b'\x01\x1e\x00\x12\x00\x22\x00\xfa\x01\xfb\x01\xfd\x01\xfe\x01\x00\x02\x01\x02'
+	b'\x02\x02\x03\x02\x05\x02\x06\x02\x07\x02\xcf\x00\xd0\x00\x08\x02\x09\x02\x0a'
+	b'\x02\x0b\x02\x0c\x02\x12\x00\x0d\x02\x0e\x02\x0f\x02\x10\x02\xd1\x00\xd2\x00'
+	b'\xd3\x00\x15\x00\x11\x02\x12\x02\x13\x02\xd4\x00\xd5\x00\x68\x00\x12\x00\x0d'
+	b'\x02\x11\x02\x05\x02\x06\x02\x07\x02\xcf\x00\xd0\x00\x08\x02\x09\x02\x0a\x02'
+	b'\x0b\x02\x0c\x02\x12\x00\x0e\x02\x0f\x02\x10\x02\xd1\x00\xd2\x00\xd3\x00\x15'
+	b'\x00\x12\x02\x13\x02\xd4\x00\xd5\x00\xd7\x00\x21\x02\x12\x00\x15\x00\x23\x02'
+	b'\xa4\x00\x26\x02\x22\x00\x27\x02\x4c\x00\x66\x00\x29\x02\x2e\x02\x2f\x02\x22'
+	b'\x00\x31\x02\x32\x02\x20\x00\x34\x02\x20\x00\x31\x02\x32\x02\x20\x00\x31\x02'
+	b'\x32\x02\x20\x00\x0c\x00\x0d\x00\x0e\x00\x0f\x00\x10\x00\x11\x00\x12\x00\x13'
+	b'\x00\x14\x00\x15\x00\x16\x00\x17\x00\x18\x00\x19\x00\x1a\x00\x0d\x00\x0e\x00'
+	b'\x0f\x00\x10\x00\x11\x00\x12\x00\x13\x00\x15\x00\x16\x00\x17\x00\x18\x00\x1e'
+	b'\x00\x12\x00\x14\x00\x19\x00\x1a\x00\x20\x00\x11\x00\x12\x00\x66\x00\x3f\x02'
+	b'\x20\x00\x41\x02\x42\x02\x20\x00\x11\x00\x12\x00\x66\x00\x3f\x02\x20\x00\x11'
+	b'\x00\x12\x00\x66\x00\x3f\x02\x4c\x02\x20\x00\x4d\x02\x12\x00\x59\x00\x5c\x00'
+	b'\x4c\x02\x20\x00\x4d\x02\x12\x00\x59\x00\x5c\x00\x4c\x02\x20\x00\x4d\x02\x12'
+	b'\x00\x51\x02\xe9\x01\xa1\x00\x57\x02\x12\x00\x58\x02\x14\x00\x59\x02\x5a\x02'
+	b'\x20\x00\x12\x00\x5d\x02\x15\x00\x63\x00\x5f\x02\x61\x00\x12\x00\x60\x02\x61'
+	b'\x02\xbd\x00\x63\x02\x64\x02\x66\x02\xa0\x00\x15\x00\xa1\x00\xb5\x00\xad\x00'
+	b'\x15\x00\xaf\x00\x39\x00\x14\x00\x15\x00\x6c\x02\x6d\x02\x6e\x02\x6f\x02\x39'
+	b'\x00\x14\x00\x15\x00\x6c\x02\x6d\x02\x6e\x02\x6f\x02\x1e\x00\x20\x00\x12\x00'
+	b'\x20\x00\x54\x00\x75\x02\x76\x02\x12\x00\x59\x00\x77\x02\x5c\x00\x20\x00\x15'
+	b'\x00\x79\x02\x10\x01\xf4\x00\x7c\x02\x15\x00\x1e\x00\x20\x00\x86\x02\x87\x02'
+	b'\x12\x00\x15\x00\x22\x00\x89\x02\x4c\x02\x12\x00\x8b\x02\x8d\x02\x8e\x02\x12'
+	b'\x00\x90\x02\x12\x00\x15\x00\x1e\x00\x26\x02\x92\x02\x12\x00\x14\x00\x27\x02'
+	b'\x93\x02\x94\x02\x95\x02\x20\x00\x61\x00\x12\x00\x9b\x02\x33\x00\x9c\x02\x9d'
+	b'\x02\x9e\x02\x9f\x02\x15\x00\xa1\x02\xa2\x02\x10\x01\xa4\x02\x53\x00\xa5\x02'
+	b'\x54\x00\x12\x00\xb1\x00\x59\x00\x5c\x00\x20\x00\x54\x00\x12\x00\xb1\x00\x59'
+	b'\x00\x5c\x00\xa9\x02\x12\x00\xaa\x02\x15\x00\xab\x02\xac\x02\xae\x02\xaf\x02'
+	b'\xb0\x02\x06\x02\x08\x02\xb1\x02\x15\x00\x20\x00\xd1\x01\xb3\x02\xb4\x02\x20'
+	b'\x00\xb7\x02\xb8\x02\xb9\x02\xba\x02\xbb\x02\xbc\x02\xbd\x02\xbe\x02\xb6\x00'
+	b'\xc1\x02\xc5\x02\x12\x00\xc6\x02\x15\x00\xc7\x02\x10\x01\x20\x00\xc9\x02\x11'
+	b'\x01\xc5\x02\xc6\x02\x15\x00\xc7\x02\x1e\x00\x20\x00\x12\x00\xd0\x02\xd1\x02'
+	b'\x12\x00\x22\x00\x1e\x00\x3d\x00\x60\x00\x12\x00\x43\x00\x79\x00\x7a\x00\xd3'
+	b'\x02\xd4\x02\x67\x00\x88\x00\x11\x00\x12\x00\x3f\x02\x39\x00\x54\x00\x59\x00'
+	b'\x5b\x00\x5c\x00\x5e\x00\xd8\x02\x1e\x00\xda\x02\xdb\x02\xdc\x02\x34\x02\x3a'
+	b'\x00\x57\x02\x58\x02\x14\x00\x59\x02\x5a\x02\x34\x02\x3a\x00\x57\x02\x58\x02'
+	b'\x14\x00\x59\x02\x5a\x02\x3a\x00\x26\x02\x14\x00\x27\x02\x94\x02\x95\x02\xe1'
+	b'\x02\x15\x00\xe2\x02\x6c\x02\x34\x02\x3a\x00\xe4\x02\x14\x00\xe5\x02\xe6\x02'
+	b'\xe7\x02\x1e\x00\xe4\x02\x14\x00\xe9\x02\xe5\x02\xe6\x02\xe7\x02\x22\x00\xeb'
+	b'\x02\xec\x02\xed\x02\xee\x02\x88\x00\xf0\x02\xf1\x02\xf2\x02\x1e\x00\x20\x00'
+	b'\x12\x00\xf6\x02\xf7\x02\x22\x00\xfa\x02\x22\x00\xfc\x02\xfd\x02\x1e\x00\x22'
+	b'\x00')
 
-HTML_ATTRIBUTES_VALUES = {'abbr': [],
- 'above': [],
- 'accept': ['*',
-            'application/msexcel',
-            'application/msword',
-            'application/pdf',
-            'application/rtf',
-            'application/x-zip-compressed',
-            'text/html',
-            'text/plain'],
- 'accept-charset': ['*', 'ISO-8859-1', 'unknown'],
- 'accesskey': [],
- 'action': [],
- 'align': ['absbottom',
-           'absmiddle',
-           'baseline',
-           'bottom',
-           'center',
-           'justify',
-           'left',
-           'middle',
-           'right',
-           'texttop',
-           'top'],
- 'alink': [],
- 'allowtransparency': ['no', 'yes'],
- 'alt': [],
- 'application': ['no', 'yes'],
- 'archive': [],
- 'autocomplete': ['off', 'on'],
- 'autofocus': [],
- 'autoplay': ['false', 'true'],
- 'axis': [],
- 'background': [],
- 'balance': [],
- 'behavior': ['alternate', 'scroll', 'slide'],
- 'below': [],
- 'bgcolor': [],
- 'bgproperties': ['fixed'],
- 'border': [],
- 'bordercolor': [],
- 'bordercolordark': [],
- 'bordercolorlight': [],
- 'bottommargin': [],
- 'cellpadding': [],
- 'cellspacing': [],
- 'challenge': [],
- 'char': [],
- 'charoff': [],
- 'charset': ['*',
-             'HZ-GB-2312',
-             'ISO-2022-JP',
-             'ISO-2022-JP-2',
-             'ISO-2022-KR',
-             'ISO-8859-1',
-             'ISO-8859-10',
-             'ISO-8859-15',
-             'ISO-8859-2',
-             'ISO-8859-3',
-             'ISO-8859-4',
-             'ISO-8859-5',
-             'ISO-8859-6',
-             'ISO-8859-7',
-             'ISO-8859-8',
-             'ISO-8859-9',
-             'Shift_JIS',
-             'UTF-8',
-             'cp1250',
-             'cp1251',
-             'cp1252',
-             'cp1253',
-             'cp1254',
-             'cp1255',
-             'cp1256',
-             'cp1257',
-             'cp1258'],
- 'checked': ['checked'],
- 'cite': [],
- 'class': [],
- 'clear': ['all', 'left', 'none', 'right'],
- 'clip': [],
- 'code': [],
- 'codebase': [],
- 'color': [],
- 'cols': [],
- 'colspan': [],
- 'compact': ['compact'],
- 'content': ['*',
-             'text/html',
-             'text/html; charset=HZ-GB-2312',
-             'text/html; charset=ISO-2022-JP',
-             'text/html; charset=ISO-2022-JP-2',
-             'text/html; charset=ISO-2022-KR',
-             'text/html; charset=ISO-8859-10',
-             'text/html; charset=ISO-8859-15',
-             'text/html; charset=ISO-8859-2',
-             'text/html; charset=ISO-8859-3',
-             'text/html; charset=ISO-8859-4',
-             'text/html; charset=ISO-8859-5',
-             'text/html; charset=ISO-8859-6',
-             'text/html; charset=ISO-8859-7',
-             'text/html; charset=ISO-8859-8',
-             'text/html; charset=ISO-8859-9',
-             'text/html; charset=Shift_JIS',
-             'text/html; charset=UTF-8',
-             'text/html; charset=cp1250',
-             'text/html; charset=cp1251',
-             'text/html; charset=cp1252',
-             'text/html; charset=cp1253',
-             'text/html; charset=cp1254',
-             'text/html; charset=cp1255',
-             'text/html; charset=cp1256',
-             'text/html; charset=cp1257',
-             'text/html; charset=cp1258',
-             'text/html; charset=iso-8859-1'],
- 'contenteditable': ['false', 'inherit', 'true'],
- 'contextmenu': [],
- 'controls': ['false', 'true'],
- 'coords': [],
- 'data': [],
- 'datafld': [],
- 'dataformatas': ['html', 'text'],
- 'datapagesize': [],
- 'datasrc': [],
- 'datetime': [],
- 'declare': ['declare'],
- 'defer': ['defer'],
- 'dir': ['ltr', 'rtl'],
- 'direction': ['down', 'left', 'right', 'up'],
- 'disabled': ['false', 'true'],
- 'draggable': ['auto', 'false', 'true'],
- 'dynsrc': [],
- 'enctype': ['*',
-             'application/x-www-form-urlencoded',
-             'multipart/form-data',
-             'text/plain'],
- 'event': [],
- 'face': [],
- 'for': [],
- 'form': [],
- 'frame': ['above',
-           'below',
-           'border',
-           'box',
-           'hsides',
-           'lhs',
-           'rhs',
-           'void',
-           'vsides'],
- 'frameborder': ['0', '1', 'no', 'yes'],
- 'framespacing': [],
- 'galleryimg': ['false', 'no', 'true', 'yes'],
- 'headers': [],
- 'height': [],
- 'hidden': ['false', 'true'],
- 'hidefocus': ['false', 'true'],
- 'high': [],
- 'href': [],
- 'hreflang': [],
- 'hspace': [],
- 'http-equiv': ["Content-Type"],
- 'icon': [],
- 'id': [],
- 'keytype': [],
- 'label': [],
- 'lang': [],
- 'language': ['*',
-              'JScript',
-              'JavaScript',
-              'JavaScript1.1',
-              'JavaScript1.2',
-              'VBScript',
-              'javascript',
-              'jscript',
-              'php',
-              'vbs',
-              'vbscript'],
- 'left': [],
- 'leftmargin': [],
- 'link': [],
- 'longdesc': [],
- 'loop': [],
- 'low': [],
- 'lowsrc': [],
- 'marginheight': [],
- 'marginwidth': [],
- 'max': [],
- 'maxlength': [],
- 'mayscript': [],
- 'media': ['*',
-           'all',
-           'aural',
-           'braille',
-           'other',
-           'print',
-           'projection',
-           'screen'],
- 'method': ['get', 'post'],
- 'methods': [],
- 'min': [],
- 'multiple': ['multiple'],
- 'name': [],
- 'nohref': ['nohref'],
- 'noresize': ['noresize'],
- 'noshade': ['noshade'],
- 'nowrap': ['nowrap'],
- 'object': [],
- 'open': ['false', 'true'],
- 'optimum': [],
- 'overflow': ['clip', 'none'],
- 'pagex': [],
- 'pagey': [],
- 'palette': ['background', 'foreground'],
- 'pluginspage': [],
- 'point-size': [],
- 'poster': [],
- 'preload': ['auto', 'metadata', 'none'],
- 'profile': [],
- 'pubdate': ['false', 'true'],
- 'radiogroup': [],
- 'readonly': ['readonly'],
- 'rel': ['alternate',
-         'bookmark',
-         'chapter',
-         'contents',
-         'copyright',
-         'glossary',
-         'help',
-         'index',
-         'next',
-         'prev',
-         'section',
-         'start',
-         'stylesheet',
-         'subsection'],
- 'rev': ['alternate',
-         'bookmark',
-         'chapter',
-         'contents',
-         'copyright',
-         'glossary',
-         'help',
-         'index',
-         'next',
-         'prev',
-         'section',
-         'start',
-         'stylesheet',
-         'subsection'],
- 'reversed': [],
- 'rightmargin': [],
- 'rows': [],
- 'rowspan': [],
- 'rules': ['all', 'cols', 'groups', 'none', 'rows'],
- 'scheme': [],
- 'scope': ['col', 'colgroup', 'row', 'rowgroup'],
- 'scroll': ['auto', 'no', 'yes'],
- 'scrollamount': [],
- 'scrolldelay': [],
- 'scrolling': ['auto', 'no', 'yes'],
- 'selected': ['selected'],
- 'shape': ['circle', 'default', 'poly', 'rect'],
- 'size': ['*', '1', '2', '3', '4', '5', '6', '7'],
- 'span': [],
- 'spellcheck': ['default', 'false', 'true'],
- 'src': [],
- 'standby': [],
- 'start': [],
- 'style': [],
- 'summary': [],
- 'tabindex': [],
- 'target': ['*', '_blank', '_parent', '_self', '_top'],
- 'text': [],
- 'title': [],
- 'top': [],
- 'truespeed': ['truespeed'],
- 'type': ['*',
-          '1',
-          'A',
-          'I',
-          'a',
-          'application/javascript',
-          'application/x-shockwave-flash',
-          'button',
-          'checkbox',
-          'circle',
-          'color',
-          'date',
-          'datetime',
-          'datetime-local',
-          'disc',
-          'email',
-          'file',
-          'hidden',
-          'i',
-          'image',
-          'month',
-          'number',
-          'password',
-          'radio',
-          'range',
-          'reset',
-          'search',
-          'square',
-          'submit',
-          'tel',
-          'text',
-          'text/css',
-          'text/javascript',
-          'text/jscript',
-          'text/php',
-          'text/tcl',
-          'text/vbscript',
-          'time',
-          'url',
-          'week'],
- 'units': ['em', 'px'],
- 'unselectable': ['off', 'on'],
- 'urn': [],
- 'usemap': [],
- 'valign': ['baseline', 'bottom', 'center', 'middle', 'top'],
- 'value': [],
- 'valuetype': ['data', 'object', 'ref'],
- 'visibility': ['hidden', 'inherit', 'shown'],
- 'vlink': [],
- 'volume': [],
- 'vspace': [],
- 'weight': ['100', '200', '300', '400', '500', '600', '700', '800', '900'],
- 'width': [],
- 'wrap': ['hard', 'off', 'soft'],
- 'xml:space': ['preserve'],
- 'xmlns': ['http://www.w3.org/1999/xhtml'],
- 'z-index': []}
+HTML_ELEMENTS_ATTRIBUTES = CompactTable(STRINGS,
+	# keys
+	b'\x00\x03\x01\x03\x1b\x03\x1c\x03\x1d\x03\x1e\x03\x28\x03\x2a\x03\x2e\x03\x2f'
+	b'\x03\x34\x03\x35\x03\x36\x03\x38\x03\x39\x03\x3a\x03\xa9\x02\x3b\x03\x3d\x03'
+	b'\x48\x03\x49\x03\x4c\x03\x4d\x03\x54\x00\x3c\x03\x90\x02\x4f\x03\x52\x03\x53'
+	b'\x03\x57\x03\x59\x03\x5a\x03\x5b\x03\x5d\x03\x5f\x03\x09\x03\x60\x03\x61\x03'
+	b'\x62\x03\x63\x03\xd1\x02\x67\x03\x68\x03\x69\x03\x1f\x01\x6c\x03\x6d\x03\x73'
+	b'\x03\x7c\x03\x80\x03\x81\x03\x82\x03\x83\x03\x84\x03\x85\x03\x86\x03\x88\x03'
+	b'\x89\x03\x8a\x03\x8c\x03\x8e\x03\x8f\x03\x90\x03\x93\x03\x99\x03\x9d\x03\x9e'
+	b'\x03\x9f\x03\xa0\x03\x55\x03\xa5\x03\xa6\x03\xa7\x03\x43\x03\xa9\x03\x1c\x02'
+	b'\xaa\x03\xaf\x03\xb0\x03\xb1\x03\xb4\x03\xb8\x03\xb9\x03\xba\x03\xbb\x03\xbc'
+	b'\x03\x25\x03\xc1\x03\xc3\x03\xc4\x03\xc6\x03\xc7\x03\xc8\x03\xec\x02\xe8\x00'
+	b'\xcc\x03\xcd\x03\xce\x03\xcf\x03\xd0\x03\xd1\x03\xd2\x03\xd5\x03\xd6\x03\xc6'
+	b'\x01\xd7\x03\x51\x03\xd8\x03\x6c\x02\x15\x03\x79\x00\xd9\x03\xda\x03\xdb\x03'
+	b'\xfa\x00\xe2\x03\xe3\x03\xe9\x03\xea\x03\xeb\x03\xec\x03\xed\x03\x17\x03\xef'
+	b'\x03\xf0\x03\xf1\x03\xf2\x03\xf3\x03\xf4\x03\xf6\x03\xf7\x03\xf8\x03',
+	# offsets
+	b'\x00\x00\x00\x00\x1b\x00\x21\x00\x27\x00\x34\x00\x4b\x00\x5b\x00\x68\x00\x75'
+	b'\x00\x87\x00\x93\x00\x96\x00\x9a\x00\xa6\x00\xab\x00\xb8\x00\xbc\x00\xca\x00'
+	b'\xe5\x00\xea\x00\xfa\x00\x09\x01\x17\x01\x24\x01\x31\x01\x3b\x01\x48\x01\x55'
+	b'\x01\x6a\x01\x6e\x01\x7b\x01\x89\x01\x97\x01\xa5\x01\xb2\x01\xba\x01\xc9\x01'
+	b'\xd7\x01\xe6\x01\xf3\x01\x0a\x02\x19\x02\x26\x02\x33\x02\x45\x02\x52\x02\x65'
+	b'\x02\x7d\x02\x8d\x02\x9b\x02\xa9\x02\xb7\x02\xc5\x02\xd3\x02\xe1\x02\xe6\x02'
+	b'\xf3\x02\x00\x03\x0e\x03\x14\x03\x20\x03\x3b\x03\x4c\x03\x68\x03\x85\x03\x93'
+	b'\x03\xa1\x03\xae\x03\xc1\x03\xd2\x03\xe5\x03\xf3\x03\x02\x04\x11\x04\x17\x04'
+	b'\x24\x04\x3e\x04\x4b\x04\x5a\x04\x61\x04\x77\x04\x84\x04\x8c\x04\x90\x04\x96'
+	b'\x04\x9c\x04\xb9\x04\xca\x04\xd2\x04\xdd\x04\xed\x04\xfb\x04\x03\x05\x13\x05'
+	b'\x23\x05\x31\x05\x3e\x05\x4c\x05\x5a\x05\x67\x05\x74\x05\x7d\x05\x8a\x05\x9c'
+	b'\x05\xa8\x05\xb8\x05\xc7\x05\xd4\x05\xe1\x05\xe9\x05\xf6\x05\x03\x06\x0f\x06'
+	b'\x1c\x06\x39\x06\x49\x06\x66\x06\x78\x06\x87\x06\xa3\x06\xb2\x06\xc1\x06\xc4'
+	b'\x06\xd7\x06\xe4\x06\xf0\x06\xfe\x06\x0a\x07\x1e\x07\x1f\x07\x21\x07\x2d\x07',
+	# values
+	b'\x02\x03\x03\x03\x04\x03\x05\x03\x06\x03\x07\x03\x08\x03\x09\x03\x24\x00\x0a'
+	b'\x03\x0b\x03\x0c\x03\x0d\x03\x0e\x03\x0f\x03\x10\x03\x11\x03\x12\x03\x13\x03'
+	b'\x14\x03\x15\x03\x16\x03\x99\x02\x17\x03\x18\x03\x19\x03\x1a\x03\x04\x03\x09'
+	b'\x03\x0d\x03\x0e\x03\x15\x03\x17\x03\x04\x03\x09\x03\x0d\x03\x0e\x03\x15\x03'
+	b'\x17\x03\x02\x03\x04\x03\x05\x03\x09\x03\x24\x00\x0a\x03\x0d\x03\x0e\x03\x0f'
+	b'\x03\x15\x03\x16\x03\x17\x03\x19\x03\x02\x03\x1f\x03\x20\x03\x21\x03\x04\x03'
+	b'\x90\x02\x22\x03\x07\x03\x08\x03\xd9\x01\x0a\x03\x23\x03\x0d\x03\x24\x03\x11'
+	b'\x03\x25\x03\x26\x03\x15\x03\x16\x03\x17\x03\x19\x03\x27\x03\xf4\x02\x02\x03'
+	b'\x20\x03\x04\x03\x06\x03\x09\x03\x0a\x03\x0b\x03\x0d\x03\x0e\x03\x29\x03\x14'
+	b'\x03\x15\x03\x16\x03\x99\x02\x17\x03\x19\x03\x02\x03\x04\x03\x05\x03\x2b\x03'
+	b'\x09\x03\x2c\x03\x11\x00\x0d\x03\x0e\x03\x2d\x03\x15\x03\x16\x03\x17\x03\x02'
+	b'\x03\x04\x03\x05\x03\x2b\x03\x09\x03\x2c\x03\x11\x00\x0d\x03\x0e\x03\x2d\x03'
+	b'\x15\x03\x16\x03\x17\x03\x02\x03\x30\x03\x04\x03\x05\x03\x2b\x03\x31\x03\x09'
+	b'\x03\x2c\x03\x11\x00\x0d\x03\x0e\x03\x32\x03\x33\x03\x2d\x03\x26\x03\x15\x03'
+	b'\x16\x03\x17\x03\x02\x03\x04\x03\x05\x03\x09\x03\x0a\x03\x0d\x03\x0e\x03\x0f'
+	b'\x03\x15\x03\x16\x03\x17\x03\x19\x03\x0b\x03\x0d\x03\x99\x02\xb7\x00\x37\x03'
+	b'\x0d\x03\x85\x02\x02\x03\x04\x03\x05\x03\x09\x03\x0a\x03\x0d\x03\x0e\x03\x0f'
+	b'\x03\x15\x03\x16\x03\x17\x03\x19\x03\xbf\x00\x0d\x03\x32\x03\x26\x03\xe8\x02'
+	b'\x02\x03\x04\x03\x05\x03\x09\x03\x24\x00\x0a\x03\x0d\x03\x0e\x03\x0f\x03\x15'
+	b'\x03\x16\x03\x17\x03\x19\x03\x04\x03\x0d\x03\x0e\x03\x15\x03\x02\x03\x3c\x03'
+	b'\x04\x03\x05\x03\x09\x03\x24\x00\x0a\x03\x0d\x03\x0e\x03\x0f\x03\x15\x03\x16'
+	b'\x03\x17\x03\x19\x03\x02\x03\x3e\x03\x5f\x00\x3f\x03\x40\x03\x41\x03\x04\x03'
+	b'\x05\x03\x09\x03\x24\x00\x0a\x03\x0d\x03\x0e\x03\x0f\x03\x42\x03\x43\x03\x44'
+	b'\x03\x45\x03\xeb\x02\x46\x03\x66\x00\x15\x03\x16\x03\x2e\x00\x17\x03\x19\x03'
+	b'\x47\x03\x04\x03\xb4\x00\x0d\x03\x15\x03\x17\x03\x02\x03\x04\x03\x05\x03\x07'
+	b'\x03\x4a\x03\x08\x03\x0a\x03\x0d\x03\x0e\x03\x0f\x03\x11\x03\x15\x03\x16\x03'
+	b'\x17\x03\x18\x03\x4b\x03\x02\x03\x04\x03\x05\x03\x2b\x03\x09\x03\x2c\x03\xd9'
+	b'\x01\x11\x00\x0d\x03\x0e\x03\x2d\x03\x15\x03\x16\x03\x17\x03\xf4\x02\x02\x03'
+	b'\x1f\x03\x04\x03\x05\x03\x09\x03\x0a\x03\x0d\x03\x0e\x03\x0f\x03\x15\x03\x16'
+	b'\x03\x17\x03\x19\x03\x4e\x03\x02\x03\x04\x03\x05\x03\x09\x03\x24\x00\x0a\x03'
+	b'\x0d\x03\x0e\x03\x0f\x03\x15\x03\x16\x03\x17\x03\x19\x03\x02\x03\x04\x03\x05'
+	b'\x03\x09\x03\x24\x00\x0a\x03\x0d\x03\x0e\x03\x0f\x03\x15\x03\x16\x03\x17\x03'
+	b'\x19\x03\x04\x03\x05\x03\x09\x03\x24\x00\x0d\x03\x0e\x03\x0f\x03\x15\x03\x17'
+	b'\x03\x19\x03\x1f\x03\x3f\x03\xf0\x01\x50\x03\x04\x03\x09\x03\x0d\x03\x0e\x03'
+	b'\x51\x03\x15\x03\x17\x03\x4e\x03\xf4\x02\x1f\x03\x3f\x03\xf0\x01\x50\x03\x04'
+	b'\x03\x09\x03\x0d\x03\x0e\x03\x51\x03\x15\x03\x17\x03\x4e\x03\xf4\x02\x02\x03'
+	b'\x54\x03\x04\x03\x05\x03\x2b\x03\x09\x03\x24\x00\x2c\x03\xd9\x01\x11\x00\xe0'
+	b'\x01\x0d\x03\x55\x03\x0e\x03\x56\x03\x2d\x03\x15\x03\x16\x03\x17\x03\x18\x03'
+	b'\xf4\x02\x58\x03\x0d\x03\x0e\x03\x17\x03\x02\x03\x04\x03\x05\x03\x2b\x03\x09'
+	b'\x03\x2c\x03\x11\x00\x0d\x03\x0e\x03\x2d\x03\x15\x03\x16\x03\x17\x03\x02\x03'
+	b'\x04\x03\x05\x03\x09\x03\x24\x00\x0a\x03\x0d\x03\x0e\x03\x0f\x03\xeb\x02\x15'
+	b'\x03\x16\x03\x17\x03\x19\x03\x02\x03\x3c\x03\x04\x03\x05\x03\x5c\x03\x09\x03'
+	b'\x24\x00\x0d\x03\x0e\x03\x0f\x03\x15\x03\x16\x03\x17\x03\x19\x03\x02\x03\x04'
+	b'\x03\x05\x03\x2b\x03\x09\x03\x2c\x03\x11\x00\x0d\x03\x0e\x03\x5e\x03\x2d\x03'
+	b'\x15\x03\x16\x03\x17\x03\x02\x03\x04\x03\x05\x03\x09\x03\x24\x00\x0a\x03\x0d'
+	b'\x03\x0e\x03\x0f\x03\x15\x03\x16\x03\x17\x03\x19\x03\x02\x03\x05\x03\x09\x03'
+	b'\x24\x00\x0a\x03\x0f\x03\x16\x03\x19\x03\x02\x03\x1f\x03\x04\x03\x05\x03\x09'
+	b'\x03\x24\x00\x0a\x03\x0d\x03\x0e\x03\x0f\x03\xeb\x02\x15\x03\x16\x03\x17\x03'
+	b'\x19\x03\x02\x03\x04\x03\xf3\x00\x05\x03\x09\x03\x24\x00\x0a\x03\x0d\x03\x0e'
+	b'\x03\x0f\x03\x15\x03\x16\x03\x17\x03\x19\x03\x02\x03\x04\x03\xf3\x00\x05\x03'
+	b'\x09\x03\x24\x00\x0a\x03\x0d\x03\x0e\x03\x0f\x03\xeb\x02\x15\x03\x16\x03\x17'
+	b'\x03\x19\x03\x02\x03\x04\x03\x05\x03\x09\x03\x24\x00\x0a\x03\x0d\x03\x0e\x03'
+	b'\x0f\x03\x15\x03\x16\x03\x17\x03\x19\x03\x02\x03\x1f\x03\x20\x03\x80\x00\x04'
+	b'\x03\x90\x02\x22\x03\xd9\x01\x11\x00\x23\x03\x0d\x03\x0f\x03\x11\x03\x64\x03'
+	b'\x65\x03\x26\x03\x15\x03\x17\x03\x18\x03\x66\x03\x19\x03\x27\x03\xf4\x02\x02'
+	b'\x03\x1f\x03\x04\x03\x05\x03\x07\x03\x09\x03\x24\x00\x0a\x03\x0d\x03\x0e\x03'
+	b'\x0f\x03\x15\x03\x16\x03\x17\x03\x19\x03\x02\x03\x04\x03\x05\x03\x2b\x03\x09'
+	b'\x03\x2c\x03\x11\x00\x0d\x03\x0e\x03\x2d\x03\x15\x03\x16\x03\x17\x03\x02\x03'
+	b'\x04\x03\x05\x03\x2b\x03\x09\x03\x2c\x03\x11\x00\x0d\x03\x0e\x03\x2d\x03\x15'
+	b'\x03\x16\x03\x17\x03\x02\x03\x04\x03\xb7\x00\x05\x03\x09\x03\x24\x00\x37\x03'
+	b'\x0a\x03\x0d\x03\x0e\x03\x0f\x03\x6a\x03\x85\x02\x15\x03\x16\x03\x17\x03\x19'
+	b'\x03\x6b\x03\x02\x03\x04\x03\x05\x03\x2b\x03\x09\x03\x2c\x03\x11\x00\x0d\x03'
+	b'\x0e\x03\x2d\x03\x15\x03\x16\x03\x17\x03\x6e\x03\x6f\x03\x70\x03\x04\x03\x05'
+	b'\x03\x09\x03\x24\x00\x71\x03\x0a\x03\x0d\x03\x0e\x03\x0f\x03\x72\x03\x11\x03'
+	b'\x15\x03\x16\x03\x99\x02\x17\x03\x19\x03\x74\x03\x75\x03\x76\x03\x04\x03\x07'
+	b'\x03\x08\x03\x77\x03\xd9\x01\x0a\x03\x0d\x03\x0e\x03\x0f\x03\x78\x03\x44\x03'
+	b'\x45\x03\x11\x03\x79\x03\x7a\x03\x7b\x03\x15\x03\x16\x03\x17\x03\x19\x03\xf4'
+	b'\x02\x80\x00\x76\x03\x04\x03\x7d\x03\x77\x03\x7e\x03\x0a\x03\x0d\x03\x0e\x03'
+	b'\x0f\x03\x78\x03\x7f\x03\x15\x03\x16\x03\x17\x03\x19\x03\x02\x03\x1f\x03\x04'
+	b'\x03\x05\x03\x09\x03\x24\x00\x0a\x03\x0d\x03\x0e\x03\x0f\x03\x15\x03\x16\x03'
+	b'\x17\x03\x19\x03\x02\x03\x1f\x03\x04\x03\x05\x03\x09\x03\x24\x00\x0a\x03\x0d'
+	b'\x03\x0e\x03\x0f\x03\x15\x03\x16\x03\x17\x03\x19\x03\x02\x03\x1f\x03\x04\x03'
+	b'\x05\x03\x09\x03\x24\x00\x0a\x03\x0d\x03\x0e\x03\x0f\x03\x15\x03\x16\x03\x17'
+	b'\x03\x19\x03\x02\x03\x1f\x03\x04\x03\x05\x03\x09\x03\x24\x00\x0a\x03\x0d\x03'
+	b'\x0e\x03\x0f\x03\x15\x03\x16\x03\x17\x03\x19\x03\x02\x03\x1f\x03\x04\x03\x05'
+	b'\x03\x09\x03\x24\x00\x0a\x03\x0d\x03\x0e\x03\x0f\x03\x15\x03\x16\x03\x17\x03'
+	b'\x19\x03\x02\x03\x1f\x03\x04\x03\x05\x03\x09\x03\x24\x00\x0a\x03\x0d\x03\x0e'
+	b'\x03\x0f\x03\x15\x03\x16\x03\x17\x03\x19\x03\x04\x03\x09\x03\x0d\x03\x0e\x03'
+	b'\x87\x03\x02\x03\x04\x03\x05\x03\x2b\x03\x09\x03\x2c\x03\x11\x00\x0d\x03\x0e'
+	b'\x03\x2d\x03\x15\x03\x16\x03\x17\x03\x02\x03\x04\x03\x05\x03\x2b\x03\x09\x03'
+	b'\x2c\x03\x11\x00\x0d\x03\x0e\x03\x2d\x03\x15\x03\x16\x03\x17\x03\x02\x03\x1f'
+	b'\x03\x04\x03\x09\x03\x0a\x03\x0d\x03\x0e\x03\x0f\x03\x8b\x03\x85\x02\x15\x03'
+	b'\x16\x03\x17\x03\x19\x03\x04\x03\x09\x03\x0d\x03\x0e\x03\x66\x00\x8d\x03\x02'
+	b'\x03\x04\x03\x09\x03\x24\x00\x0a\x03\x0d\x03\x0e\x03\x0f\x03\x15\x03\x16\x03'
+	b'\x17\x03\x19\x03\x1f\x03\x74\x03\x75\x03\x76\x03\x04\x03\x07\x03\x08\x03\x77'
+	b'\x03\xd9\x01\x0a\x03\x23\x03\x0d\x03\x0e\x03\x0f\x03\x78\x03\x44\x03\x45\x03'
+	b'\x11\x03\x7a\x03\x7b\x03\x26\x03\x15\x03\x16\x03\x17\x03\x19\x03\x27\x03\xf4'
+	b'\x02\x10\x01\x5f\x00\x11\x01\x04\x03\xb6\x00\xd9\x01\x0d\x03\x59\x00\x11\x03'
+	b'\x91\x03\x92\x03\x26\x03\x15\x03\x67\x00\xd5\x02\xf4\x02\xfe\x02\x02\x03\x1f'
+	b'\x03\x20\x03\x80\x00\x04\x03\x07\x03\x08\x03\x09\x03\x94\x03\x95\x03\xd9\x01'
+	b'\x0a\x03\x23\x03\x0d\x03\x96\x03\x0e\x03\x0f\x03\x78\x03\x32\x03\x97\x03\x26'
+	b'\x03\x15\x03\x16\x03\x17\x03\x19\x03\x98\x03\x27\x03\xf4\x02\x9a\x03\x02\x03'
+	b'\x1f\x03\x20\x03\x70\x03\x54\x03\x04\x03\x09\x03\x24\x00\x94\x03\x0a\x03\x23'
+	b'\x03\x0d\x03\x0e\x03\x0f\x03\x32\x03\x97\x03\x9b\x03\x11\x03\x9c\x03\x85\x02'
+	b'\x26\x03\x15\x03\x16\x03\x17\x03\x18\x03\x19\x03\x4b\x03\x27\x03\x02\x03\x3c'
+	b'\x03\x04\x03\x05\x03\x5c\x03\x09\x03\x24\x00\x0d\x03\x0e\x03\x0f\x03\x15\x03'
+	b'\x16\x03\x17\x03\x19\x03\x02\x03\x6f\x03\x04\x03\x09\x03\x24\x00\x0a\x03\x0b'
+	b'\x03\x0d\x03\x0e\x03\x0f\x03\x15\x03\x16\x03\x17\x03\x19\x03\x02\x03\x04\x03'
+	b'\x05\x03\x09\x03\x24\x00\x0a\x03\x0d\x03\x0e\x03\x0f\x03\x15\x03\x16\x03\x17'
+	b'\x03\x19\x03\x02\x03\xa1\x03\xa2\x03\x04\x03\x05\x03\x2b\x03\x09\x03\x24\x00'
+	b'\x2c\x03\x6d\x03\x11\x00\x0d\x03\xa3\x03\x0e\x03\x11\x03\x2d\x03\x15\x03\x16'
+	b'\x03\x17\x03\x02\x03\x04\x03\x05\x03\x07\x03\x4a\x03\x08\x03\x09\x03\x24\x00'
+	b'\xa4\x03\x0a\x03\x0d\x03\x0e\x03\x0f\x03\x15\x03\x16\x03\x17\x03\x19\x03\x10'
+	b'\x01\x5f\x00\x11\x01\x3f\x03\x04\x03\xb6\x00\xd9\x01\x0d\x03\x59\x00\x11\x03'
+	b'\x3e\x02\x91\x03\x92\x03\x15\x03\x17\x03\x67\x00\xd5\x02\xf4\x02\xfe\x02\x02'
+	b'\x03\x1f\x03\x04\x03\x05\x03\x09\x03\x24\x00\x0a\x03\x0d\x03\x0e\x03\x0f\x03'
+	b'\x15\x03\x16\x03\x17\x03\x19\x03\x02\x03\x04\x03\x05\x03\x09\x03\x24\x00\x0a'
+	b'\x03\x0d\x03\x0e\x03\x0f\x03\x15\x03\x16\x03\x17\x03\x18\x03\x19\x03\x4b\x03'
+	b'\x03\x03\x04\x03\x09\x03\x24\x00\x0b\x03\x0c\x03\x0d\x03\x0e\x03\xa8\x03\x12'
+	b'\x03\x13\x03\x15\x03\x99\x02\x17\x03\x18\x03\x04\x03\x09\x03\x0d\x03\x0e\x03'
+	b'\x15\x03\x17\x03\x02\x03\x04\x03\x05\x03\x2b\x03\x09\x03\x2c\x03\x11\x00\x0d'
+	b'\x03\x0e\x03\x2d\x03\x15\x03\x16\x03\x17\x03\x02\x03\xab\x03\x3f\x03\x04\x03'
+	b'\x05\x03\x07\x03\x4a\x03\x08\x03\x09\x03\xee\x00\xd9\x01\x0a\x03\x23\x03\x0d'
+	b'\x03\x0e\x03\x0f\x03\x32\x03\xac\x03\xad\x03\x15\x03\x16\x03\x17\x03\xae\x03'
+	b'\x19\x03\x27\x03\xf4\x02\x02\x03\x04\x03\x05\x03\x2b\x03\x09\x03\x2c\x03\x11'
+	b'\x00\x0d\x03\x0e\x03\x2d\x03\x15\x03\x16\x03\x17\x03\x02\x03\x04\x03\x05\x03'
+	b'\x2b\x03\x09\x03\x2c\x03\x11\x00\x0d\x03\x55\x03\x0e\x03\x2d\x03\x15\x03\x16'
+	b'\x03\x17\x03\x18\x03\xc9\x00\x09\x03\xb2\x03\x0d\x03\x0e\x03\x11\x03\xb3\x03'
+	b'\x02\x03\x04\x03\x05\x03\x2b\x03\x09\x03\x2c\x03\x6d\x03\x11\x00\x57\x02\x0d'
+	b'\x03\x55\x03\x0e\x03\x58\x02\xb5\x03\xb6\x03\xb7\x03\x2d\x03\x15\x03\x16\x03'
+	b'\x17\x03\x18\x03\x4b\x03\x02\x03\x04\x03\x05\x03\x2b\x03\x09\x03\x2c\x03\x11'
+	b'\x00\x0d\x03\x0e\x03\x2d\x03\x15\x03\x16\x03\x17\x03\x04\x03\x05\x03\x09\x03'
+	b'\x24\x00\x0d\x03\x15\x03\x17\x03\x19\x03\x04\x03\x0d\x03\x15\x03\x17\x03\x04'
+	b'\x03\x09\x03\x0d\x03\x0e\x03\x15\x03\x17\x03\x04\x03\x09\x03\x0d\x03\x0e\x03'
+	b'\x15\x03\x17\x03\x02\x03\x1f\x03\x21\x03\x80\x00\x04\x03\xbd\x03\x90\x02\x22'
+	b'\x03\xbe\x03\x58\x03\x07\x03\x08\x03\xbf\x03\x09\x03\xd9\x01\x0a\x03\x23\x03'
+	b'\x0d\x03\x0e\x03\x11\x03\xc0\x03\x15\x03\x16\x03\x17\x03\x18\x03\x19\x03\x98'
+	b'\x03\x27\x03\xf4\x02\x02\x03\x04\x03\xf3\x00\x05\x03\x09\x03\x24\x00\x0a\x03'
+	b'\x0d\x03\x0e\x03\x0f\x03\xc2\x03\xa1\x00\x15\x03\x16\x03\x17\x03\x18\x03\x19'
+	b'\x03\x04\x03\x09\x03\x24\x00\x0d\x03\x55\x03\x0e\x03\x15\x03\x17\x03\x04\x03'
+	b'\x09\x03\x24\x00\x0d\x03\x55\x03\x0e\x03\x0f\x03\xc5\x03\x15\x03\x17\x03\x4b'
+	b'\x03\x02\x03\x04\x03\x05\x03\x2b\x03\x09\x03\x2c\x03\xa4\x03\x6d\x03\x11\x00'
+	b'\x0d\x03\x0e\x03\x11\x03\x2d\x03\x15\x03\x16\x03\x17\x03\x02\x03\x1f\x03\x04'
+	b'\x03\x05\x03\x09\x03\x24\x00\x0a\x03\x0d\x03\x0e\x03\x0f\x03\x15\x03\x16\x03'
+	b'\x17\x03\x19\x03\x07\x03\x4a\x03\x08\x03\x0d\x03\x11\x03\x18\x03\x4b\x03\xc9'
+	b'\x03\x02\x03\x04\x03\x05\x03\x09\x03\x24\x00\x0a\x03\x0d\x03\x0e\x03\x0f\x03'
+	b'\x15\x03\x16\x03\x17\x03\x19\x03\xf4\x02\xca\x03\xcb\x03\x02\x03\x04\x03\x05'
+	b'\x03\x2b\x03\x09\x03\x2c\x03\x6d\x03\x11\x00\x0d\x03\x0e\x03\xb5\x03\x2d\x03'
+	b'\x15\x03\x16\x03\x17\x03\x4b\x03\x02\x03\x3c\x03\x04\x03\x05\x03\x09\x03\x24'
+	b'\x00\x0a\x03\x0d\x03\x0e\x03\x0f\x03\x15\x03\x16\x03\x17\x03\x19\x03\x02\x03'
+	b'\x04\x03\x05\x03\x2b\x03\x09\x03\x2c\x03\x11\x00\x0d\x03\x0e\x03\x2d\x03\x15'
+	b'\x03\x16\x03\x17\x03\x02\x03\x04\x03\x05\x03\x09\x03\x24\x00\x0a\x03\x0d\x03'
+	b'\x0e\x03\x0f\x03\x11\x03\x15\x03\x16\x03\x17\x03\x19\x03\x02\x03\x04\x03\x05'
+	b'\x03\x09\x03\x24\x00\x0a\x03\x0d\x03\x0e\x03\x0f\x03\x11\x03\x15\x03\x16\x03'
+	b'\x17\x03\x19\x03\x02\x03\x04\x03\x05\x03\x09\x03\x24\x00\x0a\x03\x0d\x03\x0e'
+	b'\x03\x0f\x03\x15\x03\x16\x03\x17\x03\x19\x03\x02\x03\x04\x03\x05\x03\x09\x03'
+	b'\x24\x00\x0a\x03\x0d\x03\x0e\x03\x0f\x03\x15\x03\x16\x03\x17\x03\x19\x03\x03'
+	b'\x03\xd3\x03\xd4\x03\xa4\x03\x0d\x03\x0f\x03\x26\x03\x18\x03\xcb\x03\x02\x03'
+	b'\x04\x03\x05\x03\x2b\x03\x09\x03\x2c\x03\x11\x00\x0d\x03\x0e\x03\x2d\x03\x15'
+	b'\x03\x16\x03\x17\x03\x02\x03\x1f\x03\x04\x03\x07\x03\x08\x03\x09\x03\x24\x00'
+	b'\x0a\x03\x0d\x03\x0e\x03\x0f\x03\xa8\x00\x11\x03\x85\x02\x15\x03\x16\x03\x17'
+	b'\x03\x19\x03\x02\x03\x04\x03\x05\x03\x09\x03\x0a\x03\x0d\x03\x0e\x03\x0f\x03'
+	b'\x15\x03\x16\x03\x17\x03\x19\x03\x02\x03\x04\x03\x05\x03\x2b\x03\x09\x03\x2c'
+	b'\x03\x11\x00\x0d\x03\x0e\x03\xa8\x03\x2d\x03\x26\x03\x15\x03\x16\x03\x17\x03'
+	b'\x18\x03\x02\x03\x04\x03\x05\x03\x07\x03\x4a\x03\x08\x03\x09\x03\x0a\x03\x0d'
+	b'\x03\x0e\x03\x0f\x03\x15\x03\x16\x03\x17\x03\x19\x03\x02\x03\x04\x03\x05\x03'
+	b'\x09\x03\x24\x00\x0a\x03\x0d\x03\x0e\x03\x0f\x03\x15\x03\x16\x03\x17\x03\x19'
+	b'\x03\x02\x03\x04\x03\x05\x03\x09\x03\x24\x00\x0a\x03\x0d\x03\x0e\x03\x0f\x03'
+	b'\x15\x03\x16\x03\x17\x03\x19\x03\x09\x03\x24\x00\x0d\x03\x0e\x03\xa8\x03\x17'
+	b'\x03\x18\x03\xcb\x03\x02\x03\x04\x03\x05\x03\x09\x03\x24\x00\x0a\x03\x0d\x03'
+	b'\x0e\x03\x0f\x03\x15\x03\x16\x03\x17\x03\x19\x03\x02\x03\x04\x03\x05\x03\x2b'
+	b'\x03\x09\x03\x2c\x03\x11\x00\x0d\x03\x0e\x03\x2d\x03\x15\x03\x16\x03\x17\x03'
+	b'\x02\x03\x04\x03\x05\x03\x09\x03\x0a\x03\x0d\x03\x0e\x03\x0f\x03\x15\x03\x16'
+	b'\x03\x17\x03\x19\x03\x02\x03\x04\x03\x05\x03\x2b\x03\x09\x03\x2c\x03\x11\x00'
+	b'\x0d\x03\x0e\x03\x2d\x03\x15\x03\x16\x03\x17\x03\x02\x03\x5f\x00\x3f\x03\x80'
+	b'\x00\x76\x03\xdc\x03\xdd\x03\xde\x03\xdf\x03\x04\x03\x7d\x03\xe0\x03\x08\x03'
+	b'\x09\x03\x73\x03\xd9\x01\x0a\x03\x23\x03\x0d\x03\x0e\x03\x0f\x03\xe1\x03\x15'
+	b'\x03\xd9\x03\x16\x03\x17\x03\x19\x03\x27\x03\xf4\x02\x02\x03\x1f\x03\x3f\x03'
+	b'\xf0\x01\x50\x03\x04\x03\x09\x03\x0a\x03\x0d\x03\x0e\x03\x0f\x03\x15\x03\x16'
+	b'\x03\x17\x03\x19\x03\x4e\x03\x1b\x03\x02\x03\x1f\x03\xe4\x03\x5f\x00\x3f\x03'
+	b'\x76\x03\xdc\x03\xdd\x03\xf0\x01\x50\x03\x04\x03\xe5\x03\x09\x03\xe6\x03\xd9'
+	b'\x01\x0a\x03\x0d\x03\x0e\x03\x0f\x03\xeb\x02\xe7\x03\xe8\x03\x15\x03\x16\x03'
+	b'\x17\x03\x19\x03\x4e\x03\xf4\x02\x02\x03\x04\x03\x7d\x03\x07\x03\x08\x03\x09'
+	b'\x03\x24\x00\x0a\x03\x0d\x03\x0e\x03\x0f\x03\x11\x03\x9c\x03\x7f\x03\x15\x03'
+	b'\x16\x03\x17\x03\xca\x03\x02\x03\x1f\x03\xf0\x01\x50\x03\x04\x03\x09\x03\x0a'
+	b'\x03\x0d\x03\x0e\x03\x0f\x03\x15\x03\x16\x03\x17\x03\x19\x03\x4e\x03\x1b\x03'
+	b'\x02\x03\x1f\x03\xe4\x03\x5f\x00\x3f\x03\x76\x03\xdc\x03\xdd\x03\xf0\x01\x50'
+	b'\x03\x04\x03\xe5\x03\x09\x03\xe6\x03\xd9\x01\x0a\x03\x0d\x03\x0e\x03\x0f\x03'
+	b'\xeb\x02\xe7\x03\xe8\x03\x15\x03\x16\x03\x17\x03\x19\x03\x4e\x03\x02\x03\x1f'
+	b'\x03\xf0\x01\x50\x03\x04\x03\x09\x03\x0a\x03\x0d\x03\x0e\x03\x0f\x03\x15\x03'
+	b'\x16\x03\x17\x03\x19\x03\x4e\x03\x02\x03\x04\x03\x05\x03\x2b\x03\x5c\x03\x09'
+	b'\x03\x2c\x03\x11\x00\x0d\x03\x0e\x03\xee\x03\x2d\x03\x15\x03\x16\x03\x17\x03'
+	b'\x09\x03\x0d\x03\x0e\x03\x02\x03\x1f\x03\x3f\x03\x76\x03\xdc\x03\xdd\x03\xf0'
+	b'\x01\x50\x03\x04\x03\x09\x03\xd9\x01\x0a\x03\x0d\x03\x0e\x03\x0f\x03\x15\x03'
+	b'\x16\x03\x17\x03\x4e\x03\x02\x03\x04\x03\x05\x03\x09\x03\x24\x00\x0a\x03\x0d'
+	b'\x03\x0e\x03\x0f\x03\x15\x03\x16\x03\x17\x03\x19\x03\x02\x03\x04\x03\x05\x03'
+	b'\x09\x03\x0a\x03\x0d\x03\x0e\x03\x0f\x03\x15\x03\x16\x03\x17\x03\x19\x03\x02'
+	b'\x03\x04\x03\xf3\x00\x05\x03\x09\x03\x0a\x03\x0d\x03\x0e\x03\x0f\x03\x15\x03'
+	b'\x16\x03\x17\x03\x18\x03\x19\x03\x02\x03\x04\x03\x05\x03\x09\x03\x0a\x03\x0d'
+	b'\x03\x0e\x03\x0f\x03\x15\x03\x16\x03\x17\x03\x19\x03\x02\x03\x30\x03\x04\x03'
+	b'\x05\x03\x2b\x03\x09\x03\x2c\x03\xd9\x01\x11\x00\x0d\x03\x0e\x03\x32\x03\xf5'
+	b'\x03\x33\x03\x2d\x03\x26\x03\x15\x03\x16\x03\x17\x03\xf4\x02\x0d\x03\x0d\x03'
+	b'\x26\x03\x02\x03\x04\x03\x05\x03\x09\x03\x0a\x03\x0d\x03\x0e\x03\x0f\x03\x15'
+	b'\x03\x16\x03\x17\x03\x19\x03')
 
+HTML_ATTRIBUTES_VALUES = CompactTable(STRINGS,
+	# keys
+	b'\x1b\x03\x10\x01\x9a\x03\x6e\x03\x02\x03\x6f\x03\x1f\x03\x3e\x03\x74\x03\x20'
+	b'\x03\x75\x03\x21\x03\x70\x03\xa1\x03\x30\x03\xe4\x03\x5f\x00\xbf\x00\xab\x03'
+	b'\x11\x01\x3f\x03\x40\x03\x80\x00\x76\x03\xdc\x03\xdd\x03\x41\x03\xde\x03\xdf'
+	b'\x03\xa2\x03\xf0\x01\x50\x03\x03\x03\x54\x03\x3c\x03\x04\x03\xb4\x00\xb6\x00'
+	b'\x90\x02\x22\x03\xb7\x00\x7d\x03\xe5\x03\xf3\x00\xc9\x00\x05\x03\x2b\x03\x31'
+	b'\x03\x06\x03\x58\x03\x07\x03\x4a\x03\xe0\x03\x08\x03\x5c\x03\xbf\x03\xd3\x03'
+	b'\x09\x03\xee\x00\x24\x00\x2c\x03\x94\x03\x71\x03\xd4\x03\x37\x03\xa4\x03\x6d'
+	b'\x03\x73\x03\x77\x03\x7e\x03\x95\x03\xe6\x03\xd9\x01\x11\x00\x0a\x03\x57\x02'
+	b'\x0b\x03\x0c\x03\x23\x03\xb2\x03\xe0\x01\x0d\x03\xa3\x03\x55\x03\x0e\x03\x0f'
+	b'\x03\x59\x00\x42\x03\x43\x03\x78\x03\x32\x03\x58\x02\x97\x03\x44\x03\x45\x03'
+	b'\xb5\x03\x9b\x03\x24\x03\xa8\x03\x72\x03\x10\x03\xb6\x03\xa8\x00\x11\x03\x29'
+	b'\x03\x79\x03\x8b\x03\xeb\x02\x25\x03\x5e\x03\xb7\x03\x3e\x02\x91\x03\x92\x03'
+	b'\x64\x03\x65\x03\x6a\x03\xf5\x03\x33\x03\x87\x03\xee\x03\x56\x03\x9c\x03\x12'
+	b'\x03\x13\x03\xc2\x03\x46\x03\x7f\x03\xe7\x03\xe1\x03\xb3\x03\xe8\x03\x66\x00'
+	b'\xac\x03\xad\x03\x7a\x03\xc5\x03\x14\x03\x85\x02\x51\x03\x2d\x03\x26\x03\xc0'
+	b'\x03\xa1\x00\x15\x03\xd9\x03\x16\x03\x99\x02\x2e\x00\x17\x03\x67\x00\xae\x03'
+	b'\x18\x03\x66\x03\x19\x03\x1a\x03\x98\x03\x4e\x03\x4b\x03\xc9\x03\xd5\x02\x47'
+	b'\x03\xe8\x02\x27\x03\x6b\x03\xf4\x02\xca\x03\xcb\x03\x8d\x03\xfe\x02',
+	# offsets
+	b'\x00\x00\x00\x00\x00\x00\x08\x00\x0b\x00\x0b\x00\x0b\x00\x16\x00\x16\x00\x18'
+	b'\x00\x18\x00\x1a\x00\x1a\x00\x1c\x00\x1c\x00\x1e\x00\x1e\x00\x1e\x00\x1e\x00'
+	b'\x21\x00\x21\x00\x21\x00\x22\x00\x22\x00\x22\x00\x22\x00\x22\x00\x22\x00\x22'
+	b'\x00\x22\x00\x22\x00\x22\x00\x22\x00\x3d\x00\x3e\x00\x3e\x00\x3e\x00\x42\x00'
+	b'\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x43\x00\x5f\x00\x62\x00\x62'
+	b'\x00\x64\x00\x64\x00\x64\x00\x64\x00\x66\x00\x66\x00\x66\x00\x66\x00\x67\x00'
+	b'\x68\x00\x6a\x00\x6e\x00\x70\x00\x73\x00\x73\x00\x77\x00\x77\x00\x77\x00\x77'
+	b'\x00\x77\x00\x80\x00\x84\x00\x84\x00\x88\x00\x88\x00\x88\x00\x8a\x00\x8c\x00'
+	b'\x8c\x00\x8c\x00\x8c\x00\x8c\x00\x8d\x00\x8d\x00\x8d\x00\x8d\x00\x8d\x00\x8d'
+	b'\x00\x98\x00\x98\x00\x98\x00\x98\x00\x98\x00\x98\x00\x98\x00\x98\x00\x98\x00'
+	b'\x98\x00\x98\x00\x98\x00\x98\x00\xa0\x00\xa2\x00\xa2\x00\xa2\x00\xa3\x00\xa3'
+	b'\x00\xa4\x00\xa5\x00\xa6\x00\xa7\x00\xa7\x00\xa9\x00\xa9\x00\xab\x00\xab\x00'
+	b'\xab\x00\xad\x00\xad\x00\xad\x00\xad\x00\xb0\x00\xb0\x00\xb2\x00\xb2\x00\xb3'
+	b'\x00\xc1\x00\xcf\x00\xcf\x00\xcf\x00\xcf\x00\xcf\x00\xd4\x00\xd4\x00\xd8\x00'
+	b'\xdb\x00\xdb\x00\xdb\x00\xde\x00\xdf\x00\xe3\x00\xeb\x00\xeb\x00\xee\x00\xee'
+	b'\x00\xee\x00\xee\x00\xee\x00\xee\x00\xee\x00\xf3\x00\xf3\x00\xf3\x00\xf3\x00'
+	b'\xf4\x00\x1c\x01\x1e\x01\x20\x01\x20\x01\x20\x01\x25\x01\x25\x01\x28\x01\x2b'
+	b'\x01\x2b\x01\x2b\x01\x2b\x01\x34\x01\x34\x01\x37\x01\x38\x01\x39\x01\x39\x01',
+	# values
+	b'\x1e\x00\xf9\x03\xfa\x03\xfb\x03\xfc\x03\xfd\x03\xfe\x03\xff\x03\x1e\x00\x00'
+	b'\x04\x01\x04\x02\x04\x03\x04\x3d\x00\x60\x00\x54\x00\xb1\x00\x59\x00\x43\x00'
+	b'\x5c\x00\x04\x04\x67\x00\x05\x04\x06\x04\x05\x04\x06\x04\x07\x04\x08\x04\x36'
+	b'\x00\x37\x00\x4c\x00\x66\x00\x29\x02\x61\x00\x1e\x00\x09\x04\x0a\x04\x0b\x04'
+	b'\x0c\x04\x00\x04\x0d\x04\x0e\x04\x0f\x04\x10\x04\x11\x04\x12\x04\x13\x04\x14'
+	b'\x04\x15\x04\x16\x04\x17\x04\x18\x04\x19\x04\x1a\x04\x1b\x04\x1c\x04\x1d\x04'
+	b'\x1e\x04\x1f\x04\x20\x04\x21\x04\x54\x03\x2b\x00\x59\x00\x15\x00\x5c\x00\xf3'
+	b'\x00\x1e\x00\xfe\x03\x22\x04\x23\x04\x24\x04\x25\x04\x26\x04\x27\x04\x28\x04'
+	b'\x29\x04\x2a\x04\x2b\x04\x2c\x04\x2d\x04\x2e\x04\x2f\x04\x30\x04\x31\x04\x32'
+	b'\x04\x33\x04\x34\x04\x35\x04\x36\x04\x37\x04\x38\x04\x39\x04\x3a\x04\x3b\x04'
+	b'\x36\x00\x12\x00\x37\x00\x36\x00\x37\x00\x8c\x03\x2e\x00\xbf\x03\xd3\x03\xef'
+	b'\x00\xf0\x00\x3c\x04\x59\x00\x5c\x00\x3d\x04\x36\x00\x37\x00\x20\x00\x36\x00'
+	b'\x37\x00\x1e\x00\x3e\x04\x3f\x04\xff\x03\x10\x01\x11\x01\x80\x00\x40\x04\x41'
+	b'\x04\x42\x04\x43\x04\x44\x04\x45\x04\x46\x04\xc5\x00\x05\x04\x06\x04\x36\x00'
+	b'\x05\x04\x37\x00\x06\x04\x36\x00\x37\x00\x36\x00\x37\x00\x47\x04\x1e\x00\x48'
+	b'\x04\x49\x04\x4a\x04\x4b\x04\x4c\x04\x4d\x04\x4e\x04\x4f\x04\x50\x04\x51\x04'
+	b'\x1e\x00\x2b\x00\x52\x04\x53\x04\x54\x04\x55\x04\x56\x04\x57\x04\x58\x04\x59'
+	b'\x04\xa8\x00\x29\x03\x79\x03\x8b\x03\xeb\x02\x36\x00\x37\x00\xb6\x00\x15\x00'
+	b'\x5f\x00\x5a\x04\x20\x00\x5b\x04\x15\x00\x36\x00\x37\x00\x9c\x03\x4c\x00\x5c'
+	b'\x04\x5d\x04\x5e\x04\x5f\x04\x60\x04\xe2\x00\x61\x04\x34\x00\x62\x04\xd5\x03'
+	b'\xa1\x00\x63\x04\x64\x04\x4c\x00\x5c\x04\x5d\x04\x5e\x04\x5f\x04\x60\x04\xe2'
+	b'\x00\x61\x04\x34\x00\x62\x04\xd5\x03\xa1\x00\x63\x04\x64\x04\x2b\x00\x7d\x03'
+	b'\x65\x04\x15\x00\x7f\x03\x4f\x03\x52\x03\x66\x04\x67\x04\x20\x00\x05\x04\x06'
+	b'\x04\x20\x00\x05\x04\x06\x04\xc5\x03\x06\x02\xdf\x00\x68\x04\x69\x04\x1e\x00'
+	b'\xc5\x00\x6a\x04\x6b\x04\x6c\x04\x6d\x04\x6e\x04\x6f\x04\xdf\x00\x36\x00\x37'
+	b'\x00\x1e\x00\x70\x04\x71\x04\x72\x04\x73\x04\xae\x03\x1e\x00\xc5\x00\x74\x04'
+	b'\x75\x04\x01\x03\x76\x04\x77\x04\x49\x03\x78\x04\x06\x02\xb7\x00\x79\x04\x5c'
+	b'\x03\x7a\x04\x08\x02\x7b\x04\x7c\x04\x11\x00\x8e\x03\x7d\x04\x7e\x04\xc0\x01'
+	b'\x7f\x04\x80\x04\x81\x04\x82\x04\x83\x04\x12\x02\x84\x04\x85\x04\x2e\x00\x86'
+	b'\x04\x87\x04\x88\x04\x89\x04\x8a\x04\x8b\x04\xed\x03\x8c\x04\x8d\x04\x63\x03'
+	b'\x8e\x04\x07\x04\x08\x04\x3d\x00\x60\x00\x54\x00\x43\x00\x67\x00\x58\x03\x25'
+	b'\x03\x8f\x04\x11\x00\x12\x00\x90\x04\x71\x01\x72\x01\x73\x01\x74\x01\x75\x01'
+	b'\x76\x01\x77\x01\x78\x01\x79\x01\x91\x04\x07\x04\xe5\x02\xf1\x02\x92\x04')
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+#coding: utf8
+#################################### IMPORTS ###################################
+
+# Std Libs
+import sys
+from array import array
+
+################################################################################
+
+def unpack_ids(data):
+    """
+    Decodes string ids packed as little-endian unsigned shorts
+    (see misc/generate-meta.py)
+    """
+    ids = array('H')
+    if hasattr(ids, 'frombytes'):
+        ids.frombytes(data)
+    else:
+        ids.fromstring(data)
+
+    if sys.byteorder != 'little':
+        ids.byteswap()
+
+    return ids
+
+class CompactTable(object):
+    """
+    Read-only mapping of strings to tuples of strings, stored as
+    ids in shared (interned) string table. Row for each key occupies
+    `values[offsets[i]:offsets[i + 1]]` slice. Rows are decoded lazily,
+    on first access
+    """
+    def __init__(self, strings, keys, offsets, values):
+        self._strings = strings
+        self._keys    = unpack_ids(keys)
+        self._offsets = unpack_ids(offsets)
+        self._values  = unpack_ids(values)
+        self._rows    = None
+        self._decoded = {}
+
+    def _row_index(self):
+        if self._rows is None:
+            self._rows = dict( (self._strings[k], i)
+                               for i, k in enumerate(self._keys) )
+        return self._rows
+
+    def _decode(self, i):
+        s = self._strings
+        start, end = self._offsets[i], self._offsets[i + 1]
+        return tuple(s[v] for v in self._values[start:end])
+
+    def get(self, key, default=None):
+        if key in self._decoded:
+            return self._decoded[key]
+
+        i = self._row_index().get(key)
+        if i is None:
+            return default
+
+        row = self._decoded[key] = self._decode(i)
+        return row
+
+    def __getitem__(self, key):
+        row = self.get(key)
+        if row is None:
+            raise KeyError(key)
+        return row
+
+    def __contains__(self, key):
+        return key in self._row_index()
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __iter__(self):
+        return (self._strings[k] for k in self._keys)
+
+    def keys(self):
+        return list(self)
+
+    def items(self):
+        return [(k, self[k]) for k in self]
@@ -4,19 +4,26 @@
 
 # Std Libs
 import re
+import sys
 
 # Sublime Libs
 import sublime
 import sublime_plugin
 
-from collections import defaultdict
-
 ################################### CONSTANTS ##################################
 
 # Directions for tracker
 BACK         =  -1
 FORWARD      =   1
 
+# Initial size of text chunk, fetched from view by regex conditions.
+# Chunk size is doubled on each fetch, up to MAX_CHUNK_SIZE
+CHUNK_SIZE     = 256
+MAX_CHUNK_SIZE = 65536
+
+if sys.version_info[0] > 2:
+    xrange = range
+
 ###################### VIEW TRACKERS ( CONTEXT SCANNERS ) ######################
 
 def pt_range(view, start_pt, direction):
@@ -24,43 +31,116 @@ def pt_range(view, start_pt, direction):
     if end_pt != -1: end_pt = view.size()
     return xrange(start_pt, end_pt, direction)
 
-def region_from_pt_list(l):
-    if l:
-        l = sorted(l)
-        return sublime.Region(l[0], l[-1]+1)
+def run_length(view, start_pt, direction, condition):
+    """
+    Returns number of consecutive points, starting from `start_pt` in
+    given direction, that satisfy condition
+    """
+    if hasattr(condition, 'run_length'):
+        return condition.run_length(view, start_pt, direction)
+
+    n = 0
+    for pt in pt_range(view, start_pt, direction):
+        if not condition(view, pt): break
+        n += 1
+    return n
+
+def track(view, start_pt, *stages):
+    """
+    Tracking pipeline: each stage is a `(direction, condition)` pair
+    that consumes points, satisfying condition, starting from the point
+    where previous stage stopped. Lazily yields region, consumed by each
+    stage. If stage doesn't consume any point, yields `None` and stops
+    """
+    size = view.size()
+
+    for direction, condition in stages:
+        if start_pt < 0 or start_pt >= size:
+            # nothing to track
+            continue
+
+        n = run_length(view, start_pt, direction, condition)
+        if not n:
+            yield None
+            return
+
+        if direction == BACK:
+            yield sublime.Region(start_pt - n + 1, start_pt + 1)
+        else:
+            yield sublime.Region(start_pt, start_pt + n)
+
+        start_pt += n * direction
+
+def back_stages(*conds):
+    return [(BACK, c) for c in conds]
 
 def view_tracker(view, start_pt, *conds):
-    pts = defaultdict(list)
-    failed = False
+    return list(track(view, start_pt, *conds))
+
+def tracker_success(regions):
+    return all(r is not None for r in regions)
 
-    for i, (direction, condition) in enumerate(conds):
-        for pt in pt_range(view, start_pt, direction):
-            if failed: break
+def back_track(view, start_pt, *conds):
+    return view_tracker(view, start_pt -1, *back_stages(*conds))
+
+def last_region(view, start_pt, *stages):
+    """
+    Runs tracking pipeline and returns region of the last stage or
+    `None` if any stage didn't consume any point
+    """
+    region = None
+    for region in track(view, start_pt, *stages):
+        if region is None: break
+    return region
 
-            if not condition(view, pt):
-                if not pts[i]: failed = True
-                start_pt = pt
-                break
+################################### TRACKERS ###################################
 
-            if len(pts[i]) < 2:
-                pts[i].append(pt)
+class RegexCondition(object):
+    """
+    Tests if character at given point matches (or doesn't match if `cond`
+    is False) regexp `r`, which should describe a single character.
+    When used in tracker, view text is fetched in chunks and whole run
+    of matching characters is found with single compiled regexp
+    """
+    def __init__(self, r, cond=True):
+        self.regex = re.compile(r)
+        self.cond  = cond
+        self._run  = re.compile(r'(?:(?%s(?:%s))[\s\S])*' % (cond and '=' or '!', r))
+
+    def __call__(self, view, pt):
+        return bool(self.regex.match(view.substr(pt))) is self.cond
+
+    def run_length(self, view, start_pt, direction):
+        n, size, chunk = 0, view.size(), CHUNK_SIZE
+
+        while True:
+            if direction == BACK:
+                end   = start_pt - n + 1
+                begin = max(0, end - chunk)
             else:
-                pts[i][-1] = pt
+                begin = start_pt + n
+                end   = min(size, begin + chunk)
 
-    return [ region_from_pt_list(pt_list) for pt_list in pts.values() ]
+            if begin < 0 or begin >= end:
+                break
 
-def tracker_success(regions):
-    return all(r is not None for r in regions)
+            text = view.substr(sublime.Region(begin, end))
+            if direction == BACK:
+                text = text[::-1]
 
-def back_track(view, start_pt, *conds):
-    return view_tracker(view, start_pt -1, *((BACK, c) for c in conds))
+            matched = self._run.match(text).end()
+            n += matched
+            if matched < len(text):
+                break
 
-################################### TRACKERS ###################################
+            chunk = min(chunk * 2, MAX_CHUNK_SIZE)
+
+        return n
 
 def track_regex(r, cond=True):
-    return lambda v, p: bool(re.match(r, v.substr(p))) is cond
+    return RegexCondition(r, cond)
 
 def track_scope(s, cond=True):
     return lambda v, p: bool(v.match_selector(p, s)) is cond
 
-################################################################################
\ No newline at end of file
+################################################################################
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+#coding: utf8
+################################################################################
+
+class PrefixTrie(object):
+    """
+    Case-insensitive prefix tree of items. Every node holds a list of
+    all items under it, so lookup for a prefix costs O(len(prefix))
+    and returns a pre-built list without any allocations
+    """
+    def __init__(self, items=()):
+        self._root = {None: []}
+        for word, item in items:
+            self.add(word, item)
+
+    def add(self, word, item):
+        node = self._root
+        node[None].append(item)
+        for ch in word.lower():
+            if ch not in node:
+                node[ch] = {None: []}
+            node = node[ch]
+            node[None].append(item)
+
+    def find(self, prefix=''):
+        "Returns list of items for given prefix. Do not modify it"
+        node = self._root
+        for ch in (prefix or '').lower():
+            node = node.get(ch)
+            if node is None:
+                return []
+        return node[None]
+
+class CompletionIndex(object):
+    """
+    Prefix index of completions for each key of completion table
+    (like `HTML_ELEMENTS_ATTRIBUTES`). Completions are formatted with
+    `formatter` function once per key, when key is queried first time
+    """
+    def __init__(self, table, formatter):
+        self._table     = table
+        self._formatter = formatter
+        self._tries     = {}
+
+    def complete(self, key, prefix=''):
+        trie = self._tries.get(key)
+        if trie is None:
+            fmt  = self._formatter
+            trie = self._tries[key] = PrefixTrie(
+                (v, fmt(v)) for v in self._table.get(key, ()) )
+        return trie.find(prefix)
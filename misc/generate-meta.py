@@ -0,0 +1,84 @@
+# Generates emmet_completions/meta.py from completions-meta.json:
+# completion tables are stored as ids in shared string table,
+# packed into byte strings, so they are cheap to import
+import os.path
+import json
+import struct
+from collections import OrderedDict
+
+_dir = os.path.dirname(os.path.abspath(__file__))
+
+source_path = os.path.join(_dir, 'completions-meta.json')
+dest_path = os.path.join(_dir, '..', 'emmet_completions', 'meta.py')
+
+# list of tables that should be stored in compact form
+tables = ['CSS_PROP_VALUES', 'HTML_ELEMENTS_ATTRIBUTES', 'HTML_ATTRIBUTES_VALUES']
+
+header = """# coding=utf-8
+# DO NOT EDIT: generated by misc/generate-meta.py from misc/completions-meta.json
+from tables import CompactTable
+
+"""
+
+def pack_ids(ids):
+	return struct.pack('<%dH' % len(ids), *ids)
+
+def bytes_literal(data, indent='\t', width=76):
+	"Returns Python source of bytes literal, split into lines"
+	lines = []
+	chunk = ''
+	for b in bytearray(data):
+		ch = '\\x%02x' % b
+		if len(chunk) + len(ch) > width:
+			lines.append(chunk)
+			chunk = ''
+		chunk += ch
+
+	lines.append(chunk)
+	return '\n'.join("%sb'%s'" % (indent, l) for l in lines)
+
+def generate_meta_file(source, dest):
+	print('Generate %s' % dest)
+	with open(source) as f:
+		data = json.load(f, object_pairs_hook=OrderedDict)
+
+	# build interned string table
+	strings = []
+	string_ids = {}
+	def sid(s):
+		if s not in string_ids:
+			string_ids[s] = len(strings)
+			strings.append(s)
+		return string_ids[s]
+
+	packed = []
+	for name in tables:
+		keys = []
+		offsets = [0]
+		values = []
+		for k in sorted(data[name]):
+			keys.append(sid(k))
+			values.extend(sid(v) for v in data[name][k])
+			offsets.append(len(values))
+		packed.append((name, keys, offsets, values))
+
+	if len(strings) > 0xFFFF:
+		raise ValueError('Too many strings in completion tables')
+
+	out = [header]
+	for k, v in data.items():
+		if k not in tables:
+			out.append('%s = %s\n\n' % (k, json.dumps(v, indent=1)))
+
+	out.append('STRINGS = (\n%s)\n\n' % ''.join('\t%s,\n' % json.dumps(s) for s in strings))
+
+	for name, keys, offsets, values in packed:
+		out.append('%s = CompactTable(STRINGS,\n' % name)
+		out.append('\t# keys\n%s,\n' % bytes_literal(pack_ids(keys)))
+		out.append('\t# offsets\n%s,\n' % bytes_literal(pack_ids(offsets)))
+		out.append('\t# values\n%s)\n\n' % bytes_literal(pack_ids(values)))
+
+	with open(dest, 'w') as f:
+		f.write(''.join(out).rstrip() + '\n')
+
+generate_meta_file(source_path, os.path.abspath(dest_path))
@@ -0,0 +1,163 @@
+# coding=utf-8
+"""
+Checks HTTP client of remote assets against local HTTP server:
+revalidation of cached data and `Range` requests
+"""
+import os.path
+import re
+import sys
+import shutil
+import tempfile
+import threading
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'emmet'))
+
+import httpcache
+
+if httpcache.is_python3:
+	from http.server import BaseHTTPRequestHandler, HTTPServer
+	from socketserver import ThreadingMixIn
+else:
+	from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+	from SocketServer import ThreadingMixIn
+
+class Resource(object):
+	def __init__(self, data, etag=None):
+		self.data = data
+		self.etag = etag
+
+class Handler(BaseHTTPRequestHandler):
+	protocol_version = 'HTTP/1.1'
+
+	def log_message(self, *args):
+		pass
+
+	def do_GET(self):
+		server = self.server
+		res = server.resources[self.path]
+		headers = dict((k.lower(), v) for k, v in self.headers.items())
+		server.requests.append(headers)
+
+		if res.etag and headers.get('if-none-match') == res.etag:
+			return self.respond(304, b'')
+
+		m = re.match(r'bytes=(\d+)-(\d*)$', headers.get('range', ''))
+		if_range = headers.get('if-range')
+		if m and (if_range is None or if_range == res.etag):
+			start = int(m.group(1))
+			end = min(int(m.group(2) or len(res.data) - 1), len(res.data) - 1)
+			if start >= len(res.data):
+				return self.respond(416, b'', {'Content-Range': 'bytes */%d' % len(res.data)})
+
+			return self.respond(206, res.data[start:end + 1], {
+				'Content-Range': 'bytes %d-%d/%d' % (start, end, len(res.data))
+			})
+
+		self.respond(200, res.data)
+
+	def respond(self, status, body, headers={}):
+		res = self.server.resources[self.path]
+		self.send_response(status)
+		if res.etag:
+			self.send_header('ETag', res.etag)
+		for k, v in headers.items():
+			self.send_header(k, v)
+		self.send_header('Content-Length', str(len(body)))
+		self.end_headers()
+		self.wfile.write(body)
+
+class Server(ThreadingMixIn, HTTPServer):
+	daemon_threads = True
+
+class HTTPClientTest(unittest.TestCase):
+	def setUp(self):
+		self.server = Server(('127.0.0.1', 0), Handler)
+		self.server.resources = {}
+		self.server.requests = []
+		t = threading.Thread(target=self.server.serve_forever)
+		t.daemon = True
+		t.start()
+		self.client = httpcache.HTTPClient(max_age=0)
+
+	def tearDown(self):
+		self.client.pool.close()
+		self.server.shutdown()
+		self.server.server_close()
+
+	def url(self, path, data, etag=None):
+		self.server.resources[path] = Resource(data, etag)
+		return 'http://127.0.0.1:%d%s' % (self.server.server_address[1], path)
+
+	def test_revalidation(self):
+		data = os.urandom(1000)
+		url = self.url('/image.png', data, '"v1"')
+		self.assertEqual(self.client.read(url), data)
+		self.assertEqual(self.client.read(url), data)
+
+		requests = self.server.requests
+		self.assertEqual(len(requests), 2)
+		self.assertEqual(requests[1].get('if-none-match'), '"v1"')
+
+	def test_range_append(self):
+		data = os.urandom(1000)
+		url = self.url('/image.png', data, '"v1"')
+		self.assertEqual(self.client.read(url, 0, 100), data[:100])
+		self.assertEqual(self.client.read(url, 0, 300), data[:300])
+
+		requests = self.server.requests
+		self.assertEqual(requests[0].get('range'), 'bytes=0-99')
+		self.assertEqual(requests[-1].get('range'), 'bytes=100-299')
+		self.assertEqual(requests[-1].get('if-range'), '"v1"')
+
+	def test_range_of_modified_resource(self):
+		url = self.url('/image.png', b'a' * 1000, '"v1"')
+		self.assertEqual(self.client.read(url, 0, 100), b'a' * 100)
+
+		# validated, but modified before the next range request
+		self.client.max_age = 60
+		self.server.resources['/image.png'] = Resource(b'b' * 1000, '"v2"')
+		self.assertEqual(self.client.read(url, 0, 300), b'b' * 300)
+		self.assertEqual(self.client.cache.get(url).etag, '"v2"')
+
+	def test_range_without_validator(self):
+		url = self.url('/image.png', b'a' * 1000)
+		self.assertEqual(self.client.read(url, 0, 100), b'a' * 100)
+
+		self.client.max_age = 60
+		self.server.resources['/image.png'] = Resource(b'b' * 1000)
+		self.assertEqual(self.client.read(url, 0, 300), b'b' * 300)
+		self.assertEqual(self.server.requests[-1].get('range'), 'bytes=0-299')
+
+class ResponseCacheTest(unittest.TestCase):
+	def setUp(self):
+		self.dir = tempfile.mkdtemp()
+		self.max_size = httpcache.MAX_CACHE_DIR_SIZE
+
+	def tearDown(self):
+		httpcache.MAX_CACHE_DIR_SIZE = self.max_size
+		shutil.rmtree(self.dir, True)
+
+	def put(self, url, used):
+		httpcache.ResponseCache(self.dir).put(httpcache.CacheEntry(url, b'x' * 1000, '"v1"'))
+		meta = httpcache.ResponseCache(self.dir)._file_path(url, '.json')
+		os.utime(meta, (used, used))
+
+	def test_prune(self):
+		httpcache.MAX_CACHE_DIR_SIZE = 3500
+		self.put('http://localhost/a.png', 1000)
+		self.put('http://localhost/b.png', 2000)
+		self.put('http://localhost/c.png', 3000)
+
+		# reading entry from disk marks it as recently used
+		self.assertTrue(httpcache.ResponseCache(self.dir).get('http://localhost/a.png'))
+		self.put('http://localhost/d.png', 4000)
+
+		cache = httpcache.ResponseCache(self.dir)
+		self.assertTrue(cache.get('http://localhost/a.png'))
+		self.assertEqual(cache.get('http://localhost/b.png'), None)
+		self.assertTrue(cache.get('http://localhost/c.png'))
+		self.assertTrue(cache.get('http://localhost/d.png'))
+
+if __name__ == '__main__':
+	unittest.main()
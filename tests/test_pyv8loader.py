@@ -0,0 +1,158 @@
+# coding=utf-8
+"""
+Checks PyV8 binary download against local HTTP server: resume of
+interrupted downloads and verification of downloaded package
+"""
+import os
+import os.path
+import re
+import sys
+import json
+import shutil
+import tempfile
+import threading
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'emmet'))
+
+import pyv8loader
+
+if pyv8loader.is_python3:
+	from http.server import BaseHTTPRequestHandler, HTTPServer
+	from socketserver import ThreadingMixIn
+else:
+	from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+	from SocketServer import ThreadingMixIn
+
+class Handler(BaseHTTPRequestHandler):
+	def log_message(self, *args):
+		pass
+
+	def do_GET(self):
+		server = self.server
+		data = server.resources[self.path]
+		rng = self.headers.get('Range')
+		server.requests.append((self.path, rng))
+
+		m = rng and re.match(r'bytes=(\d+)-$', rng)
+		if m:
+			start = int(m.group(1))
+			if start >= len(data):
+				self.send_response(416)
+				self.send_header('Content-Range', 'bytes */%d' % len(data))
+				self.send_header('Content-Length', '0')
+				self.end_headers()
+				return
+
+			body = data[start:]
+			self.send_response(206)
+			self.send_header('Content-Range', 'bytes %d-%d/%d' % (start, len(data) - 1, len(data)))
+		else:
+			body = data
+			self.send_response(200)
+
+		self.send_header('Content-Length', str(len(body)))
+		self.end_headers()
+
+		if server.cut_connections:
+			# send half of data, then drop connection
+			server.cut_connections -= 1
+			body = body[:len(body) // 2]
+
+		self.wfile.write(body)
+
+class Server(ThreadingMixIn, HTTPServer):
+	daemon_threads = True
+
+class DownloadTest(unittest.TestCase):
+	def setUp(self):
+		self.server = Server(('127.0.0.1', 0), Handler)
+		self.server.resources = {}
+		self.server.requests = []
+		self.server.cut_connections = 0
+		t = threading.Thread(target=self.server.serve_forever)
+		t.daemon = True
+		t.start()
+		self.dir = tempfile.mkdtemp()
+		self.data = os.urandom(200000)
+
+	def tearDown(self):
+		self.server.shutdown()
+		self.server.server_close()
+		shutil.rmtree(self.dir, True)
+
+	def url(self, path, data):
+		self.server.resources[path] = data
+		return 'http://127.0.0.1:%d%s' % (self.server.server_address[1], path)
+
+	def read(self, path):
+		with open(path, 'rb') as fd:
+			return fd.read()
+
+	def downloader(self, name):
+		if name == 'curl':
+			try:
+				return pyv8loader.CurlDownloader({})
+			except pyv8loader.BinaryNotFoundError:
+				self.skipTest('curl is not available')
+
+		return pyv8loader.UrlLib2Downloader({})
+
+	def check_resume(self, name):
+		url = self.url('/pack.zip', self.data)
+		dest = os.path.join(self.dir, 'pack.part')
+		self.server.cut_connections = 1
+
+		self.assertTrue(self.downloader(name).download(url, 'Error', 5, 3, dest=dest))
+		self.assertEqual(self.read(dest), self.data)
+		self.assertEqual(self.server.requests, [
+			('/pack.zip', None),
+			('/pack.zip', 'bytes=%d-' % (len(self.data) // 2))
+		])
+
+	def check_complete(self, name):
+		url = self.url('/pack.zip', self.data)
+		dest = os.path.join(self.dir, 'pack.part')
+		with open(dest, 'wb') as fd:
+			fd.write(self.data)
+
+		self.assertTrue(self.downloader(name).download(url, 'Error', 5, 3, dest=dest))
+		self.assertEqual(self.read(dest), self.data)
+		self.assertEqual(self.server.requests, [('/pack.zip', 'bytes=%d-' % len(self.data))])
+
+	def test_urllib_resume(self):
+		self.check_resume('urllib')
+
+	def test_curl_resume(self):
+		self.check_resume('curl')
+
+	def test_urllib_complete(self):
+		self.check_complete('urllib')
+
+	def test_curl_complete(self):
+		self.check_complete('curl')
+
+	def restore_urls(self, packages_url, binary_url):
+		pyv8loader.PACKAGES_URL = packages_url
+		pyv8loader.BINARY_URL = binary_url
+		pyv8loader.packages_cache = None
+
+	def test_corrupted_package(self):
+		name = 'pyv8-test.zip'
+		packages = json.dumps([{'name': name, 'sha': '0' * 40}]).encode('utf-8')
+		urls = (pyv8loader.PACKAGES_URL, pyv8loader.BINARY_URL)
+		pyv8loader.PACKAGES_URL = self.url('/contents', packages)
+		pyv8loader.BINARY_URL = self.url('/' + name, self.data).replace(name, '%s')
+		pyv8loader.packages_cache = None
+		self.addCleanup(self.restore_urls, *urls)
+
+		loader = pyv8loader.PyV8Loader('test', self.dir, pyv8loader.get_loader_config(self.dir))
+		loader.start()
+		loader.join(30)
+
+		self.assertEqual(loader.exit_code, 5)
+		self.assertEqual(loader.result, None)
+		self.assertFalse([f for f in os.listdir(self.dir) if f.endswith('.part') or f == 'pack.zip'])
+
+if __name__ == '__main__':
+	unittest.main()